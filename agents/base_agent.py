@@ -1,6 +1,6 @@
 """Base agent interface for AI assistance."""
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 
 
 class BaseAgent(ABC):
@@ -26,6 +26,28 @@ class BaseAgent(ABC):
         """
         pass
     
+    def stream(
+        self,
+        query: str,
+        context: Dict[str, Any],
+        chat_history: List[Dict[str, str]] = None
+    ) -> Iterator[str]:
+        """
+        Generate an AI response as a stream of text chunks.
+        
+        Agents without native streaming yield the full response from
+        generate() as a single chunk.
+        
+        Args:
+            query: User's question or request
+            context: Current demand data and tab information
+            chat_history: Previous conversation messages
+            
+        Yields:
+            Response text chunks
+        """
+        yield self.generate(query, context, chat_history)
+    
     @abstractmethod
     def suggest_stories(self, goals: str, context: Dict[str, Any]) -> List[str]:
         """
@@ -1,8 +1,9 @@
 """Google Gemini AI agent with RAG capabilities."""
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 import json
 from datetime import datetime
+from itertools import islice
 
 try:
     from google import genai
@@ -49,6 +50,38 @@ class GeminiAgent(BaseAgent):
             max_output_tokens=2048,
             thinking_config=types.ThinkingConfig(thinking_budget=0)  # Disable thinking for speed
         )
+        
+        # (historical_demands_hash, prompt lines) from the last prompt build
+        self._historical_section = None
+    
+    def _build_historical_section(self, historical_demands: List[Dict[str, Any]]) -> List[str]:
+        """
+        Build the system-wide statistics section of the context prompt.
+        
+        Args:
+            historical_demands: Summaries of all stored demands
+            
+        Returns:
+            Prompt lines
+        """
+        if not historical_demands:
+            return []
+        
+        statuses = {}
+        for demand in historical_demands:
+            status = demand.get('status', 'Unknown')
+            statuses[status] = statuses.get(status, 0) + 1
+        
+        lines = [
+            f"**Total Demands in System**: {len(historical_demands)}",
+            f"**Demand Status Breakdown**: {', '.join([f'{k}: {v}' for k, v in statuses.items()])}",
+            "",
+            "**Recent Demands** (last 5):"
+        ]
+        for demand in historical_demands[-5:]:
+            lines.append(f"- {demand.get('demand_id', 'N/A')}: {demand.get('title', 'Untitled')} ({demand.get('status', 'Unknown')}) - {demand.get('progress_percentage', 0)}% complete")
+        lines.append("")
+        return lines
     
     def _build_context_prompt(self, context: Dict[str, Any]) -> str:
         """
@@ -74,24 +107,15 @@ class GeminiAgent(BaseAgent):
             ""
         ]
         
-        # Add system statistics
-        historical_demands = context.get("historical_demands", [])
-        if historical_demands:
-            total_demands = len(historical_demands)
-            statuses = {}
-            for demand in historical_demands:
-                status = demand.get('status', 'Unknown')
-                statuses[status] = statuses.get(status, 0) + 1
-            
-            prompt_parts.append(f"**Total Demands in System**: {total_demands}")
-            prompt_parts.append(f"**Demand Status Breakdown**: {', '.join([f'{k}: {v}' for k, v in statuses.items()])}")
-            prompt_parts.append("")
-            
-            # Show recent demands
-            prompt_parts.append("**Recent Demands** (last 5):")
-            for demand in historical_demands[-5:]:
-                prompt_parts.append(f"- {demand.get('demand_id', 'N/A')}: {demand.get('title', 'Untitled')} ({demand.get('status', 'Unknown')}) - {demand.get('progress_percentage', 0)}% complete")
-            prompt_parts.append("")
+        # Add system statistics, reusing the last build while the demand list is unchanged
+        historical_hash = context.get("historical_demands_hash")
+        cached = self._historical_section
+        if historical_hash is not None and cached is not None and cached[0] == historical_hash:
+            historical_lines = cached[1]
+        else:
+            historical_lines = self._build_historical_section(context.get("historical_demands", []))
+            self._historical_section = (historical_hash, historical_lines)
+        prompt_parts.extend(historical_lines)
         
         prompt_parts.extend([
             "## Current Demand Information:",
@@ -169,7 +193,7 @@ class GeminiAgent(BaseAgent):
             tasks = build.get("tasks", [])
             if tasks:
                 prompt_parts.append(f"- Tasks: {len(tasks)} defined")
-                for task in tasks[:3]:
+                for task in islice(tasks, 3):
                     prompt_parts.append(f"  - {task}")
             
             if build.get("jira_epic_id"):
@@ -253,6 +277,38 @@ class GeminiAgent(BaseAgent):
         except Exception as e:
             return f"❌ Error generating response: {str(e)}\n\nPlease check your API key and try again."
     
+    def stream(
+        self,
+        query: str,
+        context: Dict[str, Any],
+        chat_history: List[Dict[str, str]] = None
+    ) -> Iterator[str]:
+        """
+        Stream an AI response from Gemini as it is generated.
+        
+        Args:
+            query: User's question or request
+            context: Current demand data and historical context
+            chat_history: Previous conversation messages
+            
+        Yields:
+            Response text chunks
+        """
+        try:
+            context_prompt = self._build_context_prompt(context)
+            full_prompt = f"{context_prompt}\n**User Query**: {query}"
+            
+            for chunk in self.client.models.generate_content_stream(
+                model=self.model_name,
+                contents=full_prompt,
+                config=self.config
+            ):
+                if chunk.text:
+                    yield chunk.text
+                    
+        except Exception as e:
+            yield f"❌ Error generating response: {str(e)}\n\nPlease check your API key and try again."
+    
     def suggest_stories(self, goals: str, context: Dict[str, Any]) -> List[str]:
         """
         Generate user story suggestions using Gemini.
@@ -5,20 +5,25 @@ Built for Salling Group to centralize documentation, stakeholder inputs, and art
 """
 
 import streamlit as st
+import gc
 import uuid
 import os
 import random
 from datetime import datetime
 import json
 import html
-from typing import Dict, Any, List, Optional
+import hashlib
+import io
+from collections import Counter
+from typing import Callable, Dict, Any, List, Optional
+import pandas as pd
 from dotenv import load_dotenv
+from PIL import Image
 
 # Load environment variables
 load_dotenv()
 
 # Import local modules
-from utils.document_reader import DocumentReader, get_attachment_content
 from utils.gantt_chart import render_gantt_tab
 from components.jira_test_ui import (
     render_jira_test_setup,
@@ -26,6 +31,7 @@ from components.jira_test_ui import (
     render_test_plan_generator
 )
 from components.ai_chat import render_ai_chat
+from components.phase_forms import PHASE_FORMS, render_phase_form
 from models.demand import (
     Demand, IdeationTab, RequirementsTab, AssessmentTab, DesignTab,
     BuildTab, ValidationTab, DeploymentTab, ImplementationTab, ClosingTab,
@@ -41,10 +47,61 @@ except ImportError:
 from integrations.jira_client import MockJiraClient
 from integrations.confluence_client import MockConfluenceClient
 from utils.progress import calculate_progress, is_tab_complete, get_completion_details
-from utils.export import export_to_json, export_to_markdown, generate_pdf_content
+from utils.export import export_to_json_bytes, export_to_markdown, generate_pdf_content
 from utils.validation import sanitize_html, validate_session_ttl, validate_input_length
 from utils.logging_config import setup_logging, StructuredLogger
 from utils.storage import get_storage
+from utils import json_utils
+from utils.background import get_executor
+from utils.attachment_cache import cached_attachment_content
+from utils.audit import describe_changes, set_audit_handler
+from utils.widget_state import PHASES, reset_widget_state
+from utils.retention import (
+    bounded, tail, prune_audit_log,
+    MAX_BUILD_TASKS, MAX_BUG_LOG_ENTRIES, MAX_AUDIT_ENTRIES, MAX_CHAT_MESSAGES
+)
+
+# Gen-0 allocation threshold used when DISABLE_AUTO_GC is set (default 700)
+GC_GEN0_THRESHOLD = 50_000
+
+
+@st.cache_resource(show_spinner=False)
+def _relax_gc() -> None:
+    """
+    Make automatic garbage collection rarer for the whole server process.
+    
+    Runs once per process (app.py itself re-executes on every rerun). The
+    objects built at startup are moved out of the collected generations with
+    gc.freeze(), and gen-0 collections run every GC_GEN0_THRESHOLD
+    allocations instead of 700. Automatic GC stays on, so fragment reruns
+    (autosave, chat, phase tabs) never depend on a full script run to
+    reclaim cyclic garbage.
+    """
+    gc.freeze()
+    _, gen1, gen2 = gc.get_threshold()
+    gc.set_threshold(GC_GEN0_THRESHOLD, gen1, gen2)
+
+
+if os.getenv("DISABLE_AUTO_GC", "false").lower() == "true":
+    _relax_gc()
+
+# Selectbox options (built once, not on every rerun)
+_POWER_INTEREST_OPTIONS = tuple(e.value for e in PowerInterest)
+_BUG_SEVERITY_OPTIONS = tuple(e.value for e in RiskSeverity)
+_BUG_STATUS_OPTIONS = ("Open", "In Progress", "Fixed", "Closed")
+_STATUS_FILTER_OPTIONS = ("All", "Draft", "In Progress", "Under Review", "Approved", "Rejected", "On Hold", "Completed", "Cancelled")
+
+# Demand status icons for the overview
+_STATUS_ICONS = {
+    'Draft': '🔵',
+    'In Progress': '🟡',
+    'Under Review': '🟠',
+    'Approved': '🟢',
+    'Rejected': '🔴',
+    'On Hold': '⚪',
+    'Completed': '✅',
+    'Cancelled': '⚫'
+}
 
 # Page configuration
 st.set_page_config(
@@ -320,8 +377,8 @@ def initialize_session_state():
         st.session_state.requirements = {"stakeholders": []}
         st.session_state.assessment = {}
         st.session_state.design = {"wireframes_paths": []}
-        st.session_state.build = {"tasks": [], "jira_story_ids": []}
-        st.session_state.validation = {"bug_log": []}
+        st.session_state.build = {"tasks": bounded([], MAX_BUILD_TASKS), "jira_story_ids": []}
+        st.session_state.validation = {"bug_log": bounded([], MAX_BUG_LOG_ENTRIES)}
         st.session_state.deployment = {"training_materials": []}
         st.session_state.implementation = {"success_metrics": {}}
         st.session_state.closing = {"sign_offs": {}}
@@ -340,8 +397,8 @@ def initialize_session_state():
         }
         
         # Chat and audit
-        st.session_state.chat_history = []
-        st.session_state.audit_log = []
+        st.session_state.chat_history = bounded([], MAX_CHAT_MESSAGES)
+        st.session_state.audit_log = bounded([], MAX_AUDIT_ENTRIES)
         
         # Progress
         st.session_state.progress_percentage = 0
@@ -395,10 +452,35 @@ def add_audit_entry(action: str, tab_name: Optional[str] = None, field_name: Opt
         "field_name": field_name
     }
     st.session_state.audit_log.append(entry)
+    prune_audit_log(st.session_state.audit_log)
     st.session_state.last_modified = datetime.now()
     
-    # Auto-save after each change
+    # Auto-save is batched: the autosave fragment writes pending changes
+    st.session_state.save_pending = True
+
+
+set_audit_handler(add_audit_entry)
+
+
+def flush_pending_save() -> bool:
+    """
+    Save the current demand if changes are waiting to be written.
+    
+    Returns:
+        True if the demand was saved
+    """
+    if not st.session_state.get("save_pending"):
+        return False
+    
+    st.session_state.save_pending = False
     save_current_demand()
+    return True
+
+
+@st.fragment(run_every=float(os.getenv("AUTOSAVE_INTERVAL_SECONDS", "5")))
+def render_autosave():
+    """Flush batched changes to storage every few seconds."""
+    flush_pending_save()
 
 
 def save_current_demand():
@@ -432,6 +514,17 @@ def save_current_demand():
     st.session_state.storage_stats = st.session_state.storage.get_statistics()
 
 
+def _apply_retention_limits():
+    """Convert loaded task, bug, audit and chat lists into bounded ring buffers."""
+    if "tasks" in st.session_state.build:
+        st.session_state.build["tasks"] = bounded(st.session_state.build["tasks"], MAX_BUILD_TASKS)
+    if "bug_log" in st.session_state.validation:
+        st.session_state.validation["bug_log"] = bounded(st.session_state.validation["bug_log"], MAX_BUG_LOG_ENTRIES)
+    st.session_state.audit_log = bounded(st.session_state.audit_log, MAX_AUDIT_ENTRIES)
+    prune_audit_log(st.session_state.audit_log)
+    st.session_state.chat_history = bounded(st.session_state.chat_history, MAX_CHAT_MESSAGES)
+
+
 def load_demand_by_id(demand_id: str):
     """Load an existing demand by ID into session state."""
     try:
@@ -473,6 +566,7 @@ def load_demand_by_id(demand_id: str):
                 'chat_history': st.session_state.chat_history,
             }
             st.session_state.storage.save_demand(current_demand_data)
+            st.session_state.save_pending = False
         
         # Load the new demand
         demand_data = st.session_state.storage.load_demand(demand_id)
@@ -517,6 +611,8 @@ def load_demand_by_id(demand_id: str):
             })
             st.session_state.audit_log = demand_data.get('audit_log', [])
             st.session_state.chat_history = demand_data.get('chat_history', [])
+            _apply_retention_limits()
+            reset_widget_state()
             
             # Refresh historical demands
             st.session_state.historical_demands = st.session_state.storage.get_all_demands_summary()
@@ -577,6 +673,7 @@ def create_new_demand():
                 'chat_history': st.session_state.chat_history,
             }
             st.session_state.storage.save_demand(current_demand_data)
+            st.session_state.save_pending = False
         
         # Generate new demand ID
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
@@ -611,8 +708,9 @@ def create_new_demand():
             "implementation": {"files": [], "urls": []},
             "closing": {"files": [], "urls": []}
         }
-        st.session_state.audit_log = []
-        st.session_state.chat_history = []
+        st.session_state.audit_log = bounded([], MAX_AUDIT_ENTRIES)
+        st.session_state.chat_history = bounded([], MAX_CHAT_MESSAGES)
+        reset_widget_state()
         
         # Save the new empty demand
         new_demand_data = {
@@ -651,20 +749,59 @@ def create_new_demand():
         return None
 
 
-def update_progress():
-    """Update overall progress based on tab completion."""
-    tabs_data = {
-        "ideation": st.session_state.ideation,
-        "requirements": st.session_state.requirements,
-        "assessment": st.session_state.assessment,
-        "design": st.session_state.design,
-        "build": st.session_state.build,
-        "validation": st.session_state.validation,
-        "deployment": st.session_state.deployment,
-        "implementation": st.session_state.implementation,
-        "closing": st.session_state.closing
-    }
-    st.session_state.progress_percentage = calculate_progress(tabs_data)
+def _save_phase_form(phase: str, values: Dict[str, Any]):
+    """Persist a submitted phase form; audit and refresh progress only if something changed."""
+    form = PHASE_FORMS[phase]
+    
+    # Demand name/number live at the top level of session state, not in the phase dict
+    top_level = {spec.name: values.pop(spec.name) for spec in form.fields() if spec.top_level}
+    header_changed = [name for name, value in top_level.items() if st.session_state.get(name) != value]
+    for name in header_changed:
+        st.session_state[name] = top_level[name]
+    
+    changed_fields = header_changed + _update_phase(phase, values)
+    if changed_fields:
+        # A single changed field goes in field_name; a list only fits in the action
+        field_name = changed_fields[0] if len(changed_fields) == 1 else None
+        add_audit_entry(describe_changes(f"Updated {phase} data", changed_fields), phase, field_name)
+        progress_changed = update_progress()
+        st.success(form.success_message)
+        if progress_changed or header_changed:
+            st.rerun(scope="app")  # Refresh the header progress bar and demand name
+    else:
+        st.info("No changes to save")
+
+
+def _update_phase(phase: str, values: Dict[str, Any]) -> List[str]:
+    """
+    Write only the changed form values into a phase dict.
+    
+    Values are compared directly rather than hashed: string equality checks
+    length first and stops at the first differing character, while a hash
+    would always read the whole text.
+    
+    Returns:
+        Names of the fields that changed
+    """
+    data = st.session_state[phase]
+    changed = [field for field, value in values.items() if field not in data or data[field] != value]
+    for field in changed:
+        data[field] = values[field]
+    return changed
+
+
+def update_progress() -> bool:
+    """
+    Update overall progress based on tab completion.
+    
+    Returns:
+        True if the progress percentage changed
+    """
+    ss = st.session_state
+    progress = calculate_progress({phase: ss[phase] for phase in PHASES})
+    changed = progress != ss.progress_percentage
+    ss.progress_percentage = progress
+    return changed
 
 
 # ============================================================================
@@ -839,7 +976,7 @@ def render_attachments_section(phase_name: str):
         with col1:
             if st.button(f"� Ask AI about attachments", key=f"ai_read_{phase_name}"):
                 with st.spinner("🤖 Reading documents and URLs..."):
-                    attachment_content = get_attachment_content(
+                    attachment_content = cached_attachment_content(
                         st.session_state.attachments[phase_name]["files"],
                         st.session_state.attachments[phase_name]["urls"]
                     )
@@ -931,6 +1068,7 @@ def render_sidebar():
 # TAB 1: IDEATION
 # ============================================================================
 
+@st.fragment
 def render_ideation_tab():
     """Render the Ideation phase tab."""
     st.session_state.current_tab = "Ideation"
@@ -938,100 +1076,68 @@ def render_ideation_tab():
     st.header("💡 Phase 1: Ideation")
     st.markdown("*Define the problem, goals, and context for this demand.*")
     
-    with st.form("ideation_form"):
-        st.subheader("Demand Identification")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            demand_number = st.text_input(
-                "Demand Number",
-                value=st.session_state.demand_number,
-                placeholder="e.g., 10001",
-                max_chars=20,
-                help="Sequential demand number for tracking"
-            )
-        
-        with col2:
-            demand_name = st.text_input(
-                "Demand Name",
-                value=st.session_state.demand_name,
-                placeholder="e.g., Promotion Process Enhancement",
-                max_chars=200,
-                help="Descriptive name for this demand"
-            )
-        
-        st.divider()
-        
-        st.subheader("Problem Statement")
-        problem = st.text_area(
-            "What problem are you solving?",
-            value=st.session_state.ideation.get("problem_statement", ""),
-            height=150,
-            max_chars=2000,
-            help="Clearly describe the business problem or opportunity"
-        )
-        
-        st.subheader("Goals & Objectives")
-        goals = st.text_area(
-            "What are the key goals?",
-            value=st.session_state.ideation.get("goals", ""),
-            height=100,
-            max_chars=1000,
-            help="Specific, measurable objectives"
+    values, submitted = render_phase_form("ideation")
+    if submitted:
+        _save_phase_form("ideation", values)
+    
+    # AI assistance - runs in the background so the UI stays responsive
+    if st.button("🤖 Refine Problem Statement (5 Whys)", disabled="ideation_future" in st.session_state):
+        query = f"Apply 5 Whys analysis to: {values['problem_statement'][:200]}"
+        context = {"ideation": dict(st.session_state.ideation)}
+        st.session_state.ideation_future = get_executor().submit(
+            st.session_state.agent.generate, query, context
         )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Background & Context")
-            background = st.text_area(
-                "Relevant background information",
-                value=st.session_state.ideation.get("background", ""),
-                height=100,
-                max_chars=1500
-            )
-        
-        with col2:
-            st.subheader("Constraints")
-            constraints = st.text_area(
-                "Known constraints or limitations",
-                value=st.session_state.ideation.get("constraints", ""),
-                height=100,
-                max_chars=1000
-            )
-        
-        submitted = st.form_submit_button("💾 Save Ideation", use_container_width=True)
-        
-        if submitted:
-            st.session_state.demand_number = demand_number
-            st.session_state.demand_name = demand_name
-            st.session_state.ideation["problem_statement"] = problem
-            st.session_state.ideation["goals"] = goals
-            st.session_state.ideation["background"] = background
-            st.session_state.ideation["constraints"] = constraints
-            
-            add_audit_entry("Updated ideation data", "ideation")
-            update_progress()
-            st.success("✅ Ideation data saved!")
-            st.rerun()
     
-    # AI assistance
-    if st.button("🤖 Refine Problem Statement (5 Whys)"):
-        query = f"Apply 5 Whys analysis to: {problem[:200]}"
-        context = {"ideation": st.session_state.ideation}
-        response = st.session_state.agent.generate(query, context)
-        
+    if "ideation_future" in st.session_state:
+        render_ideation_refinement_status()
+    
+    suggestion = st.session_state.pop("ideation_suggestion", None)
+    if suggestion:
         with st.expander("💡 AI Suggestion", expanded=True):
-            st.markdown(response)
+            st.markdown(suggestion)
     
     # Attachments section
     render_attachments_section("ideation")
 
 
+@st.fragment(run_every=1)
+def render_ideation_refinement_status():
+    """Poll the background 5 Whys refinement until the agent has answered."""
+    future = st.session_state.get("ideation_future")
+    if future is None:
+        return
+    
+    if not future.done():
+        st.status("🤖 Refining problem statement...", state="running")
+        return
+    
+    try:
+        st.session_state.ideation_suggestion = future.result()
+    except Exception as e:
+        st.session_state.ideation_suggestion = f"❌ Error generating response: {str(e)}"
+    del st.session_state.ideation_future
+    
+    # Full rerun stops the polling fragment and shows the suggestion in place
+    st.rerun()
+
+
 # ============================================================================
 # TAB 2: REQUIREMENTS
 # ============================================================================
 
+@st.cache_data(show_spinner=False)
+def _features_from_goals(goals: str) -> List[str]:
+    """Derive the feature list from the ideation goals, one feature per line (max 20)."""
+    return [line for line in map(str.strip, goals.splitlines()) if line][:20]
+
+
+@st.cache_data(show_spinner=False)
+def _stakeholder_df(rows: tuple) -> pd.DataFrame:
+    """Build the stakeholder table from hashable (key, value) row tuples."""
+    return pd.DataFrame([dict(row) for row in rows])
+
+
+@st.fragment
 def render_requirements_tab():
     """Render the Requirements phase tab."""
     st.session_state.current_tab = "Requirements"
@@ -1053,7 +1159,7 @@ def render_requirements_tab():
             with col3:
                 power_interest = st.selectbox(
                     "Power/Interest",
-                    options=[e.value for e in PowerInterest]
+                    options=_POWER_INTEREST_OPTIONS
                 )
             
             email = st.text_input("Email (optional)", max_chars=200)
@@ -1072,9 +1178,10 @@ def render_requirements_tab():
                     
                     st.session_state.requirements["stakeholders"].append(stakeholder)
                     add_audit_entry(f"Added stakeholder: {name}", "requirements", "stakeholders")
-                    update_progress()
+                    progress_changed = update_progress()
                     st.success(f"✅ Added {name}")
-                    st.rerun()
+                    if progress_changed:
+                        st.rerun(scope="app")  # Refresh the header progress bar
                 else:
                     st.error("Name and Role are required")
     
@@ -1082,7 +1189,7 @@ def render_requirements_tab():
     stakeholders = st.session_state.requirements.get("stakeholders", [])
     if stakeholders:
         st.dataframe(
-            stakeholders,
+            _stakeholder_df(tuple(tuple(s.items()) for s in stakeholders)),
             column_config={
                 "name": "Name",
                 "role": "Role",
@@ -1098,49 +1205,13 @@ def render_requirements_tab():
     st.divider()
     
     # User Stories and Features
-    with st.form("requirements_form"):
-        st.subheader("User Stories")
-        user_stories = st.text_area(
-            "Define user stories (As a... I want... so that...)",
-            value=st.session_state.requirements.get("user_stories", ""),
-            height=200,
-            max_chars=5000,
-            help="Each story should follow the template: As a [role], I want [feature], so that [benefit]"
-        )
-        
-        st.subheader("Acceptance Criteria")
-        acceptance_criteria = st.text_area(
-            "What defines 'done' for each story?",
-            value=st.session_state.requirements.get("acceptance_criteria", ""),
-            height=150,
-            max_chars=3000
-        )
-        
-        st.subheader("Non-Functional Requirements")
-        nfr = st.text_area(
-            "Performance, security, scalability requirements",
-            value=st.session_state.requirements.get("non_functional_requirements", ""),
-            height=100,
-            max_chars=2000
-        )
-        
-        submitted = st.form_submit_button("💾 Save Requirements", use_container_width=True)
-        
-        if submitted:
-            st.session_state.requirements["user_stories"] = user_stories
-            st.session_state.requirements["acceptance_criteria"] = acceptance_criteria
-            st.session_state.requirements["non_functional_requirements"] = nfr
-            
-            # Auto-generate features from goals
-            goals = st.session_state.ideation.get("goals", "")
-            if goals:
-                features = [line.strip() for line in goals.split("\n") if line.strip()]
-                st.session_state.requirements["features"] = features[:20]  # Limit to 20
-            
-            add_audit_entry("Updated requirements data", "requirements")
-            update_progress()
-            st.success("✅ Requirements saved!")
-            st.rerun()
+    values, submitted = render_phase_form("requirements")
+    if submitted:
+        # Auto-generate features from goals
+        goals = st.session_state.ideation.get("goals", "")
+        if goals:
+            values["features"] = _features_from_goals(goals)
+        _save_phase_form("requirements", values)
     
     # Attachments section
     render_attachments_section("requirements")
@@ -1150,6 +1221,16 @@ def render_requirements_tab():
 # TAB 3: ASSESSMENT
 # ============================================================================
 
+@st.cache_data(show_spinner=False, max_entries=256)
+def _roi_summary(cost: float, roi: float, duration: int) -> str:
+    """Format the ROI summary shown below the assessment form."""
+    expected_return = cost * (1 + roi / 100)
+    payback_months = duration * 4.33 if duration > 0 else 0
+    
+    return f"💰 **ROI Summary:** Initial investment of €{cost:,.0f} with {roi}% ROI = €{expected_return:,.0f} return. Payback period: ~{payback_months:.0f} months"
+
+
+@st.fragment
 def render_assessment_tab():
     """Render the Assessment phase tab."""
     st.session_state.current_tab = "Assessment"
@@ -1157,94 +1238,16 @@ def render_assessment_tab():
     st.header("📊 Phase 3: Assessment")
     st.markdown("*Business case, ROI, risks, and feasibility.*")
     
-    with st.form("assessment_form"):
-        st.subheader("Business Case")
-        business_case = st.text_area(
-            "Why should we invest in this?",
-            value=st.session_state.assessment.get("business_case", ""),
-            height=150,
-            max_chars=2000
-        )
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            roi = st.number_input(
-                "Expected ROI (%)",
-                min_value=0.0,
-                max_value=1000.0,
-                value=float(st.session_state.assessment.get("roi_percentage", 0)),
-                step=5.0
-            )
-        
-        with col2:
-            cost = st.number_input(
-                "Estimated Cost (€)",
-                min_value=0.0,
-                value=float(st.session_state.assessment.get("estimated_cost", 0)),
-                step=1000.0
-            )
-        
-        with col3:
-            duration = st.number_input(
-                "Duration (weeks)",
-                min_value=0,
-                max_value=520,
-                value=int(st.session_state.assessment.get("estimated_duration_weeks", 0)),
-                step=1
-            )
-        
-        st.subheader("Risks & Mitigation")
-        risks = st.text_area(
-            "Identify key risks and mitigation strategies",
-            value=st.session_state.assessment.get("risks", ""),
-            height=150,
-            max_chars=3000,
-            help="Format: [Severity] Risk description -> Mitigation"
-        )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Dependencies")
-            dependencies = st.text_area(
-                "External dependencies",
-                value=st.session_state.assessment.get("dependencies", ""),
-                height=100,
-                max_chars=2000
-            )
-        
-        with col2:
-            st.subheader("Assumptions")
-            assumptions = st.text_area(
-                "Key assumptions",
-                value=st.session_state.assessment.get("assumptions", ""),
-                height=100,
-                max_chars=2000
-            )
-        
-        submitted = st.form_submit_button("💾 Save Assessment", use_container_width=True)
-        
-        if submitted:
-            st.session_state.assessment["business_case"] = business_case
-            st.session_state.assessment["roi_percentage"] = roi
-            st.session_state.assessment["estimated_cost"] = cost
-            st.session_state.assessment["estimated_duration_weeks"] = duration
-            st.session_state.assessment["risks"] = risks
-            st.session_state.assessment["dependencies"] = dependencies
-            st.session_state.assessment["assumptions"] = assumptions
-            
-            add_audit_entry("Updated assessment data", "assessment")
-            update_progress()
-            st.success("✅ Assessment saved!")
-            st.rerun()
+    values, submitted = render_phase_form("assessment")
+    if submitted:
+        _save_phase_form("assessment", values)
     
     # ROI Calculator
+    roi = values["roi_percentage"]
+    cost = values["estimated_cost"]
+    duration = values["estimated_duration_weeks"]
     if cost > 0 and roi > 0:
-        expected_return = cost * (1 + roi / 100)
-        payback_months = duration * 4.33 if duration > 0 else 0
-        
-        st.info(f"💰 **ROI Summary:** Initial investment of €{cost:,.0f} with {roi}% ROI = €{expected_return:,.0f} return. Payback period: ~{payback_months:.0f} months")
+        st.info(_roi_summary(cost, roi, duration))
     
     # Attachments section
     render_attachments_section("assessment")
@@ -1254,6 +1257,24 @@ def render_assessment_tab():
 # TAB 4: DESIGN
 # ============================================================================
 
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _load_wireframe(digest: str, _data: bytes) -> Image.Image:
+    """
+    Decode an uploaded wireframe once; reruns reuse the decoded image.
+    
+    Args:
+        digest: SHA-1 of the upload (cache key)
+        _data: Uploaded bytes (not hashed by Streamlit)
+        
+    Returns:
+        Decoded image
+    """
+    image = Image.open(io.BytesIO(_data))
+    image.load()
+    return image
+
+
+@st.fragment
 def render_design_tab():
     """Render the Design phase tab."""
     st.session_state.current_tab = "Design"
@@ -1261,71 +1282,21 @@ def render_design_tab():
     st.header("🎨 Phase 4: Design")
     st.markdown("*Architecture, technical design, and wireframes.*")
     
-    with st.form("design_form"):
-        st.subheader("Architecture Overview")
-        architecture = st.text_area(
-            "High-level architecture and patterns",
-            value=st.session_state.design.get("architecture_overview", ""),
-            height=150,
-            max_chars=5000
-        )
-        
-        st.subheader("Technical Stack")
-        tech_stack = st.text_area(
-            "Technologies, frameworks, and tools",
-            value=st.session_state.design.get("technical_stack", ""),
-            height=100,
-            max_chars=1500
-        )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Data Model")
-            data_model = st.text_area(
-                "Key entities and relationships",
-                value=st.session_state.design.get("data_model", ""),
-                height=100,
-                max_chars=3000
-            )
-        
-        with col2:
-            st.subheader("Integration Points")
-            integrations = st.text_area(
-                "External systems and APIs",
-                value=st.session_state.design.get("integration_points", ""),
-                height=100,
-                max_chars=2000
-            )
-        
-        st.subheader("Security Considerations")
-        security = st.text_area(
-            "Authentication, authorization, data protection",
-            value=st.session_state.design.get("security_considerations", ""),
-            height=100,
-            max_chars=2000
-        )
-        
-        submitted = st.form_submit_button("💾 Save Design", use_container_width=True)
-        
-        if submitted:
-            st.session_state.design["architecture_overview"] = architecture
-            st.session_state.design["technical_stack"] = tech_stack
-            st.session_state.design["data_model"] = data_model
-            st.session_state.design["integration_points"] = integrations
-            st.session_state.design["security_considerations"] = security
-            
-            add_audit_entry("Updated design data", "design")
-            update_progress()
-            st.success("✅ Design saved!")
-            st.rerun()
+    values, submitted = render_phase_form("design")
+    if submitted:
+        _save_phase_form("design", values)
     
     # Wireframes section
     st.subheader("Wireframes & Mockups")
     uploaded_file = st.file_uploader("Upload wireframe/diagram", type=["png", "jpg", "jpeg", "pdf"])
     
     if uploaded_file:
-        st.image(uploaded_file, caption="Uploaded Wireframe", use_container_width=True)
+        if uploaded_file.type == "application/pdf":
+            st.caption(f"📄 {uploaded_file.name} ({uploaded_file.size / 1024:.1f} KB) - preview not available for PDF")
+        else:
+            data = uploaded_file.getvalue()
+            st.image(_load_wireframe(hashlib.sha1(data).hexdigest(), data),
+                     caption="Uploaded Wireframe", use_container_width=True)
         st.info("💡 In production, files would be stored in cloud storage (Azure Blob, S3)")
     
     # Attachments section
@@ -1336,6 +1307,32 @@ def render_design_tab():
 # TAB 5: BUILD
 # ============================================================================
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _payload_preview(epic_json: str, client_type: str, _client) -> str:
+    """Format the JIRA API payload preview, cached per epic content and client type."""
+    return _client.get_api_payload_preview(json_utils.loads(epic_json))
+
+
+def _jira_created_items() -> List[Dict[str, Any]]:
+    """
+    Get the JIRA items created in this session, re-fetching only after a change.
+    
+    Memoized in session_state (not st.cache_data) because the client and its
+    items belong to one session. Keyed on jira_version, which is bumped
+    whenever an item is created, and on the client instance.
+    """
+    client = st.session_state.jira_client
+    key = (st.session_state.get("jira_version", 0), id(client))
+    cached = st.session_state.get("jira_items_cache")
+    
+    if cached is None or cached[0] != key:
+        cached = (key, client.get_created_items())
+        st.session_state.jira_items_cache = cached
+    
+    return cached[1]
+
+
+@st.fragment
 def render_build_tab():
     """Render the Build phase tab."""
     st.session_state.current_tab = "Build"
@@ -1351,72 +1348,29 @@ def render_build_tab():
         if st.form_submit_button("➕ Add Task"):
             if new_task:
                 if "tasks" not in st.session_state.build:
-                    st.session_state.build["tasks"] = []
+                    st.session_state.build["tasks"] = bounded([], MAX_BUILD_TASKS)
                 
                 st.session_state.build["tasks"].append(new_task)
                 add_audit_entry(f"Added task: {new_task[:50]}", "build", "tasks")
-                update_progress()
+                progress_changed = update_progress()
                 st.success("✅ Task added!")
-                st.rerun()
+                if progress_changed:
+                    st.rerun(scope="app")  # Refresh the header progress bar
     
     # Display tasks
     tasks = st.session_state.build.get("tasks", [])
     if tasks:
-        for i, task in enumerate(tasks[-100:], 1):  # Show last 100
-            st.text(f"{i}. {task}")
+        # Show last 100 as a single element (st.text keeps task text literal)
+        st.text("\n".join(f"{i}. {task}" for i, task in enumerate(tail(tasks, 100), 1)))
     else:
         st.info("No tasks added yet")
     
     st.divider()
     
     # Sprint planning
-    with st.form("sprint_form"):
-        st.subheader("Sprint Plan")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            sprint_start = st.date_input("Sprint Start Date")
-        
-        with col2:
-            sprint_end = st.date_input("Sprint End Date")
-        
-        sprint_plan = st.text_area(
-            "Sprint details and milestones",
-            value=st.session_state.build.get("sprint_plan", ""),
-            height=150,
-            max_chars=3000
-        )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            repo_url = st.text_input(
-                "Repository URL",
-                value=st.session_state.build.get("repository_url", ""),
-                max_chars=500
-            )
-        
-        with col2:
-            branch = st.text_input(
-                "Branch Name",
-                value=st.session_state.build.get("branch_name", ""),
-                max_chars=100
-            )
-        
-        submitted = st.form_submit_button("💾 Save Build Plan", use_container_width=True)
-        
-        if submitted:
-            st.session_state.build["sprint_start_date"] = str(sprint_start)
-            st.session_state.build["sprint_end_date"] = str(sprint_end)
-            st.session_state.build["sprint_plan"] = sprint_plan
-            st.session_state.build["repository_url"] = repo_url
-            st.session_state.build["branch_name"] = branch
-            
-            add_audit_entry("Updated build data", "build")
-            update_progress()
-            st.success("✅ Build plan saved!")
-            st.rerun()
+    values, submitted = render_phase_form("build")
+    if submitted:
+        _save_phase_form("build", values)
     
     st.divider()
     
@@ -1438,20 +1392,24 @@ def render_build_tab():
             
             if result.get("created"):
                 st.session_state.build["jira_epic_id"] = result["key"]
+                st.session_state.jira_version = st.session_state.get("jira_version", 0) + 1
                 add_audit_entry(f"Created JIRA epic: {result['key']}", "build", "jira_epic_id")
                 st.success(f"✅ Created Epic: [{result['key']}]({result['url']})")
                 
                 with st.expander("API Payload Preview"):
-                    st.code(st.session_state.jira_client.get_api_payload_preview(epic_data), language="json")
+                    client = st.session_state.jira_client
+                    st.code(
+                        _payload_preview(json_utils.dumps(epic_data), type(client).__name__, client),
+                        language="json"
+                    )
             else:
                 st.error("Failed to create epic")
     
     with col2:
         if st.button("📊 View JIRA Items", use_container_width=True):
-            items = st.session_state.jira_client.get_created_items()
+            items = _jira_created_items()
             with st.expander("Created JIRA Items", expanded=True):
-                for item in items[-10:]:  # Show last 10
-                    st.json(item)
+                st.json({"items": items[-10:]})  # Show last 10
     
     # Attachments section
     render_attachments_section("build")
@@ -1461,6 +1419,7 @@ def render_build_tab():
 # TAB 6: VALIDATION
 # ============================================================================
 
+@st.fragment
 def render_validation_tab():
     """Render the Validation phase tab."""
     st.session_state.current_tab = "Validation"
@@ -1468,60 +1427,9 @@ def render_validation_tab():
     st.header("🧪 Phase 6: Validation")
     st.markdown("*Test cases, QA, and defect tracking.*")
     
-    with st.form("validation_form"):
-        st.subheader("Test Cases")
-        test_cases = st.text_area(
-            "Define test scenarios and expected outcomes",
-            value=st.session_state.validation.get("test_cases", ""),
-            height=200,
-            max_chars=5000
-        )
-        
-        st.subheader("Test Results")
-        test_results = st.text_area(
-            "Test execution results and findings",
-            value=st.session_state.validation.get("test_results", ""),
-            height=150,
-            max_chars=3000
-        )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            coverage = st.number_input(
-                "Automated Test Coverage (%)",
-                min_value=0.0,
-                max_value=100.0,
-                value=float(st.session_state.validation.get("automated_test_coverage", 0)),
-                step=5.0
-            )
-        
-        with col2:
-            qa_signoff = st.checkbox(
-                "QA Sign-Off",
-                value=st.session_state.validation.get("qa_sign_off", False)
-            )
-        
-        manual_status = st.text_area(
-            "Manual Test Status",
-            value=st.session_state.validation.get("manual_test_status", ""),
-            height=100,
-            max_chars=1000
-        )
-        
-        submitted = st.form_submit_button("💾 Save Validation", use_container_width=True)
-        
-        if submitted:
-            st.session_state.validation["test_cases"] = test_cases
-            st.session_state.validation["test_results"] = test_results
-            st.session_state.validation["automated_test_coverage"] = coverage
-            st.session_state.validation["qa_sign_off"] = qa_signoff
-            st.session_state.validation["manual_test_status"] = manual_status
-            
-            add_audit_entry("Updated validation data", "validation")
-            update_progress()
-            st.success("✅ Validation saved!")
-            st.rerun()
+    values, submitted = render_phase_form("validation")
+    if submitted:
+        _save_phase_form("validation", values)
     
     # JIRA Test Case Integration
     st.divider()
@@ -1536,9 +1444,9 @@ def render_validation_tab():
     with st.expander("➕ Add Bug"):
         with st.form("add_bug"):
             bug_id = st.text_input("Bug ID", max_chars=50)
-            severity = st.selectbox("Severity", ["Critical", "High", "Medium", "Low"])
+            severity = st.selectbox("Severity", _BUG_SEVERITY_OPTIONS)
             description = st.text_area("Description", max_chars=500)
-            status = st.selectbox("Status", ["Open", "In Progress", "Fixed", "Closed"])
+            status = st.selectbox("Status", _BUG_STATUS_OPTIONS)
             
             if st.form_submit_button("Add Bug"):
                 if bug_id and description:
@@ -1551,16 +1459,15 @@ def render_validation_tab():
                     }
                     
                     if "bug_log" not in st.session_state.validation:
-                        st.session_state.validation["bug_log"] = []
+                        st.session_state.validation["bug_log"] = bounded([], MAX_BUG_LOG_ENTRIES)
                     
                     st.session_state.validation["bug_log"].append(bug)
                     add_audit_entry(f"Added bug: {bug_id}", "validation", "bug_log")
                     st.success(f"✅ Bug {bug_id} added!")
-                    st.rerun()
     
     bugs = st.session_state.validation.get("bug_log", [])
     if bugs:
-        st.dataframe(bugs, use_container_width=True)
+        st.dataframe(list(bugs), use_container_width=True)
     else:
         st.info("No bugs logged yet")
     
@@ -1572,6 +1479,7 @@ def render_validation_tab():
 # TAB 7: DEPLOYMENT
 # ============================================================================
 
+@st.fragment
 def render_deployment_tab():
     """Render the Deployment phase tab."""
     st.session_state.current_tab = "Deployment"
@@ -1579,68 +1487,9 @@ def render_deployment_tab():
     st.header("🚀 Phase 7: Deployment")
     st.markdown("*Deployment planning, rollout, and training.*")
     
-    with st.form("deployment_form"):
-        st.subheader("Deployment Schedule")
-        deployment_date = st.date_input("Target Deployment Date")
-        
-        st.subheader("Rollout Plan")
-        rollout = st.text_area(
-            "Phased rollout strategy",
-            value=st.session_state.deployment.get("rollout_plan", ""),
-            height=150,
-            max_chars=3000
-        )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Environment Configuration")
-            env_config = st.text_area(
-                "Production environment setup",
-                value=st.session_state.deployment.get("environment_config", ""),
-                height=100,
-                max_chars=2000
-            )
-        
-        with col2:
-            st.subheader("Rollback Plan")
-            rollback = st.text_area(
-                "Emergency rollback procedure",
-                value=st.session_state.deployment.get("rollback_plan", ""),
-                height=100,
-                max_chars=2000
-            )
-        
-        st.subheader("Communication Plan")
-        communication = st.text_area(
-            "Stakeholder communication strategy",
-            value=st.session_state.deployment.get("communication_plan", ""),
-            height=100,
-            max_chars=1500
-        )
-        
-        st.subheader("Deployment Checklist")
-        checklist = st.text_area(
-            "Pre-deployment verification items",
-            value=st.session_state.deployment.get("deployment_checklist", ""),
-            height=100,
-            max_chars=2000
-        )
-        
-        submitted = st.form_submit_button("💾 Save Deployment Plan", use_container_width=True)
-        
-        if submitted:
-            st.session_state.deployment["deployment_schedule"] = str(deployment_date)
-            st.session_state.deployment["rollout_plan"] = rollout
-            st.session_state.deployment["environment_config"] = env_config
-            st.session_state.deployment["rollback_plan"] = rollback
-            st.session_state.deployment["communication_plan"] = communication
-            st.session_state.deployment["deployment_checklist"] = checklist
-            
-            add_audit_entry("Updated deployment data", "deployment")
-            update_progress()
-            st.success("✅ Deployment plan saved!")
-            st.rerun()
+    values, submitted = render_phase_form("deployment")
+    if submitted:
+        _save_phase_form("deployment", values)
     
     st.divider()
     st.subheader("📚 Training Materials")
@@ -1654,6 +1503,7 @@ def render_deployment_tab():
 # TAB 8: IMPLEMENTATION
 # ============================================================================
 
+@st.fragment
 def render_implementation_tab():
     """Render the Implementation monitoring tab."""
     st.session_state.current_tab = "Implementation"
@@ -1683,64 +1533,9 @@ def render_implementation_tab():
     
     st.divider()
     
-    with st.form("implementation_form"):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            uptime_input = st.number_input(
-                "System Uptime (%)",
-                min_value=0.0,
-                max_value=100.0,
-                value=uptime,
-                step=0.1
-            )
-        
-        with col2:
-            adoption_input = st.number_input(
-                "User Adoption Rate (%)",
-                min_value=0.0,
-                max_value=100.0,
-                value=adoption,
-                step=1.0
-            )
-        
-        st.subheader("Issue Log")
-        issues = st.text_area(
-            "Post-deployment issues and resolutions",
-            value=st.session_state.implementation.get("issue_log", ""),
-            height=150,
-            max_chars=3000
-        )
-        
-        st.subheader("User Feedback")
-        feedback = st.text_area(
-            "User comments and feedback",
-            value=st.session_state.implementation.get("user_feedback", ""),
-            height=150,
-            max_chars=2000
-        )
-        
-        st.subheader("Performance Data")
-        performance = st.text_area(
-            "System performance observations",
-            value=st.session_state.implementation.get("performance_data", ""),
-            height=100,
-            max_chars=2000
-        )
-        
-        submitted = st.form_submit_button("💾 Save Implementation Data", use_container_width=True)
-        
-        if submitted:
-            st.session_state.implementation["uptime_percentage"] = uptime_input
-            st.session_state.implementation["adoption_rate"] = adoption_input
-            st.session_state.implementation["issue_log"] = issues
-            st.session_state.implementation["user_feedback"] = feedback
-            st.session_state.implementation["performance_data"] = performance
-            
-            add_audit_entry("Updated implementation data", "implementation")
-            update_progress()
-            st.success("✅ Implementation data saved!")
-            st.rerun()
+    values, submitted = render_phase_form("implementation")
+    if submitted:
+        _save_phase_form("implementation", values)
     
     # Attachments section
     render_attachments_section("implementation")
@@ -1750,6 +1545,7 @@ def render_implementation_tab():
 # TAB 9: CLOSING
 # ============================================================================
 
+@st.fragment
 def render_closing_tab():
     """Render the Closing phase tab."""
     st.session_state.current_tab = "Closing"
@@ -1757,68 +1553,9 @@ def render_closing_tab():
     st.header("🎯 Phase 9: Closing")
     st.markdown("*Retrospective, lessons learned, and project finalization.*")
     
-    with st.form("closing_form"):
-        st.subheader("Retrospective")
-        retrospective = st.text_area(
-            "What went well? What could be improved?",
-            value=st.session_state.closing.get("retrospective", ""),
-            height=200,
-            max_chars=5000
-        )
-        
-        st.subheader("Lessons Learned")
-        lessons = st.text_area(
-            "Key takeaways for future projects",
-            value=st.session_state.closing.get("lessons_learned", ""),
-            height=150,
-            max_chars=3000
-        )
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            final_cost = st.number_input(
-                "Final Cost (€)",
-                min_value=0.0,
-                value=float(st.session_state.closing.get("final_costs", 0)),
-                step=1000.0
-            )
-        
-        with col2:
-            final_roi = st.number_input(
-                "Actual ROI (%)",
-                value=float(st.session_state.closing.get("final_roi", 0)),
-                step=5.0
-            )
-        
-        st.subheader("Knowledge Transfer")
-        knowledge_transfer = st.text_area(
-            "Documentation handoff and training completed",
-            value=st.session_state.closing.get("knowledge_transfer", ""),
-            height=100,
-            max_chars=2000
-        )
-        
-        archive_location = st.text_input(
-            "Archive Location (Confluence/SharePoint)",
-            value=st.session_state.closing.get("archive_location", ""),
-            max_chars=500
-        )
-        
-        submitted = st.form_submit_button("💾 Save Closing Data", use_container_width=True)
-        
-        if submitted:
-            st.session_state.closing["retrospective"] = retrospective
-            st.session_state.closing["lessons_learned"] = lessons
-            st.session_state.closing["final_costs"] = final_cost
-            st.session_state.closing["final_roi"] = final_roi
-            st.session_state.closing["knowledge_transfer"] = knowledge_transfer
-            st.session_state.closing["archive_location"] = archive_location
-            
-            add_audit_entry("Updated closing data", "closing")
-            update_progress()
-            st.success("✅ Closing data saved!")
-            st.rerun()
+    values, submitted = render_phase_form("closing")
+    if submitted:
+        _save_phase_form("closing", values)
     
     st.divider()
     
@@ -1828,17 +1565,26 @@ def render_closing_tab():
     stakeholders = st.session_state.requirements.get("stakeholders", [])
     if stakeholders:
         sign_offs = st.session_state.closing.get("sign_offs", {})
+        names = [sh.get("name", "Unknown") for sh in stakeholders]
+        
+        edited = st.data_editor(
+            pd.DataFrame({
+                "Stakeholder": names,
+                "Role": [sh.get("role", "N/A") for sh in stakeholders],
+                "Signed": [bool(sign_offs.get(name, False)) for name in names],
+            }),
+            column_config={"Signed": st.column_config.CheckboxColumn("Signed")},
+            disabled=["Stakeholder", "Role"],
+            hide_index=True,
+            use_container_width=True,
+            key="closing.sign_offs"
+        )
         
-        for sh in stakeholders:
-            name = sh.get("name", "Unknown")
-            signed = st.checkbox(
-                f"{name} ({sh.get('role', 'N/A')})",
-                value=sign_offs.get(name, False),
-                key=f"signoff_{name}"
-            )
-            sign_offs[name] = signed
-        
-        st.session_state.closing["sign_offs"] = sign_offs
+        updated = dict(zip(edited["Stakeholder"].tolist(), edited["Signed"].tolist()))
+        changed = [name for name, signed in updated.items() if signed != sign_offs.get(name, False)]
+        if changed:
+            st.session_state.closing["sign_offs"] = {**sign_offs, **updated}
+            add_audit_entry(describe_changes("Updated stakeholder sign-offs", changed), "closing", "sign_offs")
     else:
         st.info("No stakeholders defined in Requirements phase")
     
@@ -1872,6 +1618,77 @@ def render_closing_tab():
 # DEMANDS OVERVIEW PAGE
 # ============================================================================
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_demands_summary(signature: tuple) -> List[Dict[str, Any]]:
+    """Load the demand index; the storage signature is the cache key."""
+    return get_storage().get_all_demands_summary()
+
+
+# Summary columns shown in the overview and their defaults for missing values
+_SUMMARY_DEFAULTS = {
+    "demand_id": "Unknown",
+    "demand_name": "",
+    "demand_number": "",
+    "title": "Untitled",
+    "description": "No description",
+    "status": "Draft",
+    "progress_percentage": 0,
+    "last_modified": "",
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _demands_frame(signature: tuple) -> pd.DataFrame:
+    """
+    Demand summaries as a DataFrame for vectorized filtering and stats.
+    
+    Adds a lowercased "_search" column so searching doesn't re-lowercase
+    every field on each keystroke, parses last_modified once into
+    "_last_modified_dt" (for sorting) and "_last_modified_str" (for display),
+    truncates descriptions into "_desc_preview", and resolves "_display_name"
+    (number and name, name, title, or ID, whichever is set first).
+    """
+    df = pd.DataFrame(_load_demands_summary(signature), columns=list(_SUMMARY_DEFAULTS))
+    df = df.fillna(_SUMMARY_DEFAULTS).astype({"progress_percentage": float})
+    df["_search"] = (
+        df["demand_id"] + " " + df["demand_name"].astype(str) + " " + df["title"] + " " + df["description"]
+    ).str.lower()
+    
+    modified = pd.to_datetime(df["last_modified"], errors="coerce", format="ISO8601")
+    df["_last_modified_dt"] = modified
+    df["_last_modified_str"] = modified.dt.strftime("%Y-%m-%d %H:%M").fillna(df["last_modified"].astype(str))
+    
+    descriptions = df["description"].astype(str)
+    df["_desc_preview"] = descriptions.where(descriptions.str.len() <= 150, descriptions.str.slice(0, 150) + "...")
+    
+    name, number, title = df["demand_name"].astype(str), df["demand_number"].astype(str), df["title"].astype(str)
+    df["_display_name"] = (
+        df["demand_id"]
+        .mask((title != "") & (title != "Untitled"), title)
+        .mask(name != "", name)
+        .mask((name != "") & (number != ""), number + " - " + name)
+    )
+    return df
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _demands_status_index(signature: tuple) -> Dict[str, Any]:
+    """Row positions of the demands frame grouped by status."""
+    return _demands_frame(signature).groupby("status").indices
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _demands_stats(signature: tuple) -> Dict[str, Any]:
+    """Overview KPIs: demand count, average progress, and counts per status."""
+    df = _demands_frame(signature)
+    return {
+        "total": len(df),
+        "avg_progress": float(df["progress_percentage"].mean()) if len(df) else 0.0,
+        "counts": Counter(df["status"]),
+    }
+
+
+@st.fragment
 def render_demands_overview():
     """Render the demands overview page with all demands."""
     st.header("📂 All Demands")
@@ -1897,8 +1714,7 @@ def render_demands_overview():
         search_query = st.text_input("🔍 Search demands", placeholder="Search by title, ID, or description...")
     
     with col2:
-        status_filter = st.selectbox("Filter by Status", 
-                                     ["All", "Draft", "In Progress", "Under Review", "Approved", "Rejected", "On Hold", "Completed", "Cancelled"])
+        status_filter = st.selectbox("Filter by Status", _STATUS_FILTER_OPTIONS)
     
     with col3:
         if st.button("➕ Create New Demand", use_container_width=True, type="primary"):
@@ -1907,136 +1723,220 @@ def render_demands_overview():
     
     st.divider()
     
-    # Get all demands
-    all_demands = st.session_state.storage.get_all_demands_summary()
+    # Get all demands (cached until the index changes); write pending edits first
+    flush_pending_save()
+    signature = st.session_state.storage.index_signature()
+    demands_df = _demands_frame(signature)
     
-    # Apply filters
-    filtered_demands = all_demands
+    # Apply filters using the precomputed status index and search column
+    filtered_df = demands_df
     
     if status_filter != "All":
-        filtered_demands = [d for d in filtered_demands if d.get('status') == status_filter]
+        filtered_df = demands_df.iloc[_demands_status_index(signature).get(status_filter, [])]
     
     if search_query:
-        search_lower = search_query.lower()
-        filtered_demands = [d for d in filtered_demands if 
-                          search_lower in d.get('demand_id', '').lower() or
-                          search_lower in d.get('ideation', {}).get('title', '').lower() or
-                          search_lower in d.get('ideation', {}).get('description', '').lower()]
+        filtered_df = filtered_df[filtered_df["_search"].str.contains(search_query.lower(), regex=False)]
     
     # Display stats
+    stats = _demands_stats(signature)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Demands", len(all_demands))
+        st.metric("Total Demands", stats["total"])
     
     with col2:
-        avg_progress = sum(d.get('progress_percentage', 0) for d in all_demands) / len(all_demands) if all_demands else 0
-        st.metric("Avg Progress", f"{avg_progress:.0f}%")
+        st.metric("Avg Progress", f"{stats['avg_progress']:.0f}%")
     
     with col3:
-        completed = len([d for d in all_demands if d.get('status') == 'Completed'])
-        st.metric("Completed", completed)
+        st.metric("Completed", stats["counts"].get("Completed", 0))
     
     with col4:
-        in_progress = len([d for d in all_demands if d.get('status') == 'In Progress'])
-        st.metric("In Progress", in_progress)
+        st.metric("In Progress", stats["counts"].get("In Progress", 0))
     
     st.divider()
     
     # Display demands
-    if not filtered_demands:
+    if filtered_df.empty:
         st.info("No demands found matching your criteria.")
     else:
         # Sort by last modified (most recent first)
-        filtered_demands = sorted(filtered_demands, 
-                                 key=lambda x: x.get('last_modified', ''), 
-                                 reverse=True)
+        filtered_df = filtered_df.sort_values("_last_modified_dt", ascending=False, na_position="last")
+        current_id = st.session_state.demand_id
+        
+        table = pd.DataFrame({
+            "icon": filtered_df["status"].map(_STATUS_ICONS).fillna('⚪'),
+            "name": filtered_df["_display_name"],
+            "demand_id": filtered_df["demand_id"],
+            "status": filtered_df["status"],
+            "progress_percentage": filtered_df["progress_percentage"],
+            "last_modified": filtered_df["_last_modified_str"],
+            "description": filtered_df["_desc_preview"],
+            "current": filtered_df["demand_id"].eq(current_id),
+        })
+        
+        event = st.dataframe(
+            table,
+            column_config={
+                "icon": st.column_config.TextColumn("", width="small"),
+                "name": st.column_config.TextColumn("Demand"),
+                "demand_id": st.column_config.TextColumn("ID"),
+                "status": st.column_config.TextColumn("Status"),
+                "progress_percentage": st.column_config.ProgressColumn("Progress", min_value=0, max_value=100, format="%d%%"),
+                "last_modified": st.column_config.TextColumn("Modified"),
+                "description": st.column_config.TextColumn("Description"),
+                "current": st.column_config.CheckboxColumn("Active"),
+            },
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="demands_table",
+        )
+        st.caption("Select a row to load that demand.")
         
-        for demand in filtered_demands:
-            demand_id = demand.get('demand_id', 'Unknown')
-            demand_name = demand.get('demand_name', '')
-            demand_number = demand.get('demand_number', '')
-            title = demand.get('ideation', {}).get('title', 'Untitled')
-            description = demand.get('ideation', {}).get('description', 'No description')
-            status = demand.get('status', 'Draft')
-            progress = demand.get('progress_percentage', 0)
-            last_modified = demand.get('last_modified', '')
-            
-            # Parse last modified
-            try:
-                if isinstance(last_modified, str):
-                    last_modified_dt = datetime.fromisoformat(last_modified)
-                    last_modified_str = last_modified_dt.strftime("%Y-%m-%d %H:%M")
-                else:
-                    last_modified_str = str(last_modified)
-            except:
-                last_modified_str = str(last_modified)
-            
-            # Status color
-            status_colors = {
-                'Draft': '🔵',
-                'In Progress': '🟡',
-                'Under Review': '🟠',
-                'Approved': '🟢',
-                'Rejected': '🔴',
-                'On Hold': '⚪',
-                'Completed': '✅',
-                'Cancelled': '⚫'
-            }
-            status_icon = status_colors.get(status, '⚪')
-            
-            # Current demand indicator
-            is_current = (demand_id == st.session_state.demand_id)
-            current_badge = " **[CURRENT]**" if is_current else ""
-            
-            # Display name - use demand name/number if available, otherwise title
-            if demand_name and demand_number:
-                display_name = f"{demand_number} - {demand_name}"
-            elif demand_name:
-                display_name = demand_name
-            elif title and title != 'Untitled':
-                display_name = title
-            else:
-                display_name = demand_id
-            
-            # Create demand card
-            with st.container():
-                col1, col2, col3 = st.columns([3, 1, 1])
-                
-                with col1:
-                    st.markdown(f"### {status_icon} {display_name}{current_badge}")
-                    st.caption(f"**ID:** {demand_id}")
-                    if demand_number or demand_name:
-                        if demand_number:
-                            st.caption(f"**Number:** {demand_number}")
-                        if title and title != 'Untitled':
-                            st.caption(f"**Title:** {title}")
-                    st.caption(f"**Description:** {description[:150]}{'...' if len(description) > 150 else ''}")
-                
-                with col2:
-                    st.metric("Progress", f"{progress}%")
-                    st.caption(f"Status: **{status}**")
-                
-                with col3:
-                    st.caption(f"Modified: {last_modified_str}")
-                    
-                    if not is_current:
-                        if st.button(f"📂 Load", key=f"load_{demand_id}", use_container_width=True):
-                            if load_demand_by_id(demand_id):
-                                st.rerun()
-                    else:
-                        st.info("Active")
-                
-                # Progress bar
-                st.progress(progress / 100)
-                
-                st.divider()
+        selected_rows = event.selection.rows
+        if selected_rows:
+            demand_id = table["demand_id"].iloc[selected_rows[0]]
+            # Clear the selection so it doesn't reload after switching demands
+            del st.session_state["demands_table"]
+            if demand_id != current_id and load_demand_by_id(demand_id):
+                st.rerun(scope="app")
 
 
 # ============================================================================
 # GLOBAL ACTIONS
 # ============================================================================
 
+def _demand_memo(name: str, build: Callable[[], Any]) -> Any:
+    """
+    Return a value derived from the current demand, rebuilding it only after a change.
+    
+    Memoized in session_state because the values hold one session's unsaved
+    edits. Every edit updates last_modified, so it keys the cache together
+    with the demand ID, status, and progress.
+    
+    Args:
+        name: Name of the derived value (e.g. "json")
+        build: Produces the value when the cached copy is stale
+        
+    Returns:
+        The derived value
+    """
+    ss = st.session_state
+    key = (ss.demand_id, ss.last_modified, ss.status, ss.progress_percentage)
+    cache = ss.setdefault("demand_memo", {})
+    
+    if name not in cache or cache[name][0] != key:
+        cache[name] = (key, build())
+    
+    return cache[name][1]
+
+
+def _build_json_export() -> bytes:
+    """Serialize the current demand to JSON."""
+    ss = st.session_state
+    demand_data = {
+        "demand_id": ss.demand_id,
+        "created_at": ss.start_time.isoformat(),
+        "last_modified": ss.last_modified.isoformat(),
+        "status": ss.status,
+        "progress_percentage": ss.progress_percentage,
+        **{phase: ss[phase] for phase in PHASES},
+        "audit_log": ss.audit_log
+    }
+    
+    return export_to_json_bytes(demand_data)
+
+
+@st.fragment
+def _render_json_export():
+    """JSON export button; reruns on its own so other actions don't rebuild the export."""
+    if st.button("📥 Export as JSON", use_container_width=True):
+        json_bytes = _demand_memo("json", _build_json_export)
+        
+        st.download_button(
+            label="💾 Download JSON",
+            data=json_bytes,
+            file_name=f"{st.session_state.demand_id}_demand.json",
+            mime="application/json"
+        )
+
+
+def _build_markdown_export() -> str:
+    """Render the current demand as a Markdown report."""
+    ss = st.session_state
+    demand_data = {
+        "demand_id": ss.demand_id,
+        "created_at": ss.start_time.isoformat(),
+        "status": ss.status,
+        "progress_percentage": ss.progress_percentage,
+        **{phase: ss[phase] for phase in PHASES}
+    }
+    
+    return export_to_markdown(demand_data)
+
+
+@st.fragment
+def _render_markdown_export():
+    """Markdown export button."""
+    if st.button("📄 Export as Markdown", use_container_width=True):
+        md_str = _demand_memo("markdown", _build_markdown_export)
+        
+        st.download_button(
+            label="💾 Download Markdown",
+            data=md_str,
+            file_name=f"{st.session_state.demand_id}_report.md",
+            mime="text/markdown"
+        )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _audit_frame(demand_id: str, entry_count: int, last_timestamp: str, _entries: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Audit entries as a DataFrame.
+    
+    The entries themselves are not hashed; the demand ID, entry count, and
+    newest timestamp identify them since the log is append-only.
+    """
+    return pd.DataFrame(_entries, columns=["timestamp", "action", "tab_name", "field_name", "user"])
+
+
+@st.fragment
+def _render_audit_log_viewer():
+    """Audit trail viewer."""
+    if st.button("📋 View Audit Log", use_container_width=True):
+        with st.expander("🔍 Audit Trail", expanded=True):
+            audit_log = st.session_state.audit_log
+            if audit_log:
+                entries = tail(audit_log, 50)  # Show last 50
+                st.dataframe(
+                    _audit_frame(st.session_state.demand_id, len(audit_log), entries[-1]['timestamp'], entries),
+                    hide_index=True,
+                    use_container_width=True
+                )
+            else:
+                st.info("No audit entries yet")
+
+
+def _build_completion_details() -> str:
+    """Summarize per-phase completion, one line per phase."""
+    ss = st.session_state
+    details = get_completion_details({phase: ss[phase] for phase in PHASES})
+    
+    lines = []
+    for tab_name, info in details.items():
+        status_icon = "✅" if info["is_complete"] else "⏳"
+        lines.append(f"{status_icon} {tab_name.title()}: {info['filled_fields']}/{info['total_fields']} fields ({info['completion_percentage']}%)")
+    return "\n".join(lines)
+
+
+@st.fragment
+def _render_completion_details():
+    """Per-phase completion breakdown, computed only while shown."""
+    if st.toggle("📊 Show Completion Details", key="show_completion_details"):
+        st.text(_demand_memo("completion", _build_completion_details))
+
+
 def render_global_actions():
     """Render global export and audit actions."""
     st.divider()
@@ -2046,97 +1946,39 @@ def render_global_actions():
     
     # Export JSON
     with col1:
-        if st.button("📥 Export as JSON", use_container_width=True):
-            demand_data = {
-                "demand_id": st.session_state.demand_id,
-                "created_at": st.session_state.start_time.isoformat(),
-                "last_modified": st.session_state.last_modified.isoformat(),
-                "status": st.session_state.status,
-                "progress_percentage": st.session_state.progress_percentage,
-                "ideation": st.session_state.ideation,
-                "requirements": st.session_state.requirements,
-                "assessment": st.session_state.assessment,
-                "design": st.session_state.design,
-                "build": st.session_state.build,
-                "validation": st.session_state.validation,
-                "deployment": st.session_state.deployment,
-                "implementation": st.session_state.implementation,
-                "closing": st.session_state.closing,
-                "audit_log": st.session_state.audit_log
-            }
-            
-            json_str = export_to_json(demand_data)
-            
-            st.download_button(
-                label="💾 Download JSON",
-                data=json_str,
-                file_name=f"{st.session_state.demand_id}_demand.json",
-                mime="application/json"
-            )
+        _render_json_export()
     
     # Export Markdown
     with col2:
-        if st.button("📄 Export as Markdown", use_container_width=True):
-            demand_data = {
-                "demand_id": st.session_state.demand_id,
-                "created_at": st.session_state.start_time.isoformat(),
-                "status": st.session_state.status,
-                "progress_percentage": st.session_state.progress_percentage,
-                "ideation": st.session_state.ideation,
-                "requirements": st.session_state.requirements,
-                "assessment": st.session_state.assessment,
-                "design": st.session_state.design,
-                "build": st.session_state.build,
-                "validation": st.session_state.validation,
-                "deployment": st.session_state.deployment,
-                "implementation": st.session_state.implementation,
-                "closing": st.session_state.closing
-            }
-            
-            md_str = export_to_markdown(demand_data)
-            
-            st.download_button(
-                label="💾 Download Markdown",
-                data=md_str,
-                file_name=f"{st.session_state.demand_id}_report.md",
-                mime="text/markdown"
-            )
+        _render_markdown_export()
     
     # View Audit Log
     with col3:
-        if st.button("📋 View Audit Log", use_container_width=True):
-            with st.expander("🔍 Audit Trail", expanded=True):
-                if st.session_state.audit_log:
-                    for entry in st.session_state.audit_log[-50:]:  # Show last 50
-                        st.text(f"{entry['timestamp']} | {entry['action']}")
-                else:
-                    st.info("No audit entries yet")
+        _render_audit_log_viewer()
     
     # Completion details
-    with st.expander("📊 Completion Details"):
-        tabs_data = {
-            "ideation": st.session_state.ideation,
-            "requirements": st.session_state.requirements,
-            "assessment": st.session_state.assessment,
-            "design": st.session_state.design,
-            "build": st.session_state.build,
-            "validation": st.session_state.validation,
-            "deployment": st.session_state.deployment,
-            "implementation": st.session_state.implementation,
-            "closing": st.session_state.closing
-        }
-        
-        details = get_completion_details(tabs_data)
-        
-        for tab_name, info in details.items():
-            status_icon = "✅" if info["is_complete"] else "⏳"
-            st.text(f"{status_icon} {tab_name.title()}: {info['filled_fields']}/{info['total_fields']} fields ({info['completion_percentage']}%)")
+    _render_completion_details()
 
 
 # ============================================================================
 # MAIN APPLICATION
 # ============================================================================
 
+MAIN_TABS = {
+    "📂 All Demands": render_demands_overview,
+    "💡 Ideation": render_ideation_tab,
+    "📋 Requirements": render_requirements_tab,
+    "📊 Assessment": render_assessment_tab,
+    "🎨 Design": render_design_tab,
+    "🔨 Build": render_build_tab,
+    "🧪 Validation": render_validation_tab,
+    "🚀 Deployment": render_deployment_tab,
+    "📈 Implementation": render_implementation_tab,
+    "🎯 Closing": render_closing_tab,
+    "📅 Timeline": st.fragment(render_gantt_tab),
+}
+
+
 def main():
     """Main application entry point."""
     # Initialize
@@ -2148,57 +1990,26 @@ def main():
     # Render sidebar
     render_sidebar()
     
-    # Main tabs - Add Demands Overview as first tab, Timeline as last
-    tab0, tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10 = st.tabs([
-        "📂 All Demands",
-        "💡 Ideation",
-        "📋 Requirements",
-        "📊 Assessment",
-        "🎨 Design",
-        "🔨 Build",
-        "🧪 Validation",
-        "🚀 Deployment",
-        "📈 Implementation",
-        "🎯 Closing",
-        "📅 Timeline"
-    ])
-    
-    with tab0:
-        render_demands_overview()
-    
-    with tab1:
-        render_ideation_tab()
-    
-    with tab2:
-        render_requirements_tab()
-    
-    with tab3:
-        render_assessment_tab()
-    
-    with tab4:
-        render_design_tab()
-    
-    with tab5:
-        render_build_tab()
-    
-    with tab6:
-        render_validation_tab()
-    
-    with tab7:
-        render_deployment_tab()
-    
-    with tab8:
-        render_implementation_tab()
-    
-    with tab9:
-        render_closing_tab()
+    # Main tabs - Add Demands Overview as first tab, Timeline as last.
+    # A horizontal radio acts as the tab bar so only the active tab is rendered;
+    # st.tabs would build every tab body on each rerun.
+    active_tab = st.radio(
+        "Navigation",
+        list(MAIN_TABS),
+        key="active_tab",
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    st.divider()
     
-    with tab10:
-        render_gantt_tab()
+    MAIN_TABS[active_tab]()
     
     # Global actions
     render_global_actions()
     
+    # Background save of batched changes
+    render_autosave()
+    
     # Footer
     st.divider()
     st.caption(f"DemandForge v1.0 | © 2025 Salling Group | Demand ID: {st.session_state.demand_id}")
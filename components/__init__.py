@@ -13,15 +13,10 @@ from components.ai_chat import (
     render_chat_sidebar
 )
 
-from components.ai_chat import (
-    render_chat_sidebar,
-    render_chat_interface
-)
-
 __all__ = [
     'render_jira_test_setup',
     'render_test_case_generator',
     'render_test_plan_generator',
-    'render_chat_sidebar',
-    'render_chat_interface'
+    'render_ai_chat',
+    'render_chat_sidebar'
 ]
@@ -2,10 +2,268 @@
 AI Chat Component - Modern right-side chat interface
 """
 
+import hashlib
 import streamlit as st
+from collections.abc import Mapping
 from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
 from utils.validation import sanitize_html
-from utils.document_reader import get_attachment_content
+from utils.widget_state import PHASES, reset_widget_state
+from utils.retention import tail, prune_audit_log
+from utils.background import get_executor
+from utils.attachment_cache import cached_attachment_content
+
+try:
+    import mistune
+    MISTUNE_AVAILABLE = True
+except ImportError:
+    MISTUNE_AVAILABLE = False
+
+
+# Number of recent chat messages sent to the agent with each query
+CHAT_CONTEXT_MESSAGES = 20
+
+# Number of recent chat messages shown in the history panel
+CHAT_DISPLAY_MESSAGES = 15
+
+if MISTUNE_AVAILABLE:
+    # escape=True turns raw HTML in replies into text instead of passing it through
+    _render_markdown = mistune.create_markdown(escape=True, plugins=["strikethrough", "table"])
+
+# The chat stylesheet is a module constant so it is built once, not on every
+# rerun. It still has to be emitted on every run: Streamlit drops elements that
+# a rerun doesn't render, which would remove the styles.
+_CHAT_PANEL_CSS = """
+<style>
+    /* Adjust main content to make room for right panel */
+    section[data-testid="stSidebar"] {
+        position: fixed !important;
+        right: 0 !important;
+        left: auto !important;
+        width: 400px !important;
+    }
+    
+    /* Fix collapse button to collapse to the right */
+    section[data-testid="stSidebar"] > div:first-child {
+        transform: scaleX(-1) !important;
+    }
+    
+    section[data-testid="stSidebar"] > div:first-child > div {
+        transform: scaleX(-1) !important;
+    }
+    
+    /* Ensure sidebar collapses to the right */
+    section[data-testid="stSidebar"][aria-expanded="false"] {
+        transform: translateX(100%) !important;
+        right: -400px !important;
+    }
+    
+    .main .block-container {
+        margin-right: 420px !important;
+        margin-left: 20px !important;
+        transition: margin-right 0.3s ease;
+    }
+</style>
+"""
+
+
+def _inject_css(css: str):
+    """Emit a stylesheet constant."""
+    st.markdown(css, unsafe_allow_html=True)
+
+
+class _ContextView(Mapping):
+    """
+    Read-only agent context over the current demand.
+    
+    The demand ID and phase dicts are looked up in session_state when the
+    agent reads them instead of being copied into a new dict per message.
+    """
+    
+    __slots__ = ("_extra",)
+    
+    _SESSION_KEYS = ("demand_id",) + PHASES
+    
+    def __init__(self, extra: Dict[str, Any]):
+        self._extra = extra
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._extra:
+            return self._extra[key]
+        if key in self._SESSION_KEYS:
+            return st.session_state[key]
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self._SESSION_KEYS
+        yield from self._extra
+    
+    def __len__(self) -> int:
+        return len(self._SESSION_KEYS) + len(self._extra)
+
+
+def _audit(action: str, tab: Optional[str] = None, field: Optional[str] = None):
+    """Record a chat action in the audit log and mark the demand for saving."""
+    now = datetime.now()
+    st.session_state.audit_log.append({
+        "timestamp": now.isoformat(),
+        "user": "POC-User",
+        "action": action,
+        "trace_id": st.session_state.demand_id,
+        "tab_name": tab,
+        "field_name": field
+    })
+    prune_audit_log(st.session_state.audit_log)
+    st.session_state.last_modified = now
+    st.session_state.save_pending = True
+
+
+def _assistant_message(content: str) -> Dict[str, str]:
+    """
+    Build a chat history entry for an agent reply.
+    
+    Replies don't change once generated, so when mistune is installed the
+    markdown is converted to HTML here, once, instead of by the browser on
+    every rerun.
+    
+    Args:
+        content: Reply text (markdown)
+        
+    Returns:
+        Chat history entry
+    """
+    message = {
+        "role": "assistant",
+        "content": content,
+        "timestamp": datetime.now().isoformat()
+    }
+    if MISTUNE_AVAILABLE:
+        message["html"] = _render_markdown(content)
+    return message
+
+
+def _historical_hash() -> str:
+    """
+    Hash of the historical demands list, computed once per list.
+    
+    The list is replaced (not mutated) whenever demands are saved, so the
+    hash is memoized against the list object.
+    """
+    historical = st.session_state.get("historical_demands", [])
+    cached = st.session_state.get("historical_hash")
+    if cached is None or cached[0] is not historical:
+        digest = hashlib.blake2b(repr(historical).encode("utf-8"), digest_size=8).hexdigest()
+        cached = (historical, digest)
+        st.session_state.historical_hash = cached
+    return cached[1]
+
+
+# Agent quick actions report failures as text starting with this prefix
+_AGENT_ERROR_PREFIX = "❌ Error: "
+
+
+def _raise_on_agent_error(result):
+    """
+    Raise if an agent quick action returned its error text.
+    
+    st.cache_data only stores results that return normally, so raising keeps
+    a transient failure (429, timeout) from being replayed to every session.
+    
+    Args:
+        result: Agent result (text or list of texts)
+        
+    Returns:
+        The result unchanged if it is not an error
+    """
+    texts = result if isinstance(result, list) else [result]
+    for text in texts:
+        if isinstance(text, str) and text.startswith(_AGENT_ERROR_PREFIX):
+            raise RuntimeError(text[len(_AGENT_ERROR_PREFIX):])
+    return result
+
+
+# Quick-action results are cached on their inputs so repeated clicks skip the
+# LLM call. Underscore arguments (the agent and the historical list) are not
+# hashed; the agent type and historical hash stand in for them.
+@st.cache_data(ttl=1800, show_spinner=False, max_entries=32)
+def _cached_stories(agent_type: str, goals: str, historical_hash: str, _agent, _historical) -> List[str]:
+    """Suggest user stories for the goals."""
+    return _raise_on_agent_error(_agent.suggest_stories(goals, {"historical_demands": _historical}))
+
+
+@st.cache_data(ttl=1800, show_spinner=False, max_entries=32)
+def _cached_risks(agent_type: str, assessment: Dict, requirements: Dict, design: Dict,
+                  historical_hash: str, _agent, _historical) -> str:
+    """Predict risks for the current demand."""
+    return _raise_on_agent_error(_agent.predict_risks({
+        "assessment": assessment,
+        "requirements": requirements,
+        "design": design,
+        "historical_demands": _historical
+    }))
+
+
+@st.cache_data(ttl=1800, show_spinner=False, max_entries=32)
+def _cached_test_cases(agent_type: str, requirements: str, stories: str, _agent) -> str:
+    """Generate test cases from acceptance criteria and stories."""
+    return _raise_on_agent_error(_agent.generate_test_cases(requirements, stories))
+
+
+def _stories_text(*args) -> str:
+    """Suggest user stories and join them into the user stories field text."""
+    return "\n\n".join(_cached_stories(*args))
+
+
+# Quick actions run on the background executor: action -> (phase, field, audit action, notice)
+_QUICK_ACTIONS = {
+    "stories": ("requirements", "user_stories", "Generated user stories", "Stories generated!"),
+    "risks": ("assessment", "risks", "Generated risk predictions", "Risks generated!"),
+    "test_cases": ("validation", "test_cases", "Generated test cases", "Tests generated!"),
+}
+
+
+def _start_quick_action(action: str, fn, *args):
+    """
+    Submit a quick-action generator to the background executor.
+    
+    Args:
+        action: Key in _QUICK_ACTIONS
+        fn: Function returning the field text
+        *args: Arguments for fn (copied phase data, not live session dicts)
+    """
+    futures = st.session_state.setdefault("quick_action_futures", {})
+    futures[action] = get_executor().submit(fn, *args)
+
+
+@st.fragment(run_every=1)
+def _render_quick_action_status():
+    """Poll background quick actions and fill in their phase fields when they finish."""
+    ss = st.session_state
+    futures = ss.get("quick_action_futures")
+    if not futures:
+        return
+    
+    notices = ss.setdefault("quick_action_notices", [])
+    for action, future in list(futures.items()):
+        if not future.done():
+            continue
+        del futures[action]
+        phase, field, audit_action, notice = _QUICK_ACTIONS[action]
+        try:
+            ss[phase][field] = future.result()
+        except Exception as e:
+            notices.append((f"Error generating response: {str(e)}", "❌"))
+            continue
+        reset_widget_state(phase, [field])
+        _audit(audit_action, phase, field)
+        notices.append((notice, "✅"))
+    
+    if futures:
+        st.caption("🤖 Generating...")
+        return
+    
+    # Full rerun stops the polling fragment and shows the new values in their tabs
+    st.rerun()
 
 
 def render_ai_chat():
@@ -24,215 +282,12 @@ def render_ai_chat():
 def render_chat_right_panel():
     """Render chat as a floating panel on the right side."""
     # Add custom CSS for right panel
-    st.markdown("""
-    <style>
-        /* Adjust main content to make room for right panel */
-        section[data-testid="stSidebar"] {
-            position: fixed !important;
-            right: 0 !important;
-            left: auto !important;
-            width: 400px !important;
-        }
-        
-        /* Fix collapse button to collapse to the right */
-        section[data-testid="stSidebar"] > div:first-child {
-            transform: scaleX(-1) !important;
-        }
-        
-        section[data-testid="stSidebar"] > div:first-child > div {
-            transform: scaleX(-1) !important;
-        }
-        
-        /* Ensure sidebar collapses to the right */
-        section[data-testid="stSidebar"][aria-expanded="false"] {
-            transform: translateX(100%) !important;
-            right: -400px !important;
-        }
-        
-        .main .block-container {
-            margin-right: 420px !important;
-            margin-left: 20px !important;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    _inject_css(_CHAT_PANEL_CSS)
     
     # Use the sidebar to render on the right
     render_chat_sidebar()
 
 
-def render_chat_interface():
-    """Render a modern, collapsible chat interface on the right side."""
-    
-    # Initialize chat visibility state
-    if "chat_visible" not in st.session_state:
-        st.session_state.chat_visible = True
-    if "chat_minimized" not in st.session_state:
-        st.session_state.chat_minimized = False
-    
-    # Add custom CSS for right panel chat interface
-    st.markdown("""
-    <style>
-        /* Right panel chat container */
-        .right-chat-panel {
-            position: fixed;
-            right: 0;
-            top: 60px;
-            bottom: 0;
-            width: 400px;
-            background: white;
-            border-left: 2px solid #e2e8f0;
-            box-shadow: -4px 0 12px rgba(0,0,0,0.1);
-            z-index: 999;
-            display: flex;
-            flex-direction: column;
-            overflow: hidden;
-        }
-        
-        /* Adjust main content to not overlap with chat */
-        .main .block-container {
-            margin-right: 420px !important;
-        }
-        
-        /* Chat toggle button - floating on right */
-        .chat-fab {
-            position: fixed;
-            right: 20px;
-            bottom: 20px;
-            z-index: 1001;
-            width: 56px;
-            height: 56px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-            cursor: pointer;
-            font-size: 1.5rem;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.3s ease;
-        }
-        .chat-fab:hover {
-            transform: scale(1.1);
-            box-shadow: 0 6px 16px rgba(0,0,0,0.2);
-        }
-        
-        /* Chat panel - slides in from right */
-        .chat-panel {
-            position: fixed;
-            right: 0;
-            top: 0;
-            height: 100vh;
-            width: 400px;
-            background: white;
-            border-left: 1px solid #e2e8f0;
-            box-shadow: -2px 0 8px rgba(0,0,0,0.1);
-            z-index: 1000;
-            display: flex;
-            flex-direction: column;
-            transition: transform 0.3s ease;
-        }
-        .chat-panel.hidden {
-            transform: translateX(100%);
-        }
-        .chat-panel.minimized {
-            height: 60px;
-            bottom: 0;
-            top: auto;
-            border-radius: 12px 0 0 0;
-        }
-        
-        /* Chat header */
-        .chat-header {
-            padding: 1rem;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            border-bottom: 1px solid rgba(255,255,255,0.1);
-        }
-        .chat-header-title {
-            font-size: 1rem;
-            font-weight: 600;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-        .chat-header-actions {
-            display: flex;
-            gap: 0.5rem;
-        }
-        .chat-header-btn {
-            background: rgba(255,255,255,0.2);
-            border: none;
-            border-radius: 6px;
-            padding: 0.25rem 0.5rem;
-            color: white;
-            cursor: pointer;
-            font-size: 0.9rem;
-            transition: background 0.2s;
-        }
-        .chat-header-btn:hover {
-            background: rgba(255,255,255,0.3);
-        }
-        
-        /* Make main content aware of chat panel */
-        .main .block-container {
-            margin-right: 0;
-            transition: margin-right 0.3s ease;
-        }
-        .main .block-container.chat-open {
-            margin-right: 400px;
-        }
-        
-        /* Agent badge */
-        .agent-badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.25rem;
-            padding: 0.25rem 0.5rem;
-            background: rgba(255,255,255,0.2);
-            border-radius: 12px;
-            font-size: 0.75rem;
-            font-weight: 500;
-        }
-        
-        /* Quick action buttons */
-        .quick-actions {
-            padding: 0.75rem;
-            border-top: 1px solid #e2e8f0;
-            background: #f8fafc;
-        }
-        .quick-action-btn {
-            width: 100%;
-            margin-bottom: 0.5rem;
-            font-size: 0.85rem;
-            padding: 0.5rem;
-            border-radius: 6px;
-        }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    # Determine chat state CSS classes
-    chat_class = "chat-panel"
-    if not st.session_state.chat_visible:
-        chat_class += " hidden"
-    elif st.session_state.chat_minimized:
-        chat_class += " minimized"
-    
-    # Right panel HTML container
-    st.markdown('''
-        <div class="right-chat-panel" id="rightChatPanel">
-            <div style="padding: 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white;">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <span style="font-size: 1.1rem; font-weight: 600;">🤖 AI Co-Pilot</span>
-                </div>
-            </div>
-        </div>
-    ''', unsafe_allow_html=True)
-    
 def render_chat_sidebar():
     """Render the chat sidebar in Streamlit's sidebar (left or right side)."""
     with st.sidebar:
@@ -242,12 +297,12 @@ def render_chat_sidebar():
             st.markdown("### 🤖 AI Co-Pilot")
         with col2:
             # Position toggle - universal switch button
-            current_side = "right" if st.session_state.get("chat_on_right", True) else "left"
+            on_right = st.session_state.get("chat_on_right", True)
             switch_icon = "🔄"
-            help_text = f"Switch to {'left' if current_side == 'right' else 'right'} side"
+            help_text = f"Switch to {'left' if on_right else 'right'} side"
             
             if st.button(switch_icon, help=help_text, key="chat_switch_side"):
-                st.session_state.chat_on_right = not st.session_state.get("chat_on_right", True)
+                st.session_state.chat_on_right = not on_right
                 st.rerun()
         
         # Show which AI is active
@@ -264,151 +319,132 @@ def render_chat_sidebar():
         
         st.divider()
         
-        # Chat container with reduced height for cleaner look
-        chat_container = st.container(height=300)
-        
-        with chat_container:
-            # Display recent messages (last 15 for cleaner view)
-            for msg in st.session_state.chat_history[-15:]:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                
-                with st.chat_message(role):
-                    # Simple markdown without HTML sanitization for now
+        _render_chat_body()
+
+
+@st.fragment
+def _render_chat_body():
+    """
+    Chat history, input and quick actions.
+    
+    Runs as a fragment so sending a message only reruns the chat. A new
+    exchange is drawn below the history and the reply is streamed in, so
+    it shows up without another rerun. Quick actions run on the background
+    executor; a polling fragment fills in the phase fields when they finish.
+    """
+    ss = st.session_state
+    chat_history = ss.chat_history
+    agent = ss.agent
+    agent_type = ss.get("agent_type", "Mock")
+    
+    # Results of background quick actions that finished since the last run
+    for notice, icon in ss.pop("quick_action_notices", []):
+        st.toast(notice, icon=icon)
+    
+    # Chat container with reduced height for cleaner look
+    chat_container = st.container(height=300)
+    
+    # Chat input
+    user_query = st.chat_input("Ask me anything...", max_chars=1000)
+    
+    with chat_container:
+        # Display recent messages (last 15 for cleaner view)
+        for msg in tail(chat_history, CHAT_DISPLAY_MESSAGES):
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            
+            with st.chat_message(role):
+                if "html" in msg:
+                    st.html(msg["html"])
+                else:
                     st.markdown(content)
+    
+    if user_query:
+        # Add user message
+        chat_history.append({
+            "role": "user",
+            "content": user_query,
+            "timestamp": datetime.now().isoformat()
+        })
         
-        # Chat input
-        user_query = st.chat_input("Ask me anything...", max_chars=1000)
-        
-        if user_query:
-            # Add user message
-            st.session_state.chat_history.append({
-                "role": "user",
-                "content": user_query,
-                "timestamp": datetime.now().isoformat()
-            })
+        with chat_container:
+            with st.chat_message("user"):
+                st.markdown(user_query)
             
             # Get current tab's attachments for context
-            current_tab_key = st.session_state.get("current_tab", "ideation").lower()
-            attachments = st.session_state.get("attachments", {})
-            tab_attachments = attachments.get(current_tab_key, {"files": [], "urls": []})
+            current_tab = ss.get("current_tab", "Ideation")
+            tab_attachments = ss.get("attachments", {}).get(current_tab.lower(), {"files": [], "urls": []})
+            files = tab_attachments.get("files", [])
+            urls = tab_attachments.get("urls", [])
             
             # Extract content from attachments
-            with st.spinner("🤖 Reading documents..."):
-                from utils.document_reader import get_attachment_content
-                attachment_content = get_attachment_content(
-                    tab_attachments.get("files", []),
-                    tab_attachments.get("urls", [])
-                )
+            attachment_content = ""
+            if files or urls:
+                with st.spinner("🤖 Reading documents..."):
+                    attachment_content = cached_attachment_content(files, urls)
             
             # Build context with historical demands for RAG
-            context = {
-                "demand_id": st.session_state.demand_id,
-                "ideation": st.session_state.ideation,
-                "requirements": st.session_state.requirements,
-                "assessment": st.session_state.assessment,
-                "design": st.session_state.design,
-                "build": st.session_state.build,
-                "validation": st.session_state.validation,
-                "deployment": st.session_state.deployment,
-                "implementation": st.session_state.implementation,
-                "closing": st.session_state.closing,
-                "current_tab": st.session_state.get("current_tab", "Ideation"),
-                "historical_demands": st.session_state.get("historical_demands", []),
+            context = _ContextView({
+                "current_tab": current_tab,
+                "historical_demands": ss.get("historical_demands", []),
+                "historical_demands_hash": _historical_hash(),
                 "attachments": attachment_content
-            }
-            
-            response = st.session_state.agent.generate(
-                user_query,
-                context,
-                st.session_state.chat_history
-            )
-            
-            # Add AI response
-            st.session_state.chat_history.append({
-                "role": "assistant",
-                "content": response,
-                "timestamp": datetime.now().isoformat()
             })
             
-            # Add to audit log directly
-            entry = {
-                "timestamp": datetime.now().isoformat(),
-                "user": "POC-User",
-                "action": f"AI query: {user_query[:50]}...",
-                "trace_id": st.session_state.demand_id,
-                "tab_name": None,
-                "field_name": None
-            }
-            st.session_state.audit_log.append(entry)
-            st.session_state.last_modified = datetime.now()
-            st.rerun()
-        
-        st.divider()
+            # Stream the response into the chat as it is generated
+            with st.chat_message("assistant"):
+                response = st.write_stream(agent.stream(
+                    user_query,
+                    context,
+                    tail(chat_history, CHAT_CONTEXT_MESSAGES)
+                ))
         
-        # Compact quick actions
-        st.markdown("**Quick Actions**")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("💡 Stories", help="Generate User Stories", use_container_width=True):
-                goals = st.session_state.ideation.get("goals", "")
-                context = {"historical_demands": st.session_state.get("historical_demands", [])}
-                stories = st.session_state.agent.suggest_stories(goals, context)
-                st.session_state.requirements["user_stories"] = "\n\n".join(stories)
-                # Add to audit log directly
-                entry = {
-                    "timestamp": datetime.now().isoformat(),
-                    "user": "POC-User",
-                    "action": "Generated user stories",
-                    "trace_id": st.session_state.demand_id,
-                    "tab_name": "requirements",
-                    "field_name": "user_stories"
-                }
-                st.session_state.audit_log.append(entry)
-                st.session_state.last_modified = datetime.now()
-                st.success("Stories generated!")
-                st.rerun()
+        # Add AI response
+        chat_history.append(_assistant_message(response))
         
-        with col2:
-            if st.button("⚠️ Risks", help="Predict Risks", use_container_width=True):
-                project_data = {
-                    "assessment": st.session_state.assessment,
-                    "requirements": st.session_state.requirements,
-                    "design": st.session_state.design,
-                    "historical_demands": st.session_state.get("historical_demands", [])
-                }
-                risks = st.session_state.agent.predict_risks(project_data)
-                st.session_state.assessment["risks"] = risks
-                # Add to audit log directly
-                entry = {
-                    "timestamp": datetime.now().isoformat(),
-                    "user": "POC-User",
-                    "action": "Generated risk predictions",
-                    "trace_id": st.session_state.demand_id,
-                    "tab_name": "assessment",
-                    "field_name": "risks"
-                }
-                st.session_state.audit_log.append(entry)
-                st.session_state.last_modified = datetime.now()
-                st.success("Risks generated!")
-                st.rerun()
-        
-        if st.button("🧪 Test Cases", help="Generate Test Cases", use_container_width=True):
-            requirements = st.session_state.requirements.get("acceptance_criteria", "")
-            stories = st.session_state.requirements.get("user_stories", "")
-            tests = st.session_state.agent.generate_test_cases(requirements, stories)
-            st.session_state.validation["test_cases"] = tests
-            # Add to audit log directly
-            entry = {
-                "timestamp": datetime.now().isoformat(),
-                "user": "POC-User",
-                "action": "Generated test cases",
-                "trace_id": st.session_state.demand_id,
-                "tab_name": "validation",
-                "field_name": "test_cases"
-            }
-            st.session_state.audit_log.append(entry)
-            st.session_state.last_modified = datetime.now()
-            st.success("Tests generated!")
-            st.rerun()
+        _audit(f"AI query: {user_query[:50]}...")
+    
+    st.divider()
+    
+    # Compact quick actions
+    st.markdown("**Quick Actions**")
+    
+    requirements = ss.requirements
+    pending = ss.get("quick_action_futures", {})
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("💡 Stories", help="Generate User Stories", use_container_width=True,
+                     disabled="stories" in pending):
+            _start_quick_action(
+                "stories", _stories_text,
+                agent_type, ss.ideation.get("goals", ""), _historical_hash(), agent,
+                ss.get("historical_demands", [])
+            )
+    
+    with col2:
+        if st.button("⚠️ Risks", help="Predict Risks", use_container_width=True,
+                     disabled="risks" in pending):
+            _start_quick_action(
+                "risks", _cached_risks,
+                agent_type,
+                dict(ss.assessment),
+                dict(requirements),
+                dict(ss.design),
+                _historical_hash(),
+                agent,
+                ss.get("historical_demands", [])
+            )
+    
+    if st.button("🧪 Test Cases", help="Generate Test Cases", use_container_width=True,
+                 disabled="test_cases" in pending):
+        _start_quick_action(
+            "test_cases", _cached_test_cases,
+            agent_type,
+            requirements.get("acceptance_criteria", ""),
+            requirements.get("user_stories", ""),
+            agent
+        )
+    
+    if ss.get("quick_action_futures"):
+        _render_quick_action_status()
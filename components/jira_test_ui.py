@@ -3,17 +3,122 @@ JIRA Test Case Management UI Component
 UI for generating and uploading test cases to JIRA.
 """
 
+import hashlib
+import re
 import streamlit as st
+from dataclasses import replace
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import List, Sequence, Tuple
 import os
 
+from integrations.jira_test_client import GeneratedTestCase, JiraClient, TestCaseGenerator
+from utils.attachment_cache import cached_attachment_content
+from utils.audit import audit
+from utils.widget_state import seed_widget
+
+
+# Cheap shape checks so malformed connection details fail before any network call
+_URL_RE = re.compile(r"^https?://[^\s/]+")
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Demand fields the test plan prompt reads (instead of copying all of session_state)
+_TEST_PLAN_KEYS = ("demand_id", "demand_name", "ideation", "requirements", "design", "validation")
+
+
+def _token_fingerprint(token: str) -> str:
+    """Fingerprint an API token for use in cache keys, so the raw token is never a key."""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@st.cache_resource(show_spinner=False, max_entries=16, ttl=3600)
+def _get_jira_client(jira_url: str, jira_email: str, token_hash: str, _jira_token: str):
+    """
+    Return a shared JIRA client for these credentials.
+    
+    One client (and its pooled HTTP session) is reused across reruns and
+    sessions instead of opening new connections on every form submit.
+    Entries hold the API token, so they expire after an hour, at most 16
+    are kept, and failed or disconnected credentials are evicted.
+    
+    Args:
+        jira_url: JIRA base URL
+        jira_email: Account email
+        token_hash: Fingerprint of the API token (cache key)
+        _jira_token: API token (not hashed by Streamlit)
+        
+    Returns:
+        JiraClient instance
+    """
+    return JiraClient(jira_url, _jira_token, jira_email)
+
+
+def _evict_jira_client(jira_url: str, jira_email: str, token_hash: str, jira_token: str):
+    """Drop the shared client for these credentials from the cache."""
+    _get_jira_client.clear(jira_url, jira_email, token_hash, jira_token)
+
+
+def _on_jira_connect():
+    """
+    Save the connection form and test the connection.
+    
+    Runs as the submit button callback, before the script reruns, so the
+    stored credentials and connection state are already current when the
+    form is drawn again. Messages are queued for render_jira_test_setup.
+    """
+    ss = st.session_state
+    jira_url = ss["jira_form.url"]
+    jira_email = ss["jira_form.email"]
+    jira_token = ss["jira_form.token"]
+    messages = ss.jira_connection_messages = []
+    
+    if not (jira_url and jira_email and jira_token):
+        messages.append(("warning", "⚠️ Please fill in all connection details"))
+        return
+    
+    if not _URL_RE.match(jira_url) or not _EMAIL_RE.match(jira_email):
+        messages.append(("error", "❌ Invalid JIRA URL or email address"))
+        return
+    
+    # Store in session state
+    ss.jira_url = jira_url
+    ss.jira_email = jira_email
+    ss.jira_token = jira_token
+    ss.jira_project_key = ss["jira_form.project_key"]
+    
+    # Fingerprint the token once; the shared client cache is keyed on it
+    token_hash = ss.jira_token_fp = _token_fingerprint(jira_token)
+    
+    try:
+        jira = _get_jira_client(jira_url, jira_email, token_hash, jira_token)
+        result = jira.test_connection()
+        
+        if result.get('success'):
+            ss.jira_connected = True
+            ss.jira_client = jira
+            messages.append(("success", f"✅ Connected to JIRA as {result.get('user', 'Unknown')}"))
+            
+            # Get projects (the shared client caches the list)
+            projects = jira.get_projects()
+            if projects:
+                ss.jira_projects = projects
+                messages.append(("info", f"📂 Found {len(projects)} project(s)"))
+        else:
+            messages.append(("error", f"❌ Connection failed: {result.get('message', 'Unknown error')}"))
+            ss.jira_connected = False
+            _evict_jira_client(jira_url, jira_email, token_hash, jira_token)
+            
+    except Exception as e:
+        messages.append(("error", f"❌ Error: {str(e)}"))
+        ss.jira_connected = False
+        _evict_jira_client(jira_url, jira_email, token_hash, jira_token)
+
 
 def render_jira_test_setup():
     """Render JIRA connection setup section."""
+    ss = st.session_state
     st.subheader("🔗 JIRA Connection Setup")
     
-    with st.expander("⚙️ Configure JIRA Connection", expanded=not st.session_state.get('jira_connected', False)):
+    with st.expander("⚙️ Configure JIRA Connection", expanded=not ss.get('jira_connected', False)):
         st.markdown("""
         **How to get your JIRA API Token:**
         1. Go to https://id.atlassian.com/manage-profile/security/api-tokens
@@ -30,32 +135,32 @@ def render_jira_test_setup():
             col1, col2 = st.columns(2)
             
             with col1:
-                jira_url = st.text_input(
+                st.text_input(
                     "JIRA Base URL",
-                    value=st.session_state.get('jira_url', ''),
+                    key=seed_widget("jira_form.url", ss.get('jira_url', '')),
                     placeholder="https://your-domain.atlassian.net",
                     help="Your JIRA instance URL"
                 )
                 
-                jira_email = st.text_input(
+                st.text_input(
                     "Email",
-                    value=st.session_state.get('jira_email', ''),
+                    key=seed_widget("jira_form.email", ss.get('jira_email', '')),
                     placeholder="your-email@company.com",
                     help="Email associated with your JIRA account"
                 )
             
             with col2:
-                jira_token = st.text_input(
+                st.text_input(
                     "API Token",
                     type="password",
-                    value=st.session_state.get('jira_token', ''),
+                    key=seed_widget("jira_form.token", ss.get('jira_token', '')),
                     placeholder="Your JIRA API token",
                     help="API token from JIRA settings"
                 )
                 
-                jira_project = st.text_input(
+                st.text_input(
                     "Project Key",
-                    value=st.session_state.get('jira_project_key', ''),
+                    key=seed_widget("jira_form.project_key", ss.get('jira_project_key', '')),
                     placeholder="PROJ",
                     help="JIRA project key (e.g., PROJ, TEST, DEV)"
                 )
@@ -63,50 +168,20 @@ def render_jira_test_setup():
             col1, col2 = st.columns([1, 3])
             
             with col1:
-                save_connection = st.form_submit_button("💾 Save & Test Connection", use_container_width=True)
-            
-            if save_connection:
-                if jira_url and jira_email and jira_token:
-                    # Store in session state
-                    st.session_state.jira_url = jira_url
-                    st.session_state.jira_email = jira_email
-                    st.session_state.jira_token = jira_token
-                    st.session_state.jira_project_key = jira_project
-                    
-                    # Test connection
-                    from integrations.jira_test_client import JiraClient
-                    
-                    try:
-                        jira = JiraClient(jira_url, jira_token, jira_email)
-                        result = jira.test_connection()
-                        
-                        if result.get('success'):
-                            st.session_state.jira_connected = True
-                            st.session_state.jira_client = jira
-                            st.success(f"✅ Connected to JIRA as {result.get('user', 'Unknown')}")
-                            
-                            # Get projects
-                            projects = jira.get_projects()
-                            if projects:
-                                st.session_state.jira_projects = projects
-                                st.info(f"📂 Found {len(projects)} project(s)")
-                        else:
-                            st.error(f"❌ Connection failed: {result.get('message', 'Unknown error')}")
-                            st.session_state.jira_connected = False
-                            
-                    except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
-                        st.session_state.jira_connected = False
-                else:
-                    st.warning("⚠️ Please fill in all connection details")
+                st.form_submit_button("💾 Save & Test Connection", use_container_width=True, on_click=_on_jira_connect)
+    
+    # Result of the last connection test
+    for kind, message in ss.pop("jira_connection_messages", []):
+        getattr(st, kind)(message)
     
     # Show connection status
-    if st.session_state.get('jira_connected'):
-        st.success(f"✅ Connected to JIRA: {st.session_state.get('jira_url', 'Unknown')}")
+    if ss.get('jira_connected'):
+        st.success(f"✅ Connected to JIRA: {ss.get('jira_url', 'Unknown')}")
         
         if st.button("🔌 Disconnect"):
-            st.session_state.jira_connected = False
-            st.session_state.jira_client = None
+            ss.jira_connected = False
+            ss.jira_client = None
+            _evict_jira_client(ss.jira_url, ss.jira_email, ss.jira_token_fp, ss.jira_token)
             st.rerun()
     else:
         st.warning("⚠️ JIRA not connected. Configure connection above to use test case features.")
@@ -125,276 +200,251 @@ def render_test_case_generator():
     tab1, tab2 = st.tabs(["📝 Manual Test Cases", "⚙️ Automated Test Cases"])
     
     with tab1:
-        render_manual_test_generation()
+        _render_test_generation("manual")
     
     with tab2:
-        render_automated_test_generation()
+        _render_test_generation("automated")
 
 
-def render_manual_test_generation():
-    """Render manual test case generation UI."""
-    st.markdown("**Generate Manual Test Cases from Requirements**")
-    
-    # Check if requirements exist
-    requirements = st.session_state.get('requirements', {})
-    user_stories = requirements.get('user_stories', '')
-    acceptance_criteria = requirements.get('acceptance_criteria', '')
+@st.fragment
+def _render_test_case(idx: int, test: GeneratedTestCase, label: str, height: int, key_prefix: str):
+    """
+    Render one generated test case with its editable description.
     
-    if not user_stories and not acceptance_criteria:
-        st.warning("⚠️ No requirements found. Please fill in the Requirements tab first.")
-        return
+    Runs as a fragment so editing one test case doesn't rerun the others.
     
-    col1, col2 = st.columns([3, 1])
-    
-    with col1:
-        st.text_area(
-            "User Stories",
-            value=user_stories,
-            height=100,
-            disabled=True,
-            help="From Requirements phase"
+    Args:
+        idx: Position in the generated list
+        test: Generated test case
+        label: Label for the description text area
+        height: Text area height in pixels
+        key_prefix: Widget key prefix; the upload reads edits from "<prefix>_<idx>"
+    """
+    with st.expander(f"Test Case {idx + 1}: {test.summary or 'Untitled'}"):
+        # One markdown element (trailing double spaces break lines) instead of four
+        st.markdown(
+            f"**Type:** {test.test_type}  \n"
+            f"**Priority:** {test.priority}  \n"
+            f"**Labels:** {', '.join(test.labels)}  \n"
+            "**Description:**"
         )
-        
         st.text_area(
-            "Acceptance Criteria",
-            value=acceptance_criteria,
-            height=100,
-            disabled=True,
-            help="From Requirements phase"
-        )
-    
-    with col2:
-        num_tests = st.number_input(
-            "Number of Test Cases",
-            min_value=1,
-            max_value=20,
-            value=5,
-            help="How many test cases to generate"
-        )
-        
-        priority = st.selectbox(
-            "Default Priority",
-            ["High", "Medium", "Low"],
-            index=1
+            label,
+            value=test.description,
+            height=height,
+            key=f"{key_prefix}_{idx}",
+            help="Edit if needed before uploading"
         )
-    
-    if st.button("🤖 Generate Manual Test Cases", type="primary", use_container_width=True):
-        with st.spinner("🤖 AI is generating manual test cases..."):
-            from integrations.jira_test_client import TestCaseGenerator
-            
-            # Get attachment content for context
-            from utils.document_reader import get_attachment_content
-            
-            attachments = st.session_state.get("attachments", {})
-            req_attachments = attachments.get("requirements", {"files": [], "urls": []})
-            attachment_content = get_attachment_content(
-                req_attachments.get("files", []),
-                req_attachments.get("urls", [])
-            )
-            
-            context = {
-                "demand_name": st.session_state.get('demand_name', ''),
-                "ideation": st.session_state.get('ideation', {}),
-                "requirements": requirements,
-                "attachments": attachment_content,
-                "num_tests": num_tests
-            }
-            
-            test_cases = TestCaseGenerator.generate_manual_test_cases(
-                st.session_state.agent,
-                user_stories,
-                acceptance_criteria,
-                context
-            )
-            
-            # Store generated test cases
-            st.session_state.generated_manual_tests = test_cases
-            st.success(f"✅ Generated {len(test_cases)} manual test cases!")
-            st.rerun()
-    
-    # Display generated test cases
-    if st.session_state.get('generated_manual_tests'):
-        st.divider()
-        st.markdown("### 📋 Generated Manual Test Cases")
-        
-        test_cases = st.session_state.generated_manual_tests
-        
-        for idx, test in enumerate(test_cases):
-            with st.expander(f"Test Case {idx + 1}: {test.get('summary', 'Untitled')}"):
-                st.markdown(f"**Type:** {test.get('test_type', 'Manual')}")
-                st.markdown(f"**Priority:** {test.get('priority', 'Medium')}")
-                st.markdown(f"**Labels:** {', '.join(test.get('labels', []))}")
-                st.markdown("**Description:**")
-                st.text_area(
-                    "Test Steps",
-                    value=test.get('description', ''),
-                    height=200,
-                    key=f"manual_test_{idx}",
-                    help="Edit if needed before uploading"
-                )
-        
-        # Upload to JIRA
-        col1, col2, col3 = st.columns([2, 2, 1])
-        
-        with col1:
-            if st.button("📤 Upload All to JIRA", type="primary", use_container_width=True):
-                upload_test_cases_to_jira(test_cases, "Manual")
-        
-        with col2:
-            if st.button("🗑️ Clear Generated Tests", use_container_width=True):
-                del st.session_state.generated_manual_tests
-                st.rerun()
 
 
-def render_automated_test_generation():
-    """Render automated test case generation UI."""
-    st.markdown("**Generate Automated Test Cases from Design**")
+# Manual and automated generation differ only in their inputs and labels
+_TEST_GENERATION = {
+    "manual": {
+        "title": "**Generate Manual Test Cases from Requirements**",
+        "phase": "requirements",
+        "sources": (
+            ("user_stories", "User Stories", 100),
+            ("acceptance_criteria", "Acceptance Criteria", 100),
+        ),
+        "missing": "⚠️ No requirements found. Please fill in the Requirements tab first.",
+        "source_help": "From Requirements phase",
+        "num_tests": {"max_value": 20, "value": 5, "help": "How many test cases to generate"},
+        "option": {"label": "Default Priority", "options": ["High", "Medium", "Low"], "index": 1},
+        "option_context_key": None,
+        "context_phases": ("ideation", "requirements"),
+        "button": "🤖 Generate Manual Test Cases",
+        "spinner": "🤖 AI is generating manual test cases...",
+        "generator": TestCaseGenerator.generate_manual_test_cases,
+        "session_key": "generated_manual_tests",
+        "test_type": "Manual",
+        "heading": "### 📋 Generated Manual Test Cases",
+        "text_label": "Test Steps",
+        "text_height": 200,
+        "key_prefix": "manual_test",
+    },
+    "automated": {
+        "title": "**Generate Automated Test Cases from Design**",
+        "phase": "design",
+        "sources": (
+            ("architecture_design", "Architecture Design", 100),
+            ("technical_stack", "Technical Stack", 80),
+        ),
+        "missing": "⚠️ No design information found. Please fill in the Design tab first.",
+        "source_help": "From Design phase",
+        "num_tests": {"max_value": 30, "value": 10, "help": "How many automated tests to generate"},
+        "option": {
+            "label": "Test Framework",
+            "options": ["pytest", "unittest", "selenium", "playwright", "cypress"],
+            "help": "Preferred testing framework"
+        },
+        "option_context_key": "framework",
+        "context_phases": ("design",),
+        "button": "🤖 Generate Automated Test Cases",
+        "spinner": "🤖 AI is generating automated test cases...",
+        "generator": TestCaseGenerator.generate_automated_test_cases,
+        "session_key": "generated_automated_tests",
+        "test_type": "Automated",
+        "heading": "### ⚙️ Generated Automated Test Cases",
+        "text_label": "Test Implementation",
+        "text_height": 250,
+        "key_prefix": "auto_test",
+    },
+}
+
+
+def _render_test_generation(kind: str):
+    """
+    Render the test case generation UI for one kind of test.
+    
+    Args:
+        kind: "manual" (from requirements) or "automated" (from design)
+    """
+    ss = st.session_state
+    config = _TEST_GENERATION[kind]
+    st.markdown(config["title"])
     
-    # Check if design exists
-    design = st.session_state.get('design', {})
-    architecture = design.get('architecture_design', '')
-    tech_stack = design.get('technical_stack', '')
+    # Check if the source phase has been filled in
+    phase_data = ss.get(config["phase"], {})
+    sources = [phase_data.get(field, '') for field, _, _ in config["sources"]]
     
-    if not architecture and not tech_stack:
-        st.warning("⚠️ No design information found. Please fill in the Design tab first.")
+    if not any(sources):
+        st.warning(config["missing"])
         return
     
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        st.text_area(
-            "Architecture Design",
-            value=architecture,
-            height=100,
-            disabled=True,
-            help="From Design phase"
-        )
-        
-        st.text_area(
-            "Technical Stack",
-            value=tech_stack,
-            height=80,
-            disabled=True,
-            help="From Design phase"
-        )
+        for (_, label, height), value in zip(config["sources"], sources):
+            st.text_area(
+                label,
+                value=value,
+                height=height,
+                disabled=True,
+                help=config["source_help"]
+            )
     
     with col2:
-        num_tests = st.number_input(
-            "Number of Test Cases",
-            min_value=1,
-            max_value=30,
-            value=10,
-            help="How many automated tests to generate"
-        )
-        
-        test_framework = st.selectbox(
-            "Test Framework",
-            ["pytest", "unittest", "selenium", "playwright", "cypress"],
-            help="Preferred testing framework"
-        )
+        num_tests = st.number_input("Number of Test Cases", min_value=1, **config["num_tests"])
+        option = st.selectbox(**config["option"])
     
-    if st.button("🤖 Generate Automated Test Cases", type="primary", use_container_width=True):
-        with st.spinner("🤖 AI is generating automated test cases..."):
-            from integrations.jira_test_client import TestCaseGenerator
-            from utils.document_reader import get_attachment_content
-            
+    if st.button(config["button"], type="primary", use_container_width=True):
+        with st.spinner(config["spinner"]):
             # Get attachment content for context
-            attachments = st.session_state.get("attachments", {})
-            design_attachments = attachments.get("design", {"files": [], "urls": []})
-            attachment_content = get_attachment_content(
-                design_attachments.get("files", []),
-                design_attachments.get("urls", [])
+            attachments = ss.get("attachments", {})
+            phase_attachments = attachments.get(config["phase"], {"files": [], "urls": []})
+            attachment_content = cached_attachment_content(
+                phase_attachments.get("files", []),
+                phase_attachments.get("urls", [])
             )
             
-            context = {
-                "demand_name": st.session_state.get('demand_name', ''),
-                "design": design,
-                "attachments": attachment_content,
-                "num_tests": num_tests,
-                "framework": test_framework
-            }
+            context = {"demand_name": ss.get('demand_name', '')}
+            for phase in config["context_phases"]:
+                context[phase] = ss.get(phase, {})
+            context["attachments"] = attachment_content
+            context["num_tests"] = num_tests
+            if config["option_context_key"]:
+                context[config["option_context_key"]] = option
             
-            test_cases = TestCaseGenerator.generate_automated_test_cases(
-                st.session_state.agent,
-                architecture,
-                tech_stack,
-                context
-            )
+            test_cases = config["generator"](ss.agent, *sources, context)
             
             # Store generated test cases
-            st.session_state.generated_automated_tests = test_cases
-            st.success(f"✅ Generated {len(test_cases)} automated test cases!")
+            ss[config["session_key"]] = test_cases
+            st.success(f"✅ Generated {len(test_cases)} {kind} test cases!")
             st.rerun()
     
     # Display generated test cases
-    if st.session_state.get('generated_automated_tests'):
+    if ss.get(config["session_key"]):
         st.divider()
-        st.markdown("### ⚙️ Generated Automated Test Cases")
+        st.markdown(config["heading"])
         
-        test_cases = st.session_state.generated_automated_tests
+        test_cases = ss[config["session_key"]]
         
         for idx, test in enumerate(test_cases):
-            with st.expander(f"Test Case {idx + 1}: {test.get('summary', 'Untitled')}"):
-                st.markdown(f"**Type:** {test.get('test_type', 'Automated')}")
-                st.markdown(f"**Priority:** {test.get('priority', 'Medium')}")
-                st.markdown(f"**Labels:** {', '.join(test.get('labels', []))}")
-                st.markdown("**Description:**")
-                st.text_area(
-                    "Test Implementation",
-                    value=test.get('description', ''),
-                    height=250,
-                    key=f"auto_test_{idx}",
-                    help="Edit if needed before uploading"
-                )
+            _render_test_case(idx, test, config["text_label"], config["text_height"], config["key_prefix"])
         
         # Upload to JIRA
         col1, col2, col3 = st.columns([2, 2, 1])
         
         with col1:
-            if st.button("📤 Upload All to JIRA", type="primary", use_container_width=True, key="upload_auto"):
-                upload_test_cases_to_jira(test_cases, "Automated")
+            if st.button("📤 Upload All to JIRA", type="primary", use_container_width=True, key=f"upload_{kind}"):
+                test_cases = ss[config["session_key"]] = _apply_description_edits(test_cases, config["key_prefix"])
+                upload_test_cases_to_jira(test_cases, config["test_type"])
         
         with col2:
-            if st.button("🗑️ Clear Generated Tests", use_container_width=True, key="clear_auto"):
-                del st.session_state.generated_automated_tests
+            if st.button("🗑️ Clear Generated Tests", use_container_width=True, key=f"clear_{kind}"):
+                del ss[config["session_key"]]
                 st.rerun()
 
 
-def upload_test_cases_to_jira(test_cases: List[Dict[str, Any]], test_type: str):
+def _apply_description_edits(test_cases: Sequence[GeneratedTestCase], key_prefix: str) -> Tuple[GeneratedTestCase, ...]:
+    """
+    Return the test cases with descriptions edited in their text areas.
+    
+    Args:
+        test_cases: Generated test cases as stored in session state
+        key_prefix: Widget key prefix used by _render_test_case
+        
+    Returns:
+        Tuple of test cases; unedited ones are reused as-is
+    """
+    ss = st.session_state
+    edited_cases = []
+    for idx, test in enumerate(test_cases):
+        # Streamlit stores widget values in session state; only edited ones differ
+        edited = ss.get(f"{key_prefix}_{idx}")
+        if edited is not None and edited != test.description:
+            test = replace(test, description=edited)
+        edited_cases.append(test)
+    return tuple(edited_cases)
+
+
+def _complete_test_cases(test_cases: Sequence[GeneratedTestCase]) -> List[GeneratedTestCase]:
+    """Return the test cases that have both a summary and a description."""
+    return [test for test in test_cases if test.summary.strip() and test.description.strip()]
+
+
+def upload_test_cases_to_jira(test_cases: Sequence[GeneratedTestCase], test_type: str):
     """Upload test cases to JIRA."""
-    jira_client = st.session_state.get('jira_client')
-    project_key = st.session_state.get('jira_project_key')
+    ss = st.session_state
+    jira_client = ss.get('jira_client')
+    project_key = ss.get('jira_project_key')
     
     if not jira_client or not project_key:
         st.error("❌ JIRA not connected or project key not set")
         return
     
-    with st.spinner(f"📤 Uploading {len(test_cases)} {test_type} test cases to JIRA..."):
-        # Update test cases with edited content from text areas
-        for idx, test in enumerate(test_cases):
-            # Get edited content from session state if exists
-            if test_type == "Manual":
-                key = f"manual_test_{idx}"
-            else:
-                key = f"auto_test_{idx}"
-            
-            # Streamlit stores widget values in session state
-            if key in st.session_state:
-                test['description'] = st.session_state[key]
+    # JIRA rejects issues without a summary or description; don't send them
+    test_cases = _complete_test_cases(test_cases)
+    if not test_cases:
+        st.info("💡 Nothing to upload: no test case has both a summary and a description")
+        return
+    
+    total = len(test_cases)
+    with st.status(f"📤 Uploading {total} {test_type} test cases to JIRA...", expanded=True) as status:
+        progress = st.progress(0.0, text=f"0/{total} uploaded")
+        
+        def on_progress(completed: int, count: int):
+            progress.progress(completed / count, text=f"{completed}/{count} uploaded")
         
-        result = jira_client.bulk_create_test_cases(project_key, test_cases)
+        result = jira_client.bulk_create_test_cases(
+            project_key, [test.to_dict() for test in test_cases], progress_callback=on_progress
+        )
+        status.update(
+            label=f"📤 Uploaded {result['created']} of {total} {test_type} test cases",
+            state="error" if result['failed'] else "complete"
+        )
         
         if result['created'] > 0:
             st.success(f"✅ Successfully created {result['created']} test case(s) in JIRA!")
             
             # Show links to created test cases
             with st.expander("📋 Created Test Cases", expanded=True):
-                for item in result['created_items']:
-                    st.markdown(f"- [{item['key']}]({item['url']})")
+                st.markdown("\n".join(
+                    f"- [{item['key']}]({item['url']})" for item in result['created_items']
+                ))
             
             # Save to audit log
-            from app import add_audit_entry
-            add_audit_entry(
+            audit(
                 f"Uploaded {result['created']} {test_type} test cases to JIRA",
                 "validation",
                 "jira_upload"
@@ -409,14 +459,17 @@ def upload_test_cases_to_jira(test_cases: List[Dict[str, Any]], test_type: str):
 
 def render_test_plan_generator():
     """Render test plan generation UI."""
-    if not st.session_state.get('jira_connected'):
+    ss = st.session_state
+    if not ss.get('jira_connected'):
         return
     
     st.divider()
     st.subheader("📋 Test Plan Generator")
     
-    manual_count = len(st.session_state.get('generated_manual_tests', []))
-    auto_count = len(st.session_state.get('generated_automated_tests', []))
+    manual_tests = _complete_test_cases(ss.get('generated_manual_tests', ()))
+    auto_tests = _complete_test_cases(ss.get('generated_automated_tests', ()))
+    manual_count = len(manual_tests)
+    auto_count = len(auto_tests)
     total_count = manual_count + auto_count
     
     if total_count == 0:
@@ -428,7 +481,7 @@ def render_test_plan_generator():
     with st.form("test_plan_form"):
         plan_name = st.text_input(
             "Test Plan Name",
-            value=f"Test Plan - {st.session_state.get('demand_name', 'Unknown')}",
+            value=f"Test Plan - {ss.get('demand_name', 'Unknown')}",
             help="Name for the test plan Epic in JIRA"
         )
         
@@ -449,37 +502,36 @@ def render_test_plan_generator():
         
         if submitted:
             with st.spinner("🤖 Generating test plan..."):
-                from integrations.jira_test_client import TestCaseGenerator
-                
                 # Generate test plan with AI
                 if include_strategy:
+                    demand_data = {
+                        key: ss[key] for key in _TEST_PLAN_KEYS if key in ss
+                    }
                     plan_data = TestCaseGenerator.generate_test_plan(
-                        st.session_state.agent,
-                        st.session_state.to_dict(),
-                        st.session_state.get('generated_manual_tests', []) + 
-                        st.session_state.get('generated_automated_tests', [])
+                        ss.agent,
+                        demand_data,
+                        manual_tests + auto_tests
                     )
                     full_description = plan_description + "\n\n" + plan_data['description']
                 else:
                     full_description = plan_description
                 
                 # Create test plan in JIRA
-                jira_client = st.session_state.get('jira_client')
-                project_key = st.session_state.get('jira_project_key')
+                jira_client = ss.get('jira_client')
+                project_key = ss.get('jira_project_key')
                 
                 # Note: You'll need to upload test cases first to get their keys
                 result = jira_client.create_test_plan(
                     project_key=project_key,
                     name=plan_name,
                     description=full_description,
-                    labels=["test-plan", "ai-generated", st.session_state.get('demand_id', '')]
+                    labels=["test-plan", "ai-generated", ss.get('demand_id', '')]
                 )
                 
                 if result.get('success'):
                     st.success(f"✅ Test plan created: [{result['key']}]({result['url']})")
                     
-                    from app import add_audit_entry
-                    add_audit_entry(
+                    audit(
                         f"Created test plan {result['key']} in JIRA",
                         "validation",
                         "test_plan"
@@ -0,0 +1,321 @@
+"""
+Phase Form Schemas
+Declarative definitions of the phase tab forms and one generic renderer for them.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Optional, Tuple
+
+import streamlit as st
+
+from utils.widget_state import bind_widget, seed_widget, widget_key
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """A single form widget bound to a phase field."""
+    name: str
+    label: str
+    widget: str = "text_area"  # text_area | text_input | number | checkbox | date
+    subheader: Optional[str] = None
+    height: Optional[int] = None
+    max_chars: Optional[int] = None
+    help: Optional[str] = None
+    placeholder: Optional[str] = None
+    default: Any = ""
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    step: Optional[float] = None
+    top_level: bool = False  # Stored as st.session_state.<name> instead of in the phase dict
+
+
+@dataclass(frozen=True)
+class FormRow:
+    """One row of fields; rows with several fields are laid out in columns."""
+    fields: Tuple[FieldSpec, ...]
+    subheader: Optional[str] = None
+    divider_after: bool = False
+
+
+@dataclass(frozen=True)
+class PhaseForm:
+    """Form layout and messages for one phase tab."""
+    form_key: str
+    submit_label: str
+    success_message: str
+    rows: Tuple[FormRow, ...] = field(default_factory=tuple)
+
+    def fields(self) -> Tuple[FieldSpec, ...]:
+        """All fields in display order."""
+        return tuple(spec for row in self.rows for spec in row.fields)
+
+
+def _row(*fields: FieldSpec, subheader: Optional[str] = None, divider_after: bool = False) -> FormRow:
+    return FormRow(fields=fields, subheader=subheader, divider_after=divider_after)
+
+
+PHASE_FORMS: Dict[str, PhaseForm] = {
+    "ideation": PhaseForm(
+        form_key="ideation_form",
+        submit_label="💾 Save Ideation",
+        success_message="✅ Ideation data saved!",
+        rows=(
+            _row(
+                FieldSpec("demand_number", "Demand Number", widget="text_input", max_chars=20,
+                          placeholder="e.g., 10001", help="Sequential demand number for tracking",
+                          top_level=True),
+                FieldSpec("demand_name", "Demand Name", widget="text_input", max_chars=200,
+                          placeholder="e.g., Promotion Process Enhancement",
+                          help="Descriptive name for this demand", top_level=True),
+                subheader="Demand Identification",
+                divider_after=True,
+            ),
+            _row(FieldSpec("problem_statement", "What problem are you solving?", subheader="Problem Statement",
+                           height=150, max_chars=2000,
+                           help="Clearly describe the business problem or opportunity")),
+            _row(FieldSpec("goals", "What are the key goals?", subheader="Goals & Objectives",
+                           height=100, max_chars=1000, help="Specific, measurable objectives")),
+            _row(
+                FieldSpec("background", "Relevant background information", subheader="Background & Context",
+                          height=100, max_chars=1500),
+                FieldSpec("constraints", "Known constraints or limitations", subheader="Constraints",
+                          height=100, max_chars=1000),
+            ),
+        ),
+    ),
+    "requirements": PhaseForm(
+        form_key="requirements_form",
+        submit_label="💾 Save Requirements",
+        success_message="✅ Requirements saved!",
+        rows=(
+            _row(FieldSpec("user_stories", "Define user stories (As a... I want... so that...)",
+                           subheader="User Stories", height=200, max_chars=5000,
+                           help="Each story should follow the template: As a [role], I want [feature], so that [benefit]")),
+            _row(FieldSpec("acceptance_criteria", "What defines 'done' for each story?",
+                           subheader="Acceptance Criteria", height=150, max_chars=3000)),
+            _row(FieldSpec("non_functional_requirements", "Performance, security, scalability requirements",
+                           subheader="Non-Functional Requirements", height=100, max_chars=2000)),
+        ),
+    ),
+    "assessment": PhaseForm(
+        form_key="assessment_form",
+        submit_label="💾 Save Assessment",
+        success_message="✅ Assessment saved!",
+        rows=(
+            _row(FieldSpec("business_case", "Why should we invest in this?", subheader="Business Case",
+                           height=150, max_chars=2000)),
+            _row(
+                FieldSpec("roi_percentage", "Expected ROI (%)", widget="number", default=0.0,
+                          min_value=0.0, max_value=1000.0, step=5.0),
+                FieldSpec("estimated_cost", "Estimated Cost (€)", widget="number", default=0.0,
+                          min_value=0.0, step=1000.0),
+                FieldSpec("estimated_duration_weeks", "Duration (weeks)", widget="number", default=0,
+                          min_value=0, max_value=520, step=1),
+            ),
+            _row(FieldSpec("risks", "Identify key risks and mitigation strategies", subheader="Risks & Mitigation",
+                           height=150, max_chars=3000, help="Format: [Severity] Risk description -> Mitigation")),
+            _row(
+                FieldSpec("dependencies", "External dependencies", subheader="Dependencies",
+                          height=100, max_chars=2000),
+                FieldSpec("assumptions", "Key assumptions", subheader="Assumptions",
+                          height=100, max_chars=2000),
+            ),
+        ),
+    ),
+    "design": PhaseForm(
+        form_key="design_form",
+        submit_label="💾 Save Design",
+        success_message="✅ Design saved!",
+        rows=(
+            _row(FieldSpec("architecture_overview", "High-level architecture and patterns",
+                           subheader="Architecture Overview", height=150, max_chars=5000)),
+            _row(FieldSpec("technical_stack", "Technologies, frameworks, and tools",
+                           subheader="Technical Stack", height=100, max_chars=1500)),
+            _row(
+                FieldSpec("data_model", "Key entities and relationships", subheader="Data Model",
+                          height=100, max_chars=3000),
+                FieldSpec("integration_points", "External systems and APIs", subheader="Integration Points",
+                          height=100, max_chars=2000),
+            ),
+            _row(FieldSpec("security_considerations", "Authentication, authorization, data protection",
+                           subheader="Security Considerations", height=100, max_chars=2000)),
+        ),
+    ),
+    "build": PhaseForm(
+        form_key="sprint_form",
+        submit_label="💾 Save Build Plan",
+        success_message="✅ Build plan saved!",
+        rows=(
+            _row(
+                FieldSpec("sprint_start_date", "Sprint Start Date", widget="date"),
+                FieldSpec("sprint_end_date", "Sprint End Date", widget="date"),
+                subheader="Sprint Plan",
+            ),
+            _row(FieldSpec("sprint_plan", "Sprint details and milestones", height=150, max_chars=3000)),
+            _row(
+                FieldSpec("repository_url", "Repository URL", widget="text_input", max_chars=500),
+                FieldSpec("branch_name", "Branch Name", widget="text_input", max_chars=100),
+            ),
+        ),
+    ),
+    "validation": PhaseForm(
+        form_key="validation_form",
+        submit_label="💾 Save Validation",
+        success_message="✅ Validation saved!",
+        rows=(
+            _row(FieldSpec("test_cases", "Define test scenarios and expected outcomes", subheader="Test Cases",
+                           height=200, max_chars=5000)),
+            _row(FieldSpec("test_results", "Test execution results and findings", subheader="Test Results",
+                           height=150, max_chars=3000)),
+            _row(
+                FieldSpec("automated_test_coverage", "Automated Test Coverage (%)", widget="number",
+                          default=0.0, min_value=0.0, max_value=100.0, step=5.0),
+                FieldSpec("qa_sign_off", "QA Sign-Off", widget="checkbox", default=False),
+            ),
+            _row(FieldSpec("manual_test_status", "Manual Test Status", height=100, max_chars=1000)),
+        ),
+    ),
+    "deployment": PhaseForm(
+        form_key="deployment_form",
+        submit_label="💾 Save Deployment Plan",
+        success_message="✅ Deployment plan saved!",
+        rows=(
+            _row(FieldSpec("deployment_schedule", "Target Deployment Date", widget="date",
+                           subheader="Deployment Schedule")),
+            _row(FieldSpec("rollout_plan", "Phased rollout strategy", subheader="Rollout Plan",
+                           height=150, max_chars=3000)),
+            _row(
+                FieldSpec("environment_config", "Production environment setup",
+                          subheader="Environment Configuration", height=100, max_chars=2000),
+                FieldSpec("rollback_plan", "Emergency rollback procedure", subheader="Rollback Plan",
+                          height=100, max_chars=2000),
+            ),
+            _row(FieldSpec("communication_plan", "Stakeholder communication strategy",
+                           subheader="Communication Plan", height=100, max_chars=1500)),
+            _row(FieldSpec("deployment_checklist", "Pre-deployment verification items",
+                           subheader="Deployment Checklist", height=100, max_chars=2000)),
+        ),
+    ),
+    "implementation": PhaseForm(
+        form_key="implementation_form",
+        submit_label="💾 Save Implementation Data",
+        success_message="✅ Implementation data saved!",
+        rows=(
+            _row(
+                FieldSpec("uptime_percentage", "System Uptime (%)", widget="number", default=99.5,
+                          min_value=0.0, max_value=100.0, step=0.1),
+                FieldSpec("adoption_rate", "User Adoption Rate (%)", widget="number", default=75.0,
+                          min_value=0.0, max_value=100.0, step=1.0),
+            ),
+            _row(FieldSpec("issue_log", "Post-deployment issues and resolutions", subheader="Issue Log",
+                           height=150, max_chars=3000)),
+            _row(FieldSpec("user_feedback", "User comments and feedback", subheader="User Feedback",
+                           height=150, max_chars=2000)),
+            _row(FieldSpec("performance_data", "System performance observations", subheader="Performance Data",
+                           height=100, max_chars=2000)),
+        ),
+    ),
+    "closing": PhaseForm(
+        form_key="closing_form",
+        submit_label="💾 Save Closing Data",
+        success_message="✅ Closing data saved!",
+        rows=(
+            _row(FieldSpec("retrospective", "What went well? What could be improved?", subheader="Retrospective",
+                           height=200, max_chars=5000)),
+            _row(FieldSpec("lessons_learned", "Key takeaways for future projects", subheader="Lessons Learned",
+                           height=150, max_chars=3000)),
+            _row(
+                FieldSpec("final_costs", "Final Cost (€)", widget="number", default=0.0,
+                          min_value=0.0, step=1000.0),
+                FieldSpec("final_roi", "Actual ROI (%)", widget="number", default=0.0, step=5.0),
+            ),
+            _row(FieldSpec("knowledge_transfer", "Documentation handoff and training completed",
+                           subheader="Knowledge Transfer", height=100, max_chars=2000)),
+            _row(FieldSpec("archive_location", "Archive Location (Confluence/SharePoint)",
+                           widget="text_input", max_chars=500)),
+        ),
+    ),
+}
+
+
+def _to_date(value: Any) -> date:
+    """Convert a stored ISO date string to a date (today when unset)."""
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return date.today()
+
+
+def _number_cast(spec: FieldSpec):
+    return int if isinstance(spec.default, int) and not isinstance(spec.default, bool) else float
+
+
+def _bind(phase: str, spec: FieldSpec) -> str:
+    """Return the widget key for a field, seeding it from stored data on first render."""
+    if spec.top_level:
+        return seed_widget(widget_key(phase, spec.name), st.session_state.get(spec.name, spec.default))
+    if spec.widget == "number":
+        return bind_widget(phase, spec.name, spec.default, cast=_number_cast(spec))
+    if spec.widget == "date":
+        return bind_widget(phase, spec.name, None, cast=_to_date)
+    return bind_widget(phase, spec.name, spec.default)
+
+
+def _render_field(phase: str, spec: FieldSpec) -> Any:
+    """Render one field widget and return its current value."""
+    if spec.subheader:
+        st.subheader(spec.subheader)
+
+    key = _bind(phase, spec)
+
+    if spec.widget == "text_area":
+        return st.text_area(spec.label, key=key, height=spec.height, max_chars=spec.max_chars, help=spec.help)
+    if spec.widget == "text_input":
+        return st.text_input(spec.label, key=key, max_chars=spec.max_chars,
+                             placeholder=spec.placeholder, help=spec.help)
+    if spec.widget == "number":
+        return st.number_input(spec.label, key=key, min_value=spec.min_value,
+                               max_value=spec.max_value, step=spec.step, help=spec.help)
+    if spec.widget == "checkbox":
+        return st.checkbox(spec.label, key=key, help=spec.help)
+    if spec.widget == "date":
+        return str(st.date_input(spec.label, key=key, help=spec.help))
+
+    raise ValueError(f"Unknown widget type: {spec.widget}")
+
+
+def render_phase_form(phase: str) -> Tuple[Dict[str, Any], bool]:
+    """
+    Render the form for a phase from its schema.
+
+    Args:
+        phase: Phase name (key of PHASE_FORMS)
+
+    Returns:
+        Tuple of (current field values, whether the form was submitted)
+    """
+    form = PHASE_FORMS[phase]
+    values: Dict[str, Any] = {}
+
+    with st.form(form.form_key):
+        for row in form.rows:
+            if row.subheader:
+                st.subheader(row.subheader)
+
+            if len(row.fields) == 1:
+                spec = row.fields[0]
+                values[spec.name] = _render_field(phase, spec)
+            else:
+                for col, spec in zip(st.columns(len(row.fields)), row.fields):
+                    with col:
+                        values[spec.name] = _render_field(phase, spec)
+
+            if row.divider_after:
+                st.divider()
+
+        submitted = st.form_submit_button(form.submit_label, use_container_width=True)
+
+    return values, submitted
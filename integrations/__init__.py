@@ -1,5 +1,25 @@
 """Integration modules for external systems."""
-from .jira_client import JiraClient, MockJiraClient
-from .confluence_client import ConfluenceClient, MockConfluenceClient
+from importlib import import_module
+
+# Clients are imported on first access (PEP 562), so importing the package
+# doesn't load every client module and its HTTP dependencies
+_EXPORTS = {
+    "JiraClient": ".jira_client",
+    "MockJiraClient": ".jira_client",
+    "ConfluenceClient": ".confluence_client",
+    "MockConfluenceClient": ".confluence_client",
+}
 
 __all__ = ["JiraClient", "MockJiraClient", "ConfluenceClient", "MockConfluenceClient"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
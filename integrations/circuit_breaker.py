@@ -0,0 +1,141 @@
+"""
+Circuit Breaker
+Fail fast while a JIRA host keeps failing instead of waiting out every request.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of sending a request while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for HTTP calls.
+
+    Connection errors, timeouts and 5xx responses count as failures; 4xx
+    responses (bad credentials, validation errors) do not. After fail_max
+    consecutive failures the circuit opens and calls fail immediately. Once
+    reset_timeout has passed a single probe call is let through: success
+    closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            fail_max: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before probing again
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call func through the breaker.
+
+        Args:
+            func: Function that sends the request and returns a response
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            CircuitOpenError: If the circuit is open (func is not called)
+        """
+        self._before_call()
+        try:
+            response = func(*args, **kwargs)
+        except requests.exceptions.RequestException:
+            self._record(failed=True)
+            raise
+        except BaseException:
+            # Not a transport failure, but a failed probe must not leave the
+            # circuit half-open (which rejects every call) forever
+            self._abandon_probe()
+            raise
+        self._record(failed=getattr(response, "status_code", 0) >= 500)
+        return response
+
+    def _before_call(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Let this call probe the host; others keep failing fast
+                self.state = self.HALF_OPEN
+                return
+            raise CircuitOpenError("JIRA is unavailable; skipping request while the circuit is open")
+
+    def _abandon_probe(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def _record(self, failed: bool):
+        with self._lock:
+            if not failed:
+                self._failures = 0
+                self.state = self.CLOSED
+                return
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.fail_max:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class BreakerSession(requests.Session):
+    """
+    requests.Session that sends every request through a circuit breaker.
+
+    An optional bulkhead semaphore caps how many requests are in flight at
+    once across every session sharing it.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, bulkhead: Optional[threading.BoundedSemaphore] = None):
+        super().__init__()
+        self.breaker = breaker
+        self.bulkhead = bulkhead
+
+    def request(self, method, url, *args, **kwargs):
+        if self.bulkhead is None:
+            return self.breaker.call(super().request, method, url, *args, **kwargs)
+        with self.bulkhead:
+            return self.breaker.call(super().request, method, url, *args, **kwargs)
+
+
+# One breaker per JIRA host, so a failing instance doesn't block another
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(base_url: str) -> CircuitBreaker:
+    """
+    Get the shared circuit breaker for a JIRA host.
+
+    Args:
+        base_url: JIRA instance URL
+
+    Returns:
+        CircuitBreaker shared by all clients of that host
+    """
+    key = base_url.rstrip("/").lower()
+    with _breakers_lock:
+        if key not in _breakers:
+            _breakers[key] = CircuitBreaker()
+        return _breakers[key]
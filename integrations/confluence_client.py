@@ -1,9 +1,27 @@
 """Confluence integration client for document export."""
 import json
+import re
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 import os
 
+from utils.retention import bounded
+
+
+# Pages remembered by the mock client (oldest dropped first)
+MAX_CREATED_PAGES = 500
+
+# Markdown constructs converted to wiki markup, matched in a single pass:
+# headings and bullets at the start of a line, bold anywhere
+_MARKDOWN_PATTERN = re.compile(r"^(#{1,3}) |^- |\*\*", re.MULTILINE)
+
+
+def _markdown_to_wiki(match: re.Match) -> str:
+    """Return the wiki markup for one matched markdown token."""
+    if match.group(1):
+        return f"h{len(match.group(1))}. "
+    return "* " if match.group(0) == "- " else "*"
+
 
 class ConfluenceClient(ABC):
     """Abstract base class for Confluence integration."""
@@ -28,7 +46,7 @@ class MockConfluenceClient(ConfluenceClient):
     def __init__(self):
         """Initialize mock client with page counter."""
         self.page_counter = 1000
-        self.created_pages = []
+        self.created_pages = bounded([], MAX_CREATED_PAGES)
     
     def create_page(self, space_key: str, title: str, content: str, parent_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -95,22 +113,14 @@ class MockConfluenceClient(ConfluenceClient):
     
     def get_created_pages(self) -> list:
         """Get list of all pages created/updated in this session."""
-        return self.created_pages.copy()
+        return list(self.created_pages)
     
     def convert_markdown_to_confluence(self, markdown: str) -> str:
         """
         Convert markdown to Confluence wiki markup (simplified).
         Real implementation would use a library like markdown2confluence.
         """
-        # Simple conversions for demo
-        content = markdown
-        content = content.replace("# ", "h1. ")
-        content = content.replace("## ", "h2. ")
-        content = content.replace("### ", "h3. ")
-        content = content.replace("**", "*")
-        content = content.replace("- ", "* ")
-        
-        return content
+        return _MARKDOWN_PATTERN.sub(_markdown_to_wiki, markdown)
 
 
 class RealConfluenceClient(ConfluenceClient):
@@ -133,11 +143,36 @@ class RealConfluenceClient(ConfluenceClient):
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        self.session = self._build_session()
+    
+    def _build_session(self):
+        """
+        Build a pooled HTTP session that retries throttled and unavailable responses.
+        
+        Page titles are unique within a space, so retrying a create that did
+        go through fails instead of creating a duplicate page.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "POST", "PUT"]
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+        
+        session = requests.Session()
+        session.auth = self.auth
+        session.headers.update(self.headers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
     
     def create_page(self, space_key: str, title: str, content: str, parent_id: Optional[str] = None) -> Dict[str, Any]:
         """Create a page via Confluence REST API."""
-        import requests
-        
         url = f"{self.base_url}/rest/api/content"
         
         payload = {
@@ -156,7 +191,7 @@ class RealConfluenceClient(ConfluenceClient):
             payload["ancestors"] = [{"id": parent_id}]
         
         try:
-            response = requests.post(url, json=payload, auth=self.auth, headers=self.headers, timeout=10)
+            response = self.session.post(url, json=payload, timeout=10)
             response.raise_for_status()
             result = response.json()
             
@@ -175,8 +210,6 @@ class RealConfluenceClient(ConfluenceClient):
     
     def update_page(self, page_id: str, title: str, content: str, version: int) -> Dict[str, Any]:
         """Update a page via Confluence REST API."""
-        import requests
-        
         url = f"{self.base_url}/rest/api/content/{page_id}"
         
         payload = {
@@ -192,7 +225,7 @@ class RealConfluenceClient(ConfluenceClient):
         }
         
         try:
-            response = requests.put(url, json=payload, auth=self.auth, headers=self.headers, timeout=10)
+            response = self.session.put(url, json=payload, timeout=10)
             response.raise_for_status()
             result = response.json()
             
@@ -1,8 +1,46 @@
 """JIRA integration client for creating epics and stories."""
-import json
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Any, Iterator, List, Optional
 from abc import ABC, abstractmethod
 import os
+import re
+
+try:
+    from requests.adapters import HTTPAdapter
+    from integrations.circuit_breaker import BreakerSession, breaker_for
+    from integrations.jira_retry import jira_retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+from integrations.jira_payloads import build_issue_payload
+from utils import json_utils
+
+
+# Pretty-printed epic payload preview with "__<field>__" slots, serialized once;
+# get_api_payload_preview fills in the JSON for each field
+_PREVIEW_TEMPLATE = json_utils.dumps({
+    "fields": {
+        "project": {"key": "LOG"},
+        "summary": "__summary__",
+        "description": "__description__",
+        "issuetype": {"name": "Epic"},
+        "customfield_10011": "__epic_name__",  # Epic Name field
+        "labels": "__labels__",
+        "priority": {"name": "__priority__"}
+    }
+}, indent=True)
+_PREVIEW_SLOT = re.compile(r'"__(\w+)__"')
+
+
+def _slot_indent(match: re.Match) -> str:
+    """Return the leading whitespace of the template line holding a slot."""
+    line = _PREVIEW_TEMPLATE[_PREVIEW_TEMPLATE.rfind("\n", 0, match.start()) + 1:match.start()]
+    return line[:len(line) - len(line.lstrip(" "))]
+
+
+_PREVIEW_INDENTS = {match.group(1): _slot_indent(match) for match in _PREVIEW_SLOT.finditer(_PREVIEW_TEMPLATE)}
 
 
 class JiraClient(ABC):
@@ -24,6 +62,29 @@ class JiraClient(ABC):
         pass
 
 
+class ItemKind(str, Enum):
+    """Kind of item recorded by MockJiraClient; values match the "type" key."""
+    EPIC = "epic"
+    STORY = "story"
+    LINK = "link"
+
+
+@dataclass(slots=True)
+class CreatedItem:
+    """An epic, story or link recorded by MockJiraClient."""
+    kind: ItemKind
+    key: str
+    data: Optional[Dict[str, Any]] = None
+    payload: Optional[Dict[str, Any]] = None
+    linked_to: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary shape returned by get_created_items."""
+        if self.kind is ItemKind.LINK:
+            return {"type": ItemKind.LINK.value, "story": self.key, "epic": self.linked_to}
+        return {"type": self.kind.value, "data": self.data, "payload": self.payload}
+
+
 class MockJiraClient(JiraClient):
     """
     Mock JIRA client for development and testing.
@@ -34,7 +95,7 @@ class MockJiraClient(JiraClient):
         """Initialize mock client with counter for IDs."""
         self.epic_counter = 1000
         self.story_counter = 2000
-        self.created_items = []
+        self.created_items: List[CreatedItem] = []
     
     def create_epic(self, epic_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -58,11 +119,7 @@ class MockJiraClient(JiraClient):
             "created": True
         }
         
-        self.created_items.append({
-            "type": "epic",
-            "data": result,
-            "payload": epic_data
-        })
+        self.created_items.append(CreatedItem(ItemKind.EPIC, epic_key, data=result, payload=epic_data))
         
         return result
     
@@ -88,11 +145,7 @@ class MockJiraClient(JiraClient):
             "created": True
         }
         
-        self.created_items.append({
-            "type": "story",
-            "data": result,
-            "payload": story_data
-        })
+        self.created_items.append(CreatedItem(ItemKind.STORY, story_key, data=result, payload=story_data))
         
         return result
     
@@ -108,34 +161,36 @@ class MockJiraClient(JiraClient):
             True if successful
         """
         # In mock mode, always succeed
-        self.created_items.append({
-            "type": "link",
-            "story": story_key,
-            "epic": epic_key
-        })
+        self.created_items.append(CreatedItem(ItemKind.LINK, story_key, linked_to=epic_key))
         return True
     
+    def iter_created_items(self) -> Iterator[Dict[str, Any]]:
+        """Yield the items created in this session as dictionaries, one at a time."""
+        return (item.to_dict() for item in self.created_items)
+    
     def get_created_items(self) -> List[Dict[str, Any]]:
-        """Get list of all items created in this session."""
-        return self.created_items.copy()
+        """Get list of all items created in this session, as dictionaries."""
+        return list(self.iter_created_items())
     
     def get_api_payload_preview(self, epic_data: Dict[str, Any]) -> str:
         """
         Generate a preview of what would be sent to real JIRA API.
         Useful for testing and validation.
         """
-        payload = {
-            "fields": {
-                "project": {"key": "LOG"},
-                "summary": epic_data.get("summary", ""),
-                "description": epic_data.get("description", ""),
-                "issuetype": {"name": "Epic"},
-                "customfield_10011": epic_data.get("epic_name", ""),  # Epic Name field
-                "labels": epic_data.get("labels", []),
-                "priority": {"name": epic_data.get("priority", "Medium")}
-            }
+        values = {
+            "summary": epic_data.get("summary", ""),
+            "description": epic_data.get("description", ""),
+            "epic_name": epic_data.get("epic_name", ""),
+            "labels": epic_data.get("labels", []),
+            "priority": epic_data.get("priority", "Medium"),
         }
-        return json.dumps(payload, indent=2)
+        
+        def fill(match: re.Match) -> str:
+            # Indent nested lines of lists/objects to the slot's depth
+            indent = _PREVIEW_INDENTS[match.group(1)]
+            return json_utils.dumps(values[match.group(1)], indent=True).replace("\n", "\n" + indent)
+        
+        return _PREVIEW_SLOT.sub(fill, _PREVIEW_TEMPLATE)
 
 
 class RealJiraClient(JiraClient):
@@ -146,6 +201,11 @@ class RealJiraClient(JiraClient):
     
     def __init__(self):
         """Initialize with credentials from environment."""
+        if not REQUESTS_AVAILABLE:
+            raise ImportError(
+                "requests not installed. Run: pip install requests"
+            )
+        
         self.base_url = os.getenv("JIRA_URL", "")
         self.email = os.getenv("JIRA_EMAIL", "")
         self.api_token = os.getenv("JIRA_API_TOKEN", "")
@@ -158,36 +218,40 @@ class RealJiraClient(JiraClient):
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        self.session = self._build_session()
+    
+    def _build_session(self):
+        """
+        Build a pooled HTTP session that retries throttled and unavailable responses.
+        
+        Issue creation is not idempotent, so POSTs are only retried on 429
+        and 503 (see integrations.jira_retry).
+        """
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=jira_retry())
+        
+        # Requests to a host that keeps failing are short-circuited
+        session = BreakerSession(breaker_for(self.base_url))
+        session.auth = self.auth
+        # requests only sets the JSON content type for json=; bodies here are pre-encoded
+        session.headers.update(self.headers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
     
     def create_epic(self, epic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create an epic via JIRA REST API."""
-        import requests
-        
         url = f"{self.base_url}/rest/api/3/issue"
         
-        payload = {
-            "fields": {
-                "project": {"key": epic_data.get("project_key", "LOG")},
-                "summary": epic_data.get("summary", ""),
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {"type": "text", "text": epic_data.get("description", "")}
-                            ]
-                        }
-                    ]
-                },
-                "issuetype": {"name": "Epic"},
-                "customfield_10011": epic_data.get("epic_name", epic_data.get("summary", "")),
-            }
-        }
+        payload = build_issue_payload(
+            epic_data.get("project_key", "LOG"),
+            epic_data.get("summary", ""),
+            epic_data.get("description", ""),
+            "Epic",
+            {"customfield_10011": epic_data.get("epic_name", epic_data.get("summary", ""))}
+        )
         
         try:
-            response = requests.post(url, json=payload, auth=self.auth, headers=self.headers, timeout=10)
+            response = self.session.post(url, data=json_utils.dumps_bytes(payload), timeout=10)
             response.raise_for_status()
             result = response.json()
             
@@ -205,32 +269,17 @@ class RealJiraClient(JiraClient):
     
     def create_story(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a story via JIRA REST API."""
-        import requests
-        
         url = f"{self.base_url}/rest/api/3/issue"
         
-        payload = {
-            "fields": {
-                "project": {"key": story_data.get("project_key", "LOG")},
-                "summary": story_data.get("summary", ""),
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {"type": "text", "text": story_data.get("description", "")}
-                            ]
-                        }
-                    ]
-                },
-                "issuetype": {"name": "Story"},
-            }
-        }
+        payload = build_issue_payload(
+            story_data.get("project_key", "LOG"),
+            story_data.get("summary", ""),
+            story_data.get("description", ""),
+            "Story"
+        )
         
         try:
-            response = requests.post(url, json=payload, auth=self.auth, headers=self.headers, timeout=10)
+            response = self.session.post(url, data=json_utils.dumps_bytes(payload), timeout=10)
             response.raise_for_status()
             result = response.json()
             
@@ -248,8 +297,6 @@ class RealJiraClient(JiraClient):
     
     def link_story_to_epic(self, story_key: str, epic_key: str) -> bool:
         """Link story to epic via JIRA REST API."""
-        import requests
-        
         url = f"{self.base_url}/rest/api/3/issue/{story_key}"
         
         payload = {
@@ -259,7 +306,7 @@ class RealJiraClient(JiraClient):
         }
         
         try:
-            response = requests.put(url, json=payload, auth=self.auth, headers=self.headers, timeout=10)
+            response = self.session.put(url, data=json_utils.dumps_bytes(payload), timeout=10)
             response.raise_for_status()
             return True
         except Exception as e:
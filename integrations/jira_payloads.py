@@ -0,0 +1,59 @@
+"""
+JIRA Payloads
+Request bodies shared by the JIRA clients.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def adf(text: str) -> Dict[str, Any]:
+    """
+    Wrap plain text in an Atlassian Document Format (ADF) document.
+
+    Args:
+        text: Plain text for a single paragraph
+
+    Returns:
+        ADF document dictionary
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [{"type": "text", "text": text}]
+            }
+        ]
+    }
+
+
+def build_issue_payload(
+    project_key: str,
+    summary: str,
+    description: str,
+    issuetype_name: str,
+    extra_fields: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build the body of a create-issue request.
+
+    Args:
+        project_key: JIRA project key
+        summary: Issue summary
+        description: Plain-text description (sent as ADF)
+        issuetype_name: Issue type name (Epic, Story, Test, ...)
+        extra_fields: Additional fields (priority, labels, custom fields)
+
+    Returns:
+        Issue payload ({"fields": {...}})
+    """
+    fields = {
+        "project": {"key": project_key},
+        "summary": summary,
+        "description": adf(description),
+        "issuetype": {"name": issuetype_name},
+    }
+    if extra_fields:
+        fields.update(extra_fields)
+    return {"fields": fields}
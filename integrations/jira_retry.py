@@ -0,0 +1,75 @@
+"""
+JIRA Retry Policy
+Retry settings shared by the JIRA clients.
+"""
+
+import threading
+from typing import Optional
+
+from urllib3.util.retry import Retry
+
+# Statuses retried for GET and PUT
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# POST creates issues and is not idempotent: a 502/504 from Atlassian's edge
+# can follow a create the backend already committed. 429 and 503 are sent
+# before the request is processed (with Retry-After), so only they are retried
+POST_RETRY_STATUSES = (429, 503)
+
+
+class JiraRetry(Retry):
+    """
+    Retry that only repeats POSTs on statuses where nothing was created.
+
+    When the session holds a bulkhead slot for each request, the slot is
+    given back while waiting between attempts, so backoff and Retry-After
+    waits don't keep other JIRA calls out.
+    """
+
+    def __init__(self, *args, bulkhead: Optional[threading.BoundedSemaphore] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bulkhead = bulkhead
+
+    def new(self, **kw) -> "JiraRetry":
+        retry = super().new(**kw)
+        retry.bulkhead = self.bulkhead
+        return retry
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST" and status_code not in POST_RETRY_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def sleep(self, response=None) -> None:
+        if self.bulkhead is None:
+            super().sleep(response)
+            return
+        self.bulkhead.release()
+        try:
+            super().sleep(response)
+        finally:
+            self.bulkhead.acquire()
+
+
+def jira_retry(bulkhead: Optional[threading.BoundedSemaphore] = None) -> JiraRetry:
+    """
+    Build the retry policy for a JIRA session.
+
+    Read timeouts and 500 responses are never retried, because JIRA may
+    already have created the issue.
+
+    Args:
+        bulkhead: Semaphore the session holds around each request, if any
+
+    Returns:
+        JiraRetry for HTTPAdapter(max_retries=...)
+    """
+    return JiraRetry(
+        bulkhead=bulkhead,
+        total=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=["GET", "POST", "PUT"],
+        respect_retry_after_header=True
+    )
@@ -4,13 +4,109 @@ Connects to JIRA Cloud/Server via REST API for test case management.
 """
 
 import requests
-import json
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Any, Sequence, Tuple
 from datetime import datetime
 import logging
+import os
+import re
+import threading
+import time
+
+from integrations.circuit_breaker import BreakerSession, breaker_for
+from integrations.jira_payloads import build_issue_payload
+from integrations.jira_retry import jira_retry
+from utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) seconds for requests that don't pass their own timeout
+DEFAULT_TIMEOUT = (3.05, 27)
+
+
+def _max_concurrency() -> int:
+    """Read JIRA_MAX_CONCURRENCY, falling back to 8 and never going below 1."""
+    try:
+        return max(1, int(os.getenv("JIRA_MAX_CONCURRENCY", "8")))
+    except ValueError:
+        logger.warning("Invalid JIRA_MAX_CONCURRENCY; using 8")
+        return 8
+
+
+# Most JIRA requests one process may have in flight, across all clients
+# and worker threads, so parallel uploads don't trigger 429s
+JIRA_MAX_CONCURRENCY = _max_concurrency()
+_JIRA_BULKHEAD = threading.BoundedSemaphore(JIRA_MAX_CONCURRENCY)
+
+# Project lists and issue types change rarely; reuse them for five minutes
+METADATA_CACHE_TTL_SECONDS = 300
+
+# Lines that start a new test case in AI output (case-insensitive)
+_TEST_CASE_MARKER = re.compile(r"test case|tc-|### test", re.IGNORECASE)
+
+# Maximum issues JIRA accepts in one bulk create request
+BULK_CREATE_LIMIT = 50
+
+
+def _bulk_error_message(error: Dict[str, Any]) -> str:
+    """Flatten one entry of a bulk create response's "errors" list into a message."""
+    element_errors = error.get("elementErrors", {})
+    messages = list(element_errors.get("errorMessages", []))
+    messages += [f"{field}: {message}" for field, message in element_errors.get("errors", {}).items()]
+    return "; ".join(messages) or f"HTTP {error.get('status', 'error')}"
+
+
+@dataclass(frozen=True, slots=True)
+class GeneratedTestCase:
+    """
+    An AI-generated test case.
+    
+    Immutable so generated lists can be stored as tuples and hashed cheaply;
+    use dataclasses.replace() to apply edits.
+    """
+    summary: str
+    description: str = ""
+    test_type: str = "Manual"
+    priority: str = "Medium"
+    labels: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "GeneratedTestCase":
+        """Build a test case from a test case dictionary."""
+        return cls(
+            summary=data.get("summary", ""),
+            description=data.get("description", ""),
+            test_type=data.get("test_type", "Manual"),
+            priority=data.get("priority", "Medium"),
+            labels=tuple(data.get("labels", ())),
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the test case dictionary accepted by bulk_create_test_cases."""
+        return {
+            "summary": self.summary,
+            "description": self.description,
+            "test_type": self.test_type,
+            "priority": self.priority,
+            "labels": list(self.labels),
+        }
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that gives every request a default timeout."""
+    
+    def __init__(self, *args, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        # Session.request passes timeout=None when the caller gave none
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
 
 class JiraClient:
     """Real JIRA client for test case and test plan management."""
@@ -27,12 +123,45 @@ class JiraClient:
         self.base_url = base_url.rstrip('/')
         self.api_token = api_token
         self.email = email
-        self.session = requests.Session()
+        # Shared per host: once JIRA keeps failing, requests fail fast.
+        # The process-wide bulkhead caps requests in flight; retries give the
+        # slot back while they wait
+        self.session = BreakerSession(breaker_for(self.base_url), _JIRA_BULKHEAD)
         self.session.auth = (email, api_token)
+        # Bodies are sent pre-serialized (data=), so the content type comes from here
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        
+        # Retry throttled and unavailable responses (POSTs only where nothing
+        # was created). Every request gets DEFAULT_TIMEOUT so a hung JIRA
+        # can't block the UI
+        adapter = TimeoutHTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=jira_retry(_JIRA_BULKHEAD))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # (kind, project_key) -> (expires_at, value); failures are never cached
+        self._metadata_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._metadata_lock = threading.Lock()
+    
+    def _cached_metadata(self, key: Tuple[str, Optional[str]]) -> Optional[List[Dict[str, Any]]]:
+        """Return a cached metadata list, or None if missing or expired."""
+        with self._metadata_lock:
+            entry = self._metadata_cache.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return list(entry[1])
+    
+    def _store_metadata(self, key: Tuple[str, Optional[str]], value: List[Dict[str, Any]]):
+        """Cache a metadata list for METADATA_CACHE_TTL_SECONDS."""
+        with self._metadata_lock:
+            self._metadata_cache[key] = (time.monotonic() + METADATA_CACHE_TTL_SECONDS, list(value))
+    
+    def invalidate_metadata_cache(self):
+        """Drop cached projects and issue types so the next call refetches them."""
+        with self._metadata_lock:
+            self._metadata_cache.clear()
     
     def test_connection(self) -> Dict[str, Any]:
         """
@@ -63,15 +192,21 @@ class JiraClient:
         """
         Get list of available JIRA projects.
         
+        Results are cached for METADATA_CACHE_TTL_SECONDS.
+        
         Returns:
             List of project dictionaries
         """
+        cached = self._cached_metadata(("projects", None))
+        if cached is not None:
+            return cached
+        
         try:
             response = self.session.get(f"{self.base_url}/rest/api/3/project")
             response.raise_for_status()
             projects = response.json()
             
-            return [
+            projects = [
                 {
                     "key": p.get("key"),
                     "name": p.get("name"),
@@ -79,6 +214,8 @@ class JiraClient:
                 }
                 for p in projects
             ]
+            self._store_metadata(("projects", None), projects)
+            return projects
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to get JIRA projects: {str(e)}")
             return []
@@ -91,8 +228,12 @@ class JiraClient:
             project_key: JIRA project key
             
         Returns:
-            List of issue type dictionaries
+            List of issue type dictionaries (cached for METADATA_CACHE_TTL_SECONDS)
         """
+        cached = self._cached_metadata(("issue_types", project_key))
+        if cached is not None:
+            return cached
+        
         try:
             response = self.session.get(
                 f"{self.base_url}/rest/api/3/project/{project_key}"
@@ -100,11 +241,49 @@ class JiraClient:
             response.raise_for_status()
             project_data = response.json()
             
-            return project_data.get('issueTypes', [])
+            issue_types = project_data.get('issueTypes', [])
+            self._store_metadata(("issue_types", project_key), issue_types)
+            return issue_types
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to get issue types: {str(e)}")
             return []
     
+    @staticmethod
+    def _build_issue_data(
+        project_key: str,
+        summary: str,
+        description: str,
+        test_type: str = "Manual",
+        priority: str = "Medium",
+        labels: List[str] = None,
+        custom_fields: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the create-issue payload for a test case.
+        
+        Args:
+            project_key: JIRA project key
+            summary: Test case title
+            description: Test case description with steps
+            test_type: "Manual" or "Automated"
+            priority: Test priority
+            labels: List of labels (not modified)
+            custom_fields: Additional custom fields
+            
+        Returns:
+            Issue data dictionary ({"fields": {...}})
+        """
+        extra_fields = {
+            "priority": {"name": priority},
+            "labels": list(labels or []) + [f"test-type-{test_type.lower()}"]
+        }
+        # Add custom fields if provided
+        if custom_fields:
+            extra_fields.update(custom_fields)
+        
+        # "Test" issue type: adjust based on your JIRA setup
+        return build_issue_payload(project_key, summary, description, "Test", extra_fields)
+    
     def create_test_case(
         self,
         project_key: str,
@@ -131,42 +310,13 @@ class JiraClient:
             Created issue details
         """
         try:
-            # Build issue data
-            issue_data = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": summary,
-                    "description": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": description
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    "issuetype": {"name": "Test"},  # Adjust based on your JIRA setup
-                    "priority": {"name": priority},
-                    "labels": labels or []
-                }
-            }
-            
-            # Add test type label
-            issue_data["fields"]["labels"].append(f"test-type-{test_type.lower()}")
-            
-            # Add custom fields if provided
-            if custom_fields:
-                issue_data["fields"].update(custom_fields)
+            issue_data = self._build_issue_data(
+                project_key, summary, description, test_type, priority, labels, custom_fields
+            )
             
             response = self.session.post(
                 f"{self.base_url}/rest/api/3/issue",
-                json=issue_data
+                data=json_utils.dumps_bytes(issue_data)
             )
             response.raise_for_status()
             result = response.json()
@@ -191,7 +341,8 @@ class JiraClient:
         name: str,
         description: str,
         test_cases: List[str] = None,
-        labels: List[str] = None
+        labels: List[str] = None,
+        max_workers: int = 8
     ) -> Dict[str, Any]:
         """
         Create a test plan (Epic) in JIRA.
@@ -202,56 +353,38 @@ class JiraClient:
             description: Test plan description
             test_cases: List of test case keys to link
             labels: List of labels
+            max_workers: Maximum concurrent link requests
             
         Returns:
             Created epic details
         """
         try:
             # Create Epic for test plan
-            epic_data = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": name,
-                    "description": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": description
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    "issuetype": {"name": "Epic"},
-                    "labels": labels or ["test-plan"]
-                }
-            }
+            epic_data = build_issue_payload(
+                project_key, name, description, "Epic", {"labels": labels or ["test-plan"]}
+            )
             
             response = self.session.post(
                 f"{self.base_url}/rest/api/3/issue",
-                json=epic_data
+                data=json_utils.dumps_bytes(epic_data)
             )
             response.raise_for_status()
             result = response.json()
             
             epic_key = result.get("key")
             
-            # Link test cases to epic if provided
+            # Link test cases to epic if provided; the links are independent requests
+            linked = 0
             if test_cases and epic_key:
-                for test_case_key in test_cases:
-                    self.link_issue_to_epic(test_case_key, epic_key)
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(test_cases)))) as executor:
+                    linked = sum(executor.map(lambda key: self.link_issue_to_epic(key, epic_key), test_cases))
             
             return {
                 "success": True,
                 "key": epic_key,
                 "id": result.get("id"),
                 "url": f"{self.base_url}/browse/{epic_key}",
-                "linked_tests": len(test_cases) if test_cases else 0
+                "linked_tests": linked
             }
             
         except requests.exceptions.RequestException as e:
@@ -282,7 +415,7 @@ class JiraClient:
             
             response = self.session.put(
                 f"{self.base_url}/rest/api/3/issue/{issue_key}",
-                json=update_data
+                data=json_utils.dumps_bytes(update_data)
             )
             response.raise_for_status()
             return True
@@ -294,14 +427,22 @@ class JiraClient:
     def bulk_create_test_cases(
         self,
         project_key: str,
-        test_cases: List[Dict[str, Any]]
+        test_cases: List[Dict[str, Any]],
+        max_workers: int = 8,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> Dict[str, Any]:
         """
         Create multiple test cases at once.
         
+        Test cases are sent to the bulk create endpoint in chunks of
+        BULK_CREATE_LIMIT issues; the chunks are sent concurrently.
+        
         Args:
             project_key: JIRA project key
             test_cases: List of test case dictionaries
+            max_workers: Maximum concurrent requests (kept low for JIRA Cloud rate limits)
+            progress_callback: Called as (completed, total) after each chunk
+                finishes, on the calling thread
             
         Returns:
             Summary of created test cases
@@ -309,17 +450,38 @@ class JiraClient:
         created = []
         failed = []
         
-        for test_case in test_cases:
-            result = self.create_test_case(
-                project_key=project_key,
-                summary=test_case.get("summary", ""),
-                description=test_case.get("description", ""),
-                test_type=test_case.get("test_type", "Manual"),
-                priority=test_case.get("priority", "Medium"),
-                labels=test_case.get("labels", []),
-                custom_fields=test_case.get("custom_fields")
-            )
-            
+        chunks = [
+            test_cases[start:start + BULK_CREATE_LIMIT]
+            for start in range(0, len(test_cases), BULK_CREATE_LIMIT)
+        ]
+        
+        def create(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return self._bulk_create_chunk([
+                self._build_issue_data(
+                    project_key=project_key,
+                    summary=test_case.get("summary", ""),
+                    description=test_case.get("description", ""),
+                    test_type=test_case.get("test_type", "Manual"),
+                    priority=test_case.get("priority", "Medium"),
+                    labels=test_case.get("labels", []),
+                    custom_fields=test_case.get("custom_fields")
+                )
+                for test_case in chunk
+            ])
+        
+        chunk_results = [None] * len(chunks)
+        completed = 0
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            futures = {executor.submit(create, chunk): idx for idx, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                idx = futures[future]
+                chunk_results[idx] = future.result()
+                completed += len(chunks[idx])
+                if progress_callback:
+                    progress_callback(completed, len(test_cases))
+        
+        results = [result for chunk_result in chunk_results for result in chunk_result]
+        for test_case, result in zip(test_cases, results):
             if result.get("success"):
                 created.append(result)
             else:
@@ -336,6 +498,50 @@ class JiraClient:
             "failed_items": failed
         }
     
+    def _bulk_create_chunk(self, issue_updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create up to BULK_CREATE_LIMIT issues in one bulk request.
+        
+        Args:
+            issue_updates: Issue data dictionaries from _build_issue_data
+            
+        Returns:
+            One result per issue, in input order, shaped like create_test_case's
+        """
+        try:
+            response = self.session.post(
+                f"{self.base_url}/rest/api/3/issue/bulk",
+                data=json_utils.dumps_bytes({"issueUpdates": issue_updates})
+            )
+            # JIRA answers 400 with per-issue errors when every issue was rejected
+            body = response.json() if response.status_code < 500 else {}
+            if response.status_code >= 400 and not body.get("errors"):
+                response.raise_for_status()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Failed to bulk create test cases: {str(e)}")
+            return [{"success": False, "error": str(e)} for _ in issue_updates]
+        
+        errors = {
+            error.get("failedElementNumber"): _bulk_error_message(error)
+            for error in body.get("errors", [])
+        }
+        # Created issues are listed in request order, skipping the failed ones
+        issues = iter(body.get("issues", []))
+        
+        results = []
+        for idx in range(len(issue_updates)):
+            issue = None if idx in errors else next(issues, None)
+            if issue is None:
+                results.append({"success": False, "error": errors.get(idx, "Issue missing from JIRA response")})
+            else:
+                results.append({
+                    "success": True,
+                    "key": issue.get("key"),
+                    "id": issue.get("id"),
+                    "url": f"{self.base_url}/browse/{issue.get('key')}"
+                })
+        return results
+    
     def search_issues(
         self,
         jql: str,
@@ -351,22 +557,53 @@ class JiraClient:
         Returns:
             List of matching issues
         """
-        try:
-            response = self.session.get(
-                f"{self.base_url}/rest/api/3/search",
-                params={
-                    "jql": jql,
-                    "maxResults": max_results
-                }
-            )
-            response.raise_for_status()
-            result = response.json()
+        return list(self.iter_issues(jql, max_results=max_results))
+    
+    def iter_issues(
+        self,
+        jql: str,
+        batch_size: int = 500,
+        max_results: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield JIRA issues matching a JQL query, fetching them page by page.
+        
+        Pages advance by the number of issues actually returned, so a server
+        that caps the page size below batch_size is still paged correctly.
+        
+        Args:
+            jql: JIRA Query Language string
+            batch_size: Issues requested per page
+            max_results: Stop after this many issues (None = all matches)
             
-            return result.get("issues", [])
+        Yields:
+            Matching issues in result order; stops early (after logging) if a
+            page request fails
+        """
+        start_at = 0
+        while max_results is None or start_at < max_results:
+            page_size = batch_size if max_results is None else min(batch_size, max_results - start_at)
+            try:
+                response = self.session.get(
+                    f"{self.base_url}/rest/api/3/search",
+                    params={
+                        "jql": jql,
+                        "startAt": start_at,
+                        "maxResults": page_size
+                    }
+                )
+                response.raise_for_status()
+                result = response.json()
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Failed to search issues: {str(e)}")
+                return
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to search issues: {str(e)}")
-            return []
+            issues = result.get("issues", [])
+            yield from issues
+            start_at += len(issues)
+            
+            if not issues or start_at >= result.get("total", 0):
+                return
 
 
 class TestCaseGenerator:
@@ -378,7 +615,7 @@ class TestCaseGenerator:
         requirements: str,
         acceptance_criteria: str,
         context: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[GeneratedTestCase, ...]:
         """
         Generate manual test cases using AI.
         
@@ -389,7 +626,7 @@ class TestCaseGenerator:
             context: Additional context
             
         Returns:
-            List of test case dictionaries
+            Tuple of generated test cases
         """
         prompt = f"""
 Generate comprehensive manual test cases for the following requirements:
@@ -433,7 +670,7 @@ Return the test cases in a structured format.
         technical_design: str,
         api_endpoints: str,
         context: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[GeneratedTestCase, ...]:
         """
         Generate automated test cases using AI.
         
@@ -444,7 +681,7 @@ Return the test cases in a structured format.
             context: Additional context
             
         Returns:
-            List of automated test case dictionaries
+            Tuple of generated automated test cases
         """
         prompt = f"""
 Generate automated test cases for the following technical design:
@@ -489,7 +726,7 @@ Return in structured format.
         return test_cases
     
     @staticmethod
-    def _parse_test_cases(ai_response: str, test_type: str) -> List[Dict[str, Any]]:
+    def _parse_test_cases(ai_response: str, test_type: str) -> Tuple[GeneratedTestCase, ...]:
         """
         Parse AI-generated test cases into structured format.
         
@@ -498,44 +735,49 @@ Return in structured format.
             test_type: "Manual" or "Automated"
             
         Returns:
-            List of structured test case dictionaries
+            Tuple of structured test cases
         """
         # This is a simple parser - enhance based on your AI's output format
         test_cases = []
+        labels = (test_type.lower(), "generated-by-ai")
         
-        # Split by test case markers (adjust based on AI output)
-        lines = ai_response.split('\n')
-        current_case = {}
+        # Description lines are buffered and joined once per test case
+        summary = None
+        description_lines: List[str] = []
+        
+        def finish_case():
+            description = "\n".join(description_lines) + "\n" if description_lines else ""
+            test_cases.append(GeneratedTestCase(
+                summary=summary,
+                description=description,
+                test_type=test_type,
+                labels=labels
+            ))
         
-        for line in lines:
+        # Split by test case markers (adjust based on AI output)
+        for line in ai_response.split('\n'):
             line = line.strip()
             
             # Detect new test case (various markers)
-            if any(marker in line.lower() for marker in ['test case', 'tc-', '### test']):
-                if current_case:
-                    test_cases.append(current_case)
-                current_case = {
-                    "test_type": test_type,
-                    "summary": line,
-                    "description": "",
-                    "priority": "Medium",
-                    "labels": [test_type.lower(), "generated-by-ai"]
-                }
-            elif current_case:
-                # Append to current description
-                current_case["description"] += line + "\n"
+            if _TEST_CASE_MARKER.search(line):
+                if summary is not None:
+                    finish_case()
+                summary = line
+                description_lines = []
+            elif summary is not None:
+                description_lines.append(line)
         
         # Add last test case
-        if current_case:
-            test_cases.append(current_case)
+        if summary is not None:
+            finish_case()
         
-        return test_cases
+        return tuple(test_cases)
     
     @staticmethod
     def generate_test_plan(
         agent,
         demand_data: Dict[str, Any],
-        test_cases: List[Dict[str, Any]]
+        test_cases: Sequence[GeneratedTestCase]
     ) -> Dict[str, Any]:
         """
         Generate a comprehensive test plan.
@@ -137,3 +137,10 @@ class TestMockAgent:
         # Should not contain placeholder tokens
         assert "[REDACTED]" not in response
         assert "TODO" not in response
+    
+    def test_stream_matches_generate(self, agent, sample_context):
+        """Test the default stream yields the generated response."""
+        query = "analyze the problem"
+        chunks = list(agent.stream(query, sample_context))
+        
+        assert "".join(chunks) == agent.generate(query, sample_context)
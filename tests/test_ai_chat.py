@@ -0,0 +1,49 @@
+"""Tests for the AI chat quick-action caches."""
+import pytest
+from components.ai_chat import _cached_stories, _cached_test_cases
+
+
+class FlakyAgent:
+    """Agent whose first call fails the way GeminiAgent reports errors."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_test_cases(self, requirements, stories):
+        self.calls += 1
+        return "❌ Error: 429 Too Many Requests" if self.calls == 1 else "**Test Case 1**: Login"
+
+    def suggest_stories(self, goals, context):
+        self.calls += 1
+        return ["❌ Error: timed out"] if self.calls == 1 else ["As a user, I want X"]
+
+
+class TestQuickActionCache:
+    """Test agent failures are never cached."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        """Start and end each test with empty caches."""
+        _cached_test_cases.clear()
+        _cached_stories.clear()
+        yield
+        _cached_test_cases.clear()
+        _cached_stories.clear()
+
+    def test_error_text_raises_and_retry_calls_agent(self):
+        """Test an error result raises and the next call reaches the agent again."""
+        agent = FlakyAgent()
+        with pytest.raises(RuntimeError, match="429"):
+            _cached_test_cases("FlakyAgent", "req", "stories", agent)
+
+        assert _cached_test_cases("FlakyAgent", "req", "stories", agent) == "**Test Case 1**: Login"
+        assert _cached_test_cases("FlakyAgent", "req", "stories", agent) == "**Test Case 1**: Login"
+        assert agent.calls == 2
+
+    def test_error_list_raises(self):
+        """Test a story list holding the error text is not cached either."""
+        agent = FlakyAgent()
+        with pytest.raises(RuntimeError, match="timed out"):
+            _cached_stories("FlakyAgent", "goals", "h", agent, [])
+
+        assert _cached_stories("FlakyAgent", "goals", "h", agent, []) == ["As a user, I want X"]
@@ -0,0 +1,31 @@
+"""Tests for the attachment cache."""
+from utils.attachment_cache import attachment_signature, cached_attachment_content
+
+
+class TestAttachmentSignature:
+    """Test attachment cache keys."""
+
+    def test_changes_when_file_is_replaced(self, tmp_path):
+        """Test rewriting a file changes its signature."""
+        path = tmp_path / "notes.txt"
+        path.write_text("first")
+        files = [{"file_path": str(path), "filename": "notes.txt"}]
+        before = attachment_signature(files, [])
+
+        path.write_text("second version")
+        assert attachment_signature(files, []) != before
+
+    def test_missing_file_still_hashable(self):
+        """Test a deleted attachment gives a usable key."""
+        file_sig, url_sig = attachment_signature(
+            [{"file_path": "/nonexistent/file.pdf", "filename": "file.pdf"}],
+            [{"url": "https://example.com", "title": "Example"}]
+        )
+        hash((file_sig, url_sig))
+        assert file_sig == (("/nonexistent/file.pdf", "file.pdf", None, None),)
+        assert url_sig == (("https://example.com", "Example"),)
+
+
+def test_no_attachments_gives_empty_text():
+    """Test no attachments skips extraction."""
+    assert cached_attachment_content([], []) == ""
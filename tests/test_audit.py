@@ -0,0 +1,65 @@
+"""Tests for the audit hook."""
+from datetime import datetime
+import pytest
+from components.phase_forms import PHASE_FORMS
+from models.demand import AuditLogEntry
+from utils import audit as audit_module
+from utils.audit import MAX_ACTION_LENGTH, audit, describe_changes, set_audit_handler
+
+
+@pytest.fixture(autouse=True)
+def reset_handler():
+    """Clear the registered handler after each test."""
+    yield
+    set_audit_handler(None)
+
+
+class TestAuditHook:
+    """Test routing audit entries to the registered handler."""
+
+    def test_calls_registered_handler(self):
+        """Test entries reach the handler with all arguments."""
+        calls = []
+        set_audit_handler(lambda *args: calls.append(args))
+        audit("Uploaded tests", "validation", "jira_upload")
+        assert calls == [("Uploaded tests", "validation", "jira_upload")]
+
+    def test_reregistering_replaces_handler(self):
+        """Test registering again on rerun does not duplicate entries."""
+        calls = []
+        set_audit_handler(lambda *args: calls.append(args))
+        set_audit_handler(lambda *args: calls.append(args))
+        audit("Created plan")
+        assert calls == [("Created plan", None, None)]
+
+    def test_no_handler_is_noop(self):
+        """Test auditing without a handler does nothing."""
+        assert audit_module._handler is None
+        audit("Ignored")
+
+
+class TestDescribeChanges:
+    """Test listing changed fields in audit actions."""
+
+    def test_lists_names(self):
+        """Test names are appended to the action."""
+        assert describe_changes("Updated build data", ["tasks", "sprint_plan"]) == "Updated build data: tasks, sprint_plan"
+
+    def test_capped_to_action_limit(self):
+        """Test long lists are cut to the AuditLogEntry action limit."""
+        text = describe_changes("Updated stakeholder sign-offs", ["x" * 100] * 50)
+        assert len(text) == MAX_ACTION_LENGTH
+        assert text.endswith("...")
+
+    @pytest.mark.parametrize("phase", sorted(PHASE_FORMS))
+    def test_whole_form_save_is_valid_audit_entry(self, phase):
+        """Test saving every field of a phase form produces a valid AuditLogEntry."""
+        fields = [spec.name for spec in PHASE_FORMS[phase].fields()]
+        AuditLogEntry(
+            timestamp=datetime.now(),
+            user="POC-User",
+            action=describe_changes(f"Updated {phase} data", fields),
+            trace_id="LOG-1",
+            tab_name=phase,
+            field_name=None,
+        )
@@ -0,0 +1,112 @@
+"""Tests for the JIRA circuit breaker."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import requests
+from integrations.circuit_breaker import BreakerSession, CircuitBreaker, CircuitOpenError, breaker_for
+
+
+class Response:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+def _timeout():
+    raise requests.exceptions.Timeout("timed out")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock."""
+    now = [1000.0]
+    monkeypatch.setattr("integrations.circuit_breaker.time.monotonic", lambda: now[0])
+    return now
+
+
+class TestCircuitBreaker:
+    """Test opening, failing fast and recovering."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test the circuit opens and stops calling the function."""
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=30)
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.Timeout):
+                breaker.call(_timeout)
+
+        calls = []
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: calls.append(1))
+        assert breaker.state == CircuitBreaker.OPEN
+        assert calls == []
+
+    def test_server_errors_count_client_errors_do_not(self, clock):
+        """Test 5xx responses trip the circuit while 4xx responses reset it."""
+        breaker = CircuitBreaker(fail_max=2)
+        breaker.call(Response, 503)
+        breaker.call(Response, 401)
+        breaker.call(Response, 500)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.call(Response, 502)
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_probe_closes_on_success(self, clock):
+        """Test a successful probe after the timeout closes the circuit."""
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=30)
+        breaker.call(Response, 503)
+
+        clock[0] += 30
+        assert breaker.call(Response, 200).status_code == 200
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens(self, clock):
+        """Test a failed probe opens the circuit for another timeout."""
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=30)
+        breaker.call(Response, 503)
+
+        clock[0] += 30
+        with pytest.raises(requests.exceptions.Timeout):
+            breaker.call(_timeout)
+        with pytest.raises(CircuitOpenError):
+            breaker.call(Response, 200)
+
+    def test_open_error_is_request_exception(self):
+        """Test existing RequestException handlers also catch the fast failure."""
+        assert issubclass(CircuitOpenError, requests.exceptions.RequestException)
+
+
+class TestBreakerFor:
+    """Test per-host breaker sharing."""
+
+    def test_shared_per_host(self):
+        """Test clients of one host share a breaker and other hosts don't."""
+        assert breaker_for("https://a.atlassian.net/") is breaker_for("https://A.atlassian.net")
+        assert breaker_for("https://a.atlassian.net") is not breaker_for("https://b.atlassian.net")
+
+
+class TestBreakerSession:
+    """Test the bulkhead limit of BreakerSession."""
+
+    def test_bulkhead_caps_concurrent_requests(self, monkeypatch):
+        """Test no more requests run at once than the bulkhead allows."""
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def request(self, method, url, *args, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return Response(200)
+
+        monkeypatch.setattr(requests.Session, "request", request)
+        session = BreakerSession(CircuitBreaker(), threading.BoundedSemaphore(2))
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda i: session.get(f"https://jira.example.com/{i}"), range(12)))
+
+        assert peak[0] == 2
@@ -0,0 +1,42 @@
+"""Tests for Confluence integration."""
+import pytest
+from integrations.confluence_client import MockConfluenceClient, MAX_CREATED_PAGES
+
+
+class TestConvertMarkdown:
+    """Test markdown to Confluence wiki markup conversion."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create client instance for testing."""
+        return MockConfluenceClient()
+    
+    def test_headings(self, client):
+        """Test each heading level maps to its wiki heading."""
+        markdown = "# Title\n## Section\n### Detail"
+        assert client.convert_markdown_to_confluence(markdown) == "h1. Title\nh2. Section\nh3. Detail"
+    
+    def test_bold_and_bullets(self, client):
+        """Test bold text and list items are converted."""
+        markdown = "- **Owner**: QA\n- Scope"
+        assert client.convert_markdown_to_confluence(markdown) == "* *Owner*: QA\n* Scope"
+    
+    def test_inline_text_untouched(self, client):
+        """Test dashes and hashes inside a line are left alone."""
+        markdown = "Budget - approved, ticket #42 "
+        assert client.convert_markdown_to_confluence(markdown) == markdown
+
+
+class TestCreatedPages:
+    """Test the mock client's record of created pages."""
+    
+    def test_keeps_newest_pages(self):
+        """Test the record is capped and drops the oldest pages."""
+        client = MockConfluenceClient()
+        for i in range(MAX_CREATED_PAGES + 5):
+            client.create_page("DEMAND", f"Page {i}", "content")
+        
+        pages = client.get_created_pages()
+        assert len(pages) == MAX_CREATED_PAGES
+        assert pages[0]["data"]["title"] == "Page 5"
+        assert pages[-1]["data"]["title"] == f"Page {MAX_CREATED_PAGES + 4}"
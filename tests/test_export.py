@@ -0,0 +1,28 @@
+"""Tests for demand export."""
+import json
+from collections import deque
+from datetime import datetime
+
+from utils.export import export_to_json, export_to_json_bytes
+
+
+class TestExportToJson:
+    """Test JSON export."""
+
+    def test_bytes_round_trip(self):
+        """Test the byte export parses back with datetimes and deques converted."""
+        created = datetime(2025, 1, 2, 3, 4, 5)
+        data = {"demand_id": "LOG-1", "created_at": created, "audit_log": deque([{"action": "Saved"}])}
+
+        parsed = json.loads(export_to_json_bytes(data))
+
+        assert parsed == {
+            "demand_id": "LOG-1",
+            "created_at": created.isoformat(),
+            "audit_log": [{"action": "Saved"}],
+        }
+
+    def test_str_matches_bytes(self):
+        """Test the str export is the decoded byte export."""
+        data = {"title": "Café", "count": 3}
+        assert export_to_json(data) == export_to_json_bytes(data).decode("utf-8")
@@ -1,6 +1,10 @@
 """Tests for JIRA integration."""
+import json
+import time
 import pytest
-from integrations.jira_client import MockJiraClient
+import requests
+from integrations.jira_client import ItemKind, MockJiraClient
+from integrations.jira_test_client import GeneratedTestCase, TestCaseGenerator
 
 
 class TestMockJiraClient:
@@ -60,6 +64,37 @@ class TestMockJiraClient:
         assert any(item["type"] == "epic" for item in items)
         assert any(item["type"] == "story" for item in items)
     
+    def test_created_items_keep_dict_shape(self, client):
+        """Test epics, stories and links are returned in their dictionary shapes."""
+        epic = client.create_epic({"summary": "Epic 1"})
+        story = client.create_story({"summary": "Story 1"})
+        client.link_story_to_epic(story["key"], epic["key"])
+        
+        items = client.get_created_items()
+        
+        assert items[0] == {"type": "epic", "data": epic, "payload": {"summary": "Epic 1"}}
+        assert items[1]["data"] == story
+        assert items[2] == {"type": "link", "story": story["key"], "epic": epic["key"]}
+    
+    def test_iter_created_items(self, client):
+        """Test the iterator yields the same dictionaries without building a list."""
+        client.create_epic({"summary": "Epic 1"})
+        client.create_story({"summary": "Story 1"})
+        
+        items = client.iter_created_items()
+        
+        assert not isinstance(items, list)
+        assert list(items) == client.get_created_items()
+    
+    def test_created_item_kinds(self, client):
+        """Test items record an ItemKind while the dictionaries carry plain strings."""
+        epic = client.create_epic({"summary": "Epic 1"})
+        story = client.create_story({"summary": "Story 1"})
+        client.link_story_to_epic(story["key"], epic["key"])
+        
+        assert [item.kind for item in client.created_items] == [ItemKind.EPIC, ItemKind.STORY, ItemKind.LINK]
+        assert all(type(item["type"]) is str for item in client.get_created_items())
+    
     def test_get_api_payload_preview(self, client):
         """Test API payload preview generation."""
         epic_data = {
@@ -76,6 +111,28 @@ class TestMockJiraClient:
         assert "project" in payload
         assert "TEST" in payload
     
+    @pytest.mark.parametrize("epic_data", [
+        {},
+        {"summary": "Quote \" and \\ slash", "description": "Line 1\nLine 2", "labels": ["a", "b"]},
+        {"summary": "Æblegrød", "labels": [], "priority": "High", "epic_name": "__labels__"},
+    ])
+    def test_payload_preview_matches_full_dump(self, client, epic_data):
+        """Test the template-based preview equals serializing the whole payload."""
+        from utils import json_utils
+        
+        expected = json_utils.dumps({
+            "fields": {
+                "project": {"key": "LOG"},
+                "summary": epic_data.get("summary", ""),
+                "description": epic_data.get("description", ""),
+                "issuetype": {"name": "Epic"},
+                "customfield_10011": epic_data.get("epic_name", ""),
+                "labels": epic_data.get("labels", []),
+                "priority": {"name": epic_data.get("priority", "Medium")}
+            }
+        }, indent=True)
+        assert client.get_api_payload_preview(epic_data) == expected
+    
     def test_multiple_epics_unique_ids(self, client):
         """Test that multiple epics get unique IDs."""
         result1 = client.create_epic({"summary": "Epic 1"})
@@ -83,3 +140,463 @@ class TestMockJiraClient:
         
         assert result1["key"] != result2["key"]
         assert result1["id"] != result2["id"]
+
+
+class TestRealJiraClient:
+    """Test RealJiraClient setup."""
+    
+    def test_requires_requests(self, monkeypatch):
+        """Test a missing requests package is reported when the client is built."""
+        from integrations import jira_client
+        
+        monkeypatch.setattr(jira_client, "REQUESTS_AVAILABLE", False)
+        with pytest.raises(ImportError):
+            jira_client.RealJiraClient()
+
+
+class TestTimeoutHTTPAdapter:
+    """Test the default request timeout of the JIRA test client."""
+    
+    def test_default_applied_only_without_timeout(self, monkeypatch):
+        """Test requests without a timeout get the default and explicit ones are kept."""
+        from requests.adapters import HTTPAdapter
+        from integrations.jira_test_client import DEFAULT_TIMEOUT, TimeoutHTTPAdapter
+        
+        seen = []
+        monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, **kwargs: seen.append(kwargs["timeout"]))
+        
+        adapter = TimeoutHTTPAdapter()
+        adapter.send(None, timeout=None)
+        adapter.send(None, timeout=5)
+        assert seen == [DEFAULT_TIMEOUT, 5]
+
+
+class TestIterIssues:
+    """Test paged issue search in the JIRA test client."""
+    
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Client searching 7 fake issues, served at most 3 per page."""
+        from integrations.jira_test_client import JiraClient
+        
+        client = JiraClient("https://jira.example.com", "token", "qa@example.com")
+        client.pages = []
+        
+        class Response:
+            def __init__(self, body):
+                self.body = body
+            
+            def raise_for_status(self):
+                pass
+            
+            def json(self):
+                return self.body
+        
+        def get(url, params):
+            client.pages.append((params["startAt"], params["maxResults"]))
+            start = params["startAt"]
+            end = min(start + min(params["maxResults"], 3), 7)
+            return Response({"total": 7, "issues": [{"key": f"PROJ-{i}"} for i in range(start, end)]})
+        
+        monkeypatch.setattr(client.session, "get", get)
+        return client
+    
+    def test_pages_through_all_results(self, client):
+        """Test every issue is yielded once when the server caps the page size."""
+        keys = [issue["key"] for issue in client.iter_issues("project = PROJ")]
+        
+        assert keys == [f"PROJ-{i}" for i in range(7)]
+        assert client.pages == [(0, 500), (3, 500), (6, 500)]
+    
+    def test_stops_at_max_results(self, client):
+        """Test no more than max_results issues are requested or returned."""
+        issues = client.search_issues("project = PROJ", max_results=4)
+        
+        assert len(issues) == 4
+        assert client.pages == [(0, 4), (3, 1)]
+
+
+class TestBulkCreateTestCases:
+    """Test chunked bulk creation in the JIRA test client."""
+    
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Client whose bulk create endpoint is replaced by a local fake."""
+        from integrations.jira_test_client import JiraClient
+        
+        client = JiraClient("https://jira.example.com", "token", "qa@example.com")
+        client.requests = []
+        
+        class Response:
+            def __init__(self, status_code, body):
+                self.status_code = status_code
+                self.body = body
+            
+            def json(self):
+                return self.body
+            
+            def raise_for_status(self):
+                if self.status_code >= 400:
+                    raise requests.exceptions.HTTPError(str(self.status_code))
+        
+        def post(url, data):
+            assert url.endswith("/rest/api/3/issue/bulk")
+            updates = json.loads(data)["issueUpdates"]
+            client.requests.append(len(updates))
+            issues, errors = [], []
+            for idx, update in enumerate(updates):
+                summary = update["fields"]["summary"]
+                if summary.startswith("bad"):
+                    errors.append({
+                        "status": 400,
+                        "failedElementNumber": idx,
+                        "elementErrors": {"errorMessages": [], "errors": {"summary": "rejected"}}
+                    })
+                else:
+                    issues.append({"key": f"PROJ-{summary}", "id": summary})
+            return Response(201 if issues else 400, {"issues": issues, "errors": errors})
+        
+        monkeypatch.setattr(client.session, "post", post)
+        return client
+    
+    def test_results_keep_input_order(self, client):
+        """Test created items come back in the order they were submitted."""
+        cases = [{"summary": str(i)} for i in range(120)]
+        result = client.bulk_create_test_cases("PROJ", cases, max_workers=4)
+        
+        assert result["created"] == 120
+        assert [item["key"] for item in result["created_items"]] == [f"PROJ-{i}" for i in range(120)]
+    
+    def test_sent_in_chunks_of_fifty(self, client):
+        """Test one request is made per 50 test cases."""
+        client.bulk_create_test_cases("PROJ", [{"summary": str(i)} for i in range(120)])
+        assert sorted(client.requests) == [20, 50, 50]
+    
+    def test_failures_reported(self, client):
+        """Test failed creates are listed with their summary."""
+        result = client.bulk_create_test_cases(
+            "PROJ", [{"summary": "ok"}, {"summary": "bad one"}, {"summary": "fine"}]
+        )
+        
+        assert result["total"] == 3
+        assert [item["key"] for item in result["created_items"]] == ["PROJ-ok", "PROJ-fine"]
+        assert result["failed_items"] == [{"summary": "bad one", "error": "summary: rejected"}]
+    
+    def test_all_rejected(self, client):
+        """Test a 400 response with per-issue errors is reported per test case."""
+        result = client.bulk_create_test_cases("PROJ", [{"summary": "bad 1"}, {"summary": "bad 2"}])
+        assert result["failed"] == 2
+    
+    def test_request_failure_fails_chunk(self, client, monkeypatch):
+        """Test a failed request marks every test case in its chunk as failed."""
+        def post(url, data):
+            raise requests.exceptions.ConnectionError("down")
+        
+        monkeypatch.setattr(client.session, "post", post)
+        result = client.bulk_create_test_cases("PROJ", [{"summary": "1"}, {"summary": "2"}])
+        
+        assert result["failed_items"] == [{"summary": "1", "error": "down"}, {"summary": "2", "error": "down"}]
+    
+    def test_empty_list(self, client):
+        """Test an empty upload creates nothing."""
+        assert client.bulk_create_test_cases("PROJ", [])["total"] == 0
+        assert client.requests == []
+    
+    def test_progress_reported_per_chunk(self, client):
+        """Test the progress callback sees every completed chunk."""
+        calls = []
+        client.bulk_create_test_cases(
+            "PROJ", [{"summary": str(i)} for i in range(120)],
+            progress_callback=lambda done, total: calls.append((done, total))
+        )
+        
+        assert len(calls) == 3
+        assert calls[-1] == (120, 120)
+
+
+class TestCreateTestPlan:
+    """Test linking test cases to a new test plan epic."""
+    
+    def test_links_every_test_case(self, monkeypatch):
+        """Test each test case is linked and only successful links are counted."""
+        from integrations.jira_test_client import JiraClient
+        
+        client = JiraClient("https://jira.example.com", "token", "qa@example.com")
+        
+        class Response:
+            def raise_for_status(self):
+                pass
+            
+            def json(self):
+                return {"key": "PROJ-1", "id": "1"}
+        
+        linked = []
+        monkeypatch.setattr(client.session, "post", lambda url, data: Response())
+        monkeypatch.setattr(
+            client, "link_issue_to_epic",
+            lambda key, epic: linked.append((key, epic)) or key != "PROJ-4"
+        )
+        
+        result = client.create_test_plan("PROJ", "Plan", "Desc", test_cases=["PROJ-2", "PROJ-3", "PROJ-4"])
+        
+        assert result["success"] is True
+        assert sorted(linked) == [("PROJ-2", "PROJ-1"), ("PROJ-3", "PROJ-1"), ("PROJ-4", "PROJ-1")]
+        assert result["linked_tests"] == 2
+
+
+class TestRetryPolicy:
+    """Test which JIRA responses are retried."""
+    
+    @pytest.fixture
+    def sends(self, monkeypatch):
+        """Record each request sent over the wire and answer with a queued status."""
+        import io
+        import urllib3
+        from urllib3.response import HTTPResponse
+        
+        sent, statuses = [], []
+        
+        def make_request(self, conn, method, url, *args, **kwargs):
+            sent.append(method)
+            return HTTPResponse(
+                body=io.BytesIO(b"{}"), status=statuses.pop(0) if statuses else 504,
+                headers={}, preload_content=False, request_method=method
+            )
+        
+        monkeypatch.setattr(urllib3.connectionpool.HTTPConnectionPool, "_make_request", make_request)
+        monkeypatch.setattr("urllib3.util.retry.time.sleep", lambda seconds: None)
+        return sent, statuses
+    
+    def test_post_not_retried_on_504(self, sends):
+        """Test a 504 on issue creation is sent once, since JIRA may have created the issue."""
+        from integrations.jira_test_client import JiraClient
+        
+        sent, _ = sends
+        client = JiraClient("https://retry-post.example.com", "token", "qa@example.com")
+        response = client.session.post("https://retry-post.example.com/rest/api/3/issue", data=b"{}")
+        
+        assert response.status_code == 504
+        assert sent == ["POST"]
+    
+    def test_post_retried_on_503(self, sends):
+        """Test a 503 (rejected before processing) is retried for POST."""
+        from integrations.jira_test_client import JiraClient
+        
+        sent, statuses = sends
+        statuses.extend([503, 201])
+        client = JiraClient("https://retry-503.example.com", "token", "qa@example.com")
+        response = client.session.post("https://retry-503.example.com/rest/api/3/issue", data=b"{}")
+        
+        assert response.status_code == 201
+        assert sent == ["POST", "POST"]
+    
+    def test_get_retried_on_504(self, sends):
+        """Test reads are still retried on gateway errors."""
+        from integrations.jira_test_client import JiraClient
+        
+        sent, statuses = sends
+        statuses.extend([504, 200])
+        client = JiraClient("https://retry-get.example.com", "token", "qa@example.com")
+        response = client.session.get("https://retry-get.example.com/rest/api/3/project")
+        
+        assert response.status_code == 200
+        assert sent == ["GET", "GET"]
+    
+    def test_real_client_uses_same_policy(self, monkeypatch, sends):
+        """Test the epic/story client does not retry a 504 on create either."""
+        from integrations import jira_client
+        
+        monkeypatch.setenv("JIRA_URL", "https://retry-real.example.com")
+        monkeypatch.setenv("JIRA_EMAIL", "qa@example.com")
+        monkeypatch.setenv("JIRA_API_TOKEN", "token")
+        sent, _ = sends
+        
+        result = jira_client.RealJiraClient().create_epic({"summary": "Epic"})
+        
+        assert result["created"] is False
+        assert sent == ["POST"]
+
+
+class TestBulkhead:
+    """Test the process-wide JIRA request limit."""
+    
+    def test_slot_released_while_waiting_to_retry(self, monkeypatch):
+        """Test a Retry-After wait does not hold a bulkhead slot."""
+        import io
+        import threading
+        import urllib3
+        from requests.adapters import HTTPAdapter
+        from urllib3.response import HTTPResponse
+        from integrations.circuit_breaker import BreakerSession, CircuitBreaker
+        from integrations.jira_retry import jira_retry
+        
+        statuses = [503, 200]
+        monkeypatch.setattr(
+            urllib3.connectionpool.HTTPConnectionPool, "_make_request",
+            lambda self, conn, method, url, *args, **kwargs: HTTPResponse(
+                body=io.BytesIO(b"{}"), status=statuses.pop(0), headers={"Retry-After": "60"},
+                preload_content=False, request_method=method
+            )
+        )
+        bulkhead = threading.BoundedSemaphore(1)
+        free_while_sleeping = []
+        
+        def sleep(seconds):
+            free_while_sleeping.append(bulkhead.acquire(blocking=False))
+            bulkhead.release()
+        
+        monkeypatch.setattr("urllib3.util.retry.time.sleep", sleep)
+        session = BreakerSession(CircuitBreaker(), bulkhead)
+        session.mount("https://", HTTPAdapter(max_retries=jira_retry(bulkhead)))
+        
+        assert session.get("https://jira.example.com/rest/api/3/project").status_code == 200
+        assert free_while_sleeping == [True]
+        # The slot is back once the request returns
+        assert bulkhead.acquire(blocking=False)
+    
+    @pytest.mark.parametrize("value, expected", [("4", 4), ("0", 1), ("-3", 1), ("many", 8)])
+    def test_max_concurrency_from_env(self, monkeypatch, value, expected):
+        """Test JIRA_MAX_CONCURRENCY is at least 1 and falls back to 8 when invalid."""
+        from integrations.jira_test_client import _max_concurrency
+        
+        monkeypatch.setenv("JIRA_MAX_CONCURRENCY", value)
+        assert _max_concurrency() == expected
+
+
+class TestRequestBody:
+    """Test request bodies sent by the JIRA test client."""
+    
+    def test_body_sent_as_utf8_json(self, monkeypatch):
+        """Test the pre-serialized body reaches the wire as JSON with its content type."""
+        from requests.adapters import HTTPAdapter
+        from integrations.jira_test_client import JiraClient
+        
+        sent = []
+        
+        def send(self, request, **kwargs):
+            sent.append(request)
+            response = requests.Response()
+            response.status_code = 201
+            response._content = b'{"key": "PROJ-1", "id": "1"}'
+            return response
+        
+        monkeypatch.setattr(HTTPAdapter, "send", send)
+        client = JiraClient("https://jira.example.com", "token", "qa@example.com")
+        result = client.create_test_case("PROJ", "Zahlung über 100 €", "Steps")
+        
+        assert result["key"] == "PROJ-1"
+        assert sent[0].headers["Content-Type"] == "application/json"
+        assert json.loads(sent[0].body.decode("utf-8"))["fields"]["summary"] == "Zahlung über 100 €"
+
+
+class TestMetadataCache:
+    """Test caching of projects and issue types in the JIRA test client."""
+    
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Client whose GET requests are counted and answered locally."""
+        from integrations.jira_test_client import JiraClient
+        
+        client = JiraClient("https://jira.example.com", "token", "qa@example.com")
+        client.gets = []
+        
+        class Response:
+            def __init__(self, url):
+                self.url = url
+            
+            def raise_for_status(self):
+                if "BROKEN" in self.url:
+                    raise requests.exceptions.HTTPError("500")
+            
+            def json(self):
+                if self.url.endswith("/project"):
+                    return [{"key": "PROJ", "name": "Project", "id": "1"}]
+                return {"issueTypes": [{"name": "Task"}]}
+        
+        def get(url):
+            client.gets.append(url)
+            return Response(url)
+        
+        monkeypatch.setattr(client.session, "get", get)
+        return client
+    
+    def test_projects_fetched_once(self, client):
+        """Test repeated calls reuse the cached project list."""
+        assert client.get_projects() == client.get_projects()
+        assert len(client.gets) == 1
+    
+    def test_issue_types_cached_per_project(self, client):
+        """Test issue types are cached separately for each project."""
+        client.get_issue_types("PROJ")
+        client.get_issue_types("PROJ")
+        client.get_issue_types("OTHER")
+        assert len(client.gets) == 2
+    
+    def test_expired_and_invalidated_entries_refetched(self, client, monkeypatch):
+        """Test entries are fetched again after the TTL or an invalidation."""
+        client.get_projects()
+        client.invalidate_metadata_cache()
+        client.get_projects()
+        
+        now = time.monotonic() + 301
+        monkeypatch.setattr("integrations.jira_test_client.time.monotonic", lambda: now)
+        client.get_projects()
+        assert len(client.gets) == 3
+    
+    def test_failures_not_cached(self, client):
+        """Test an error response is retried on the next call."""
+        assert client.get_issue_types("BROKEN") == []
+        client.get_issue_types("BROKEN")
+        assert len(client.gets) == 2
+
+
+class TestGeneratedTestCase:
+    """Test parsing AI output into immutable test cases."""
+    
+    def test_parse_returns_hashable_tuple(self):
+        """Test parsed test cases are frozen and the result can be hashed."""
+        response = "Test Case 1: Login\nOpen the page\nTest Case 2: Logout\nClick logout"
+        cases = TestCaseGenerator._parse_test_cases(response, "Manual")
+        
+        assert [case.summary for case in cases] == ["Test Case 1: Login", "Test Case 2: Logout"]
+        assert cases[0].description == "Open the page\n"
+        assert cases[0].labels == ("manual", "generated-by-ai")
+        assert hash(cases) == hash(TestCaseGenerator._parse_test_cases(response, "Manual"))
+    
+    def test_markers_case_insensitive(self):
+        """Test every marker starts a new test case regardless of case."""
+        response = "TEST CASE A\nstep\nTC-2 B\n### Test C\nintro text"
+        cases = TestCaseGenerator._parse_test_cases(response, "Automated")
+        
+        assert [case.summary for case in cases] == ["TEST CASE A", "TC-2 B", "### Test C"]
+        assert cases[2].description == "intro text\n"
+    
+    def test_to_dict_copies_labels(self):
+        """Test the upload dict gets its own labels list."""
+        case = GeneratedTestCase.from_dict({"summary": "Login", "labels": ["manual"]})
+        data = case.to_dict()
+        data["labels"].append("test-type-manual")
+        
+        assert case.labels == ("manual",)
+        assert data["test_type"] == "Manual"
+
+
+class TestJiraPayloads:
+    """Test the shared create-issue payload builder."""
+    
+    def test_description_sent_as_adf(self):
+        """Test the description is wrapped in a single ADF paragraph."""
+        from integrations.jira_payloads import build_issue_payload
+        
+        fields = build_issue_payload("PROJ", "Title", "Body", "Story")["fields"]
+        
+        assert fields["issuetype"] == {"name": "Story"}
+        assert fields["description"]["content"][0]["content"][0]["text"] == "Body"
+    
+    def test_extra_fields_merged(self):
+        """Test extra fields are added alongside the standard ones."""
+        from integrations.jira_payloads import build_issue_payload
+        
+        fields = build_issue_payload("PROJ", "Title", "Body", "Epic", {"labels": ["x"]})["fields"]
+        assert fields["labels"] == ["x"]
+        assert fields["project"] == {"key": "PROJ"}
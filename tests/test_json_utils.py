@@ -0,0 +1,42 @@
+"""Tests for JSON serialization helpers."""
+import json
+from datetime import datetime
+
+import pytest
+from utils import json_utils
+
+
+SAMPLE = {
+    "title": "Demand ü",
+    "values": [1, 2.5, None, True],
+    "timestamp": datetime(2025, 1, 2, 3, 4, 5),
+    1: "non-string key",
+}
+
+
+class TestDumps:
+    """Test serialization parity with the standard library."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_indented_matches_stdlib(self, monkeypatch, use_orjson):
+        """Test indented output matches json.dumps(indent=2, default=str)."""
+        if use_orjson and not json_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", use_orjson)
+
+        expected = json.dumps(SAMPLE, indent=2, default=str, ensure_ascii=False)
+        assert json_utils.dumps(SAMPLE, indent=True) == expected
+
+    def test_dumps_bytes_is_utf8(self):
+        """Test bytes output decodes to the string output."""
+        assert json_utils.dumps_bytes(SAMPLE).decode("utf-8") == json_utils.dumps(SAMPLE)
+
+    def test_round_trip(self):
+        """Test loads reverses dumps."""
+        data = {"a": [1, 2, {"b": "c"}]}
+        assert json_utils.loads(json_utils.dumps(data)) == data
+
+    def test_invalid_json_raises_decode_error(self):
+        """Test invalid input raises the stdlib decode error type."""
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads("{not json")
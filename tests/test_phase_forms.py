@@ -0,0 +1,47 @@
+"""Tests for phase form schemas."""
+import pytest
+from components.phase_forms import PHASE_FORMS
+from models.demand import (
+    IdeationTab, RequirementsTab, AssessmentTab, DesignTab, BuildTab,
+    ValidationTab, DeploymentTab, ImplementationTab, ClosingTab
+)
+
+
+PHASE_MODELS = {
+    "ideation": IdeationTab,
+    "requirements": RequirementsTab,
+    "assessment": AssessmentTab,
+    "design": DesignTab,
+    "build": BuildTab,
+    "validation": ValidationTab,
+    "deployment": DeploymentTab,
+    "implementation": ImplementationTab,
+    "closing": ClosingTab,
+}
+
+
+class TestPhaseForms:
+    """Test the declarative phase form definitions."""
+
+    def test_all_phases_defined(self):
+        """Test every phase has a form."""
+        assert set(PHASE_FORMS) == set(PHASE_MODELS)
+
+    @pytest.mark.parametrize("phase", sorted(PHASE_MODELS))
+    def test_fields_exist_on_model(self, phase):
+        """Test phase-dict fields map to fields on the phase model."""
+        model_fields = PHASE_MODELS[phase].model_fields
+        for spec in PHASE_FORMS[phase].fields():
+            if not spec.top_level:
+                assert spec.name in model_fields, f"{phase}.{spec.name}"
+
+    @pytest.mark.parametrize("phase", sorted(PHASE_MODELS))
+    def test_field_names_unique(self, phase):
+        """Test no field is rendered twice in one form."""
+        names = [spec.name for spec in PHASE_FORMS[phase].fields()]
+        assert len(names) == len(set(names))
+
+    def test_form_keys_unique(self):
+        """Test Streamlit form keys do not collide."""
+        keys = [form.form_key for form in PHASE_FORMS.values()]
+        assert len(keys) == len(set(keys))
@@ -0,0 +1,66 @@
+"""Tests for retention utilities."""
+from collections import deque
+from datetime import datetime, timedelta
+
+import pytest
+from utils.retention import bounded, tail, prune_audit_log
+from utils.progress import is_tab_complete
+
+
+class TestBounded:
+    """Test ring buffer creation."""
+
+    def test_keeps_newest_entries(self):
+        """Test only the newest maxlen entries are kept."""
+        buffer = bounded(range(10), maxlen=3)
+        assert list(buffer) == [7, 8, 9]
+
+        buffer.append(10)
+        assert list(buffer) == [8, 9, 10]
+
+    def test_none_gives_empty_buffer(self):
+        """Test None is treated as empty."""
+        assert len(bounded(None, maxlen=5)) == 0
+
+
+class TestTail:
+    """Test tail slicing for lists and deques."""
+
+    @pytest.mark.parametrize("container", [list, deque])
+    def test_tail(self, container):
+        """Test tail matches list slicing."""
+        items = container(range(10))
+        assert tail(items, 3) == [7, 8, 9]
+        assert tail(items, 50) == list(range(10))
+
+
+class TestPruneAuditLog:
+    """Test time-based audit pruning."""
+
+    def _entry(self, days_ago):
+        return {"timestamp": (datetime.now() - timedelta(days=days_ago)).isoformat()}
+
+    def test_removes_expired_entries(self):
+        """Test entries older than the window are dropped from the left."""
+        log = deque([self._entry(40), self._entry(31), self._entry(5), self._entry(0)])
+        removed = prune_audit_log(log, retention_days=30)
+
+        assert removed == 2
+        assert len(log) == 2
+
+    def test_zero_keeps_everything(self):
+        """Test retention of 0 disables pruning."""
+        log = deque([self._entry(400)])
+        assert prune_audit_log(log, retention_days=0) == 0
+        assert len(log) == 1
+
+    def test_reads_env(self, monkeypatch):
+        """Test retention window defaults to the environment variable."""
+        monkeypatch.setenv("AUDIT_TRAIL_RETENTION_DAYS", "1")
+        log = deque([self._entry(2), self._entry(0)])
+        assert prune_audit_log(log) == 1
+
+
+def test_deque_counts_as_filled_field():
+    """Test progress treats ring buffers like lists."""
+    assert is_tab_complete({"tasks": deque(["task"])}, threshold=1.0) is True
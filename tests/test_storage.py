@@ -0,0 +1,94 @@
+"""Tests for demand storage."""
+import pytest
+from utils.storage import DemandStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Storage backed by a temporary directory."""
+    return DemandStorage(str(tmp_path / "data"))
+
+
+def _demand(demand_id, **extra):
+    data = {
+        "demand_id": demand_id,
+        "status": "Draft",
+        "progress_percentage": 0,
+        "ideation": {},
+        "requirements": {"stakeholders": []},
+        "validation": {},
+        "assessment": {},
+    }
+    data.update(extra)
+    return data
+
+
+class TestDemandStorage:
+    """Test saving and loading demands."""
+
+    def test_save_and_load_round_trip(self, storage):
+        """Test a saved demand loads back unchanged."""
+        demand = _demand("LOG-1", status="In Progress")
+        assert storage.save_demand(demand) is True
+        assert storage.load_demand("LOG-1") == demand
+
+    def test_summary_replaces_existing_entry(self, storage):
+        """Test saving twice keeps one index entry."""
+        storage.save_demand(_demand("LOG-1"))
+        storage.save_demand(_demand("LOG-1", status="Completed"))
+
+        summary = storage.get_all_demands_summary()
+        assert len(summary) == 1
+        assert summary[0]["status"] == "Completed"
+
+    def test_summary_includes_demand_name(self, storage):
+        """Test the index carries the name and number shown in the overview."""
+        storage.save_demand(_demand("LOG-1", demand_name="Checkout revamp", demand_number="D-42"))
+
+        summary = storage.get_all_demands_summary()[0]
+        assert summary["demand_name"] == "Checkout revamp"
+        assert summary["demand_number"] == "D-42"
+
+    def test_load_missing_demand(self, storage):
+        """Test loading an unknown ID returns None."""
+        assert storage.load_demand("LOG-MISSING") is None
+
+
+class TestIndexSignature:
+    """Test the index change signature."""
+
+    def test_changes_after_save(self, storage):
+        """Test saving a demand changes the signature."""
+        before = storage.index_signature()
+        storage.save_demand(_demand("LOG-1"))
+        assert storage.index_signature() != before
+
+    def test_stable_without_writes(self, storage):
+        """Test reads do not change the signature."""
+        storage.save_demand(_demand("LOG-1"))
+        before = storage.index_signature()
+        storage.get_all_demands_summary()
+        assert storage.index_signature() == before
+
+
+class TestIndexCache:
+    """Test the parsed index cache."""
+
+    def test_reuses_parsed_index(self, storage, monkeypatch):
+        """Test an unchanged index file is not parsed again."""
+        storage.save_demand(_demand("LOG-1"))
+        storage.get_all_demands_summary()
+
+        def fail(data):
+            raise AssertionError("index parsed again")
+
+        monkeypatch.setattr("utils.storage.json_utils.loads", fail)
+        assert [d["demand_id"] for d in storage.get_all_demands_summary()] == ["LOG-1"]
+
+    def test_sees_external_writes(self, storage, tmp_path):
+        """Test a write from another storage instance is picked up."""
+        storage.get_all_demands_summary()
+        other = DemandStorage(str(tmp_path / "data"))
+        other.save_demand(_demand("LOG-2", status="Completed"))
+
+        assert [d["demand_id"] for d in storage.get_all_demands_summary()] == ["LOG-2"]
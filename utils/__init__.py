@@ -1,6 +1,6 @@
 """Utility modules for DemandForge."""
 from .progress import calculate_progress, is_tab_complete
-from .export import export_to_json, export_to_markdown, generate_pdf_content
+from .export import export_to_json, export_to_json_bytes, export_to_markdown, generate_pdf_content
 from .validation import sanitize_html, validate_session_ttl
 from .logging_config import setup_logging, get_logger
 
@@ -8,6 +8,7 @@ __all__ = [
     "calculate_progress",
     "is_tab_complete",
     "export_to_json",
+    "export_to_json_bytes",
     "export_to_markdown",
     "generate_pdf_content",
     "sanitize_html",
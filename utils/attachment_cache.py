@@ -0,0 +1,64 @@
+"""
+Attachment Cache
+Reuse extracted attachment text across reruns while the attachments are unchanged.
+"""
+
+import os
+from typing import Dict, List, Tuple
+
+import streamlit as st
+
+
+def attachment_signature(files: List[Dict], urls: List[Dict]) -> Tuple[tuple, tuple]:
+    """
+    Build a hashable cache key for a tab's attachments.
+
+    Files are identified by path plus modification time and size, so a
+    replaced file is read again without hashing its bytes on every call.
+
+    Args:
+        files: Attachment file metadata dicts (file_path, filename)
+        urls: Attachment URL metadata dicts (url, title)
+
+    Returns:
+        Tuple of (file signature, URL signature)
+    """
+    file_sig = []
+    for meta in files:
+        path = meta.get('file_path')
+        try:
+            stat = os.stat(path)
+            mtime, size = stat.st_mtime_ns, stat.st_size
+        except (OSError, TypeError):
+            mtime, size = None, None
+        file_sig.append((path, meta.get('filename', 'Unknown'), mtime, size))
+
+    url_sig = tuple((meta.get('url'), meta.get('title', 'Unknown')) for meta in urls)
+    return tuple(file_sig), url_sig
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=64)
+def _cached_content(file_sig: tuple, url_sig: tuple) -> str:
+    """Extract attachment text for a signature."""
+    # Imported here so sessions without attachments never load the document parsers
+    from utils.document_reader import get_attachment_content
+
+    files = [{'file_path': path, 'filename': name} for path, name, _, _ in file_sig]
+    urls = [{'url': url, 'title': title} for url, title in url_sig]
+    return get_attachment_content(files, urls)
+
+
+def cached_attachment_content(files: List[Dict], urls: List[Dict]) -> str:
+    """
+    Extract text from attachments, reusing the result while they are unchanged.
+
+    Args:
+        files: Attachment file metadata dicts (file_path, filename)
+        urls: Attachment URL metadata dicts (url, title)
+
+    Returns:
+        Combined attachment text ("" when there are no attachments)
+    """
+    if not files and not urls:
+        return ""
+    return _cached_content(*attachment_signature(files, urls))
@@ -0,0 +1,61 @@
+"""
+Audit Hook
+Lets components record audit entries without importing the app entry point.
+"""
+
+from typing import Callable, Optional, Sequence
+
+AuditHandler = Callable[[str, Optional[str], Optional[str]], None]
+
+# Length limit of AuditLogEntry.action
+MAX_ACTION_LENGTH = 500
+
+# app.py registers its audit writer here at startup
+_handler: Optional[AuditHandler] = None
+
+
+def set_audit_handler(handler: Optional[AuditHandler]) -> None:
+    """
+    Register the function that writes audit entries.
+
+    A single slot is kept (not a list) because Streamlit re-executes
+    app.py on every rerun and would otherwise register it repeatedly.
+
+    Args:
+        handler: Callable taking (action, tab_name, field_name), or None to clear
+    """
+    global _handler
+    _handler = handler
+
+
+def audit(action: str, tab_name: Optional[str] = None, field_name: Optional[str] = None) -> None:
+    """
+    Record an audit entry through the registered handler.
+
+    Args:
+        action: Description of the action
+        tab_name: Phase the action belongs to
+        field_name: Field the action touched
+    """
+    if _handler is not None:
+        _handler(action, tab_name, field_name)
+
+
+def describe_changes(action: str, names: Sequence[str]) -> str:
+    """
+    Append the names of changed fields to an audit action.
+
+    field_name holds a single field (at most 100 characters), so lists of
+    changed fields go in the action text, cut to MAX_ACTION_LENGTH.
+
+    Args:
+        action: Description of the action
+        names: Changed field names (or other item names)
+
+    Returns:
+        Action text listing the names
+    """
+    text = f"{action}: {', '.join(names)}"
+    if len(text) <= MAX_ACTION_LENGTH:
+        return text
+    return text[:MAX_ACTION_LENGTH - 3] + "..."
@@ -0,0 +1,22 @@
+"""Background execution helpers for slow, blocking calls (AI agents, remote APIs)."""
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Global executor instance
+_executor = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get or create the shared background executor.
+
+    The executor lives at module level so it survives Streamlit script reruns
+    and is shared by all sessions in the server process.
+
+    Returns:
+        ThreadPoolExecutor for offloading blocking work
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="demandforge")
+    return _executor
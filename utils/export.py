@@ -1,8 +1,10 @@
 """Export utilities for demand data."""
-import json
+from collections import deque
 from typing import Dict, Any
 from datetime import datetime
 
+from utils import json_utils
+
 
 def export_to_json(demand_data: Dict[str, Any]) -> str:
     """
@@ -14,10 +16,23 @@ def export_to_json(demand_data: Dict[str, Any]) -> str:
     Returns:
         JSON string
     """
+    return export_to_json_bytes(demand_data).decode("utf-8")
+
+
+def export_to_json_bytes(demand_data: Dict[str, Any]) -> bytes:
+    """
+    Export demand data to UTF-8 encoded JSON, ready for a download button.
+    
+    Args:
+        demand_data: Complete demand data dictionary
+        
+    Returns:
+        JSON document as bytes
+    """
     # Create a serializable copy
     export_data = _prepare_for_export(demand_data)
     
-    return json.dumps(export_data, indent=2, default=str)
+    return json_utils.dumps_bytes(export_data, indent=True)
 
 
 def export_to_markdown(demand_data: Dict[str, Any]) -> str:
@@ -242,7 +257,7 @@ def _prepare_for_export(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     if isinstance(data, dict):
         return {k: _prepare_for_export(v) for k, v in data.items()}
-    elif isinstance(data, list):
+    elif isinstance(data, (list, deque)):
         return [_prepare_for_export(item) for item in data]
     elif isinstance(data, datetime):
         return data.isoformat()
@@ -0,0 +1,75 @@
+"""
+JSON serialization helpers.
+Uses orjson when installed and falls back to the standard library otherwise.
+Output matches json.dumps(obj, indent=2, default=str) in both cases, except
+that non-ASCII text is written as UTF-8 instead of \\u escapes.
+"""
+
+import json
+from collections import deque
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    # Datetimes go through default=str so timestamps look the same as with stdlib json
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _default(obj: Any) -> Any:
+    """Fallback serializer for objects JSON does not support natively."""
+    if isinstance(obj, deque):
+        return list(obj)
+    return str(obj)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=_default, option=options)
+    return dumps(obj, indent=indent).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as str
+    """
+    if ORJSON_AVAILABLE:
+        return dumps_bytes(obj, indent=indent).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2, default=_default, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), default=_default, ensure_ascii=False)
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,4 +1,5 @@
 """Progress calculation utilities for demand completion tracking."""
+from collections import deque
 from typing import Dict, Any, List
 
 
@@ -57,7 +58,7 @@ def is_tab_complete(tab_data: Dict[str, Any], threshold: float = 0.5) -> bool:
             continue
         elif isinstance(value, str) and len(value.strip()) > 0:
             filled_fields += 1
-        elif isinstance(value, (list, dict)) and len(value) > 0:
+        elif isinstance(value, (list, deque, dict)) and len(value) > 0:
             filled_fields += 1
         elif isinstance(value, (int, float)) and value != 0:
             filled_fields += 1
@@ -116,7 +117,7 @@ def _is_field_filled(value: Any) -> bool:
         return False
     elif isinstance(value, str):
         return len(value.strip()) > 0
-    elif isinstance(value, (list, dict)):
+    elif isinstance(value, (list, deque, dict)):
         return len(value) > 0
     elif isinstance(value, (int, float)):
         return value != 0
@@ -0,0 +1,72 @@
+"""
+Retention Utilities
+Bounded ring buffers for session data that grows with every user action.
+"""
+
+import os
+from collections import deque
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Iterable, List, Optional
+
+
+# Caps mirror the max_length limits on the Demand model fields
+MAX_BUILD_TASKS = 200
+MAX_BUG_LOG_ENTRIES = 100
+MAX_AUDIT_ENTRIES = 1000
+MAX_CHAT_MESSAGES = 500
+
+
+def bounded(items: Optional[Iterable[Any]], maxlen: int) -> deque:
+    """
+    Wrap items in a ring buffer that keeps only the newest maxlen entries.
+
+    Args:
+        items: Existing entries (list, deque or None)
+        maxlen: Maximum number of entries to keep
+
+    Returns:
+        deque holding the newest entries
+    """
+    return deque(items or (), maxlen=maxlen)
+
+
+def tail(items: Iterable[Any], count: int) -> List[Any]:
+    """
+    Return the last count entries of a list or deque as a list.
+
+    deque does not support slicing, so this is the drop-in for items[-count:].
+    """
+    if isinstance(items, list):
+        return items[-count:]
+    return list(islice(items, max(len(items) - count, 0), None))
+
+
+def prune_audit_log(audit_log: deque, retention_days: Optional[int] = None) -> int:
+    """
+    Drop audit entries older than the retention window.
+
+    Entries are appended in time order, so expired entries are always at
+    the left end and can be popped without scanning the whole log.
+
+    Args:
+        audit_log: Audit log ring buffer (oldest entry first)
+        retention_days: Days to keep (default: AUDIT_TRAIL_RETENTION_DAYS env, 0 = keep all)
+
+    Returns:
+        Number of entries removed
+    """
+    if retention_days is None:
+        retention_days = int(os.getenv("AUDIT_TRAIL_RETENTION_DAYS", "0"))
+
+    if retention_days <= 0:
+        return 0
+
+    # ISO-8601 timestamps compare correctly as strings
+    cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+    removed = 0
+    while audit_log and audit_log[0].get("timestamp", "") < cutoff:
+        audit_log.popleft()
+        removed += 1
+
+    return removed
@@ -1,10 +1,12 @@
 """Persistent storage for demands using JSON files."""
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+from utils import json_utils
+
 
 class DemandStorage:
     """Simple JSON-based storage for all demands."""
@@ -19,6 +21,8 @@ class DemandStorage:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
         self.index_file = self.storage_dir / "demands_index.json"
+        self.revision = 0
+        self._index_cache: Optional[Tuple[Tuple[str, int, int, int], List[Dict[str, Any]]]] = None
         
         # Create index if doesn't exist
         if not self.index_file.exists():
@@ -26,16 +30,46 @@ class DemandStorage:
     
     def _save_index(self, index: List[Dict[str, Any]]):
         """Save the demands index."""
-        with open(self.index_file, 'w') as f:
-            json.dump(index, f, indent=2, default=str)
+        with open(self.index_file, 'wb') as f:
+            f.write(json_utils.dumps_bytes(index, indent=True))
+        self.revision += 1
+        self._index_cache = (self.index_signature(), index)
+    
+    def index_signature(self) -> Tuple[str, int, int, int]:
+        """
+        Get a cheap signature that changes whenever the index changes.
+        
+        Combines this process's write revision with the index file's mtime and
+        size, so writes from other processes are picked up as well.
+        
+        Returns:
+            Tuple of (index path, revision, mtime in ns, size in bytes)
+        """
+        try:
+            stat = self.index_file.stat()
+            return (str(self.index_file), self.revision, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return (str(self.index_file), self.revision, 0, 0)
     
     def _load_index(self) -> List[Dict[str, Any]]:
-        """Load the demands index."""
+        """
+        Load the demands index, parsing the file only when it has changed.
+        
+        The parsed index is kept until index_signature() changes. Callers get a
+        new list but share the summary dicts, which must be treated as read-only.
+        """
+        signature = self.index_signature()
+        if self._index_cache is not None and self._index_cache[0] == signature:
+            return list(self._index_cache[1])
+        
         try:
-            with open(self.index_file, 'r') as f:
-                return json.load(f)
+            with open(self.index_file, 'rb') as f:
+                index = json_utils.loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError):
             return []
+        
+        self._index_cache = (signature, index)
+        return list(index)
     
     def save_demand(self, demand_data: Dict[str, Any]) -> bool:
         """
@@ -52,8 +86,8 @@ class DemandStorage:
             
             # Save full demand data to individual file
             demand_file = self.storage_dir / f"{demand_id}.json"
-            with open(demand_file, 'w') as f:
-                json.dump(demand_data, f, indent=2, default=str)
+            with open(demand_file, 'wb') as f:
+                f.write(json_utils.dumps_bytes(demand_data, indent=True))
             
             # Update index with summary info
             index = self._load_index()
@@ -64,6 +98,8 @@ class DemandStorage:
             # Add new entry
             summary = {
                 'demand_id': demand_id,
+                'demand_name': demand_data.get('demand_name', ''),
+                'demand_number': demand_data.get('demand_number', ''),
                 'title': demand_data.get('ideation', {}).get('title', 'Untitled'),
                 'description': demand_data.get('ideation', {}).get('description', ''),
                 'status': demand_data.get('status', 'Draft'),
@@ -98,8 +134,8 @@ class DemandStorage:
         try:
             demand_file = self.storage_dir / f"{demand_id}.json"
             if demand_file.exists():
-                with open(demand_file, 'r') as f:
-                    return json.load(f)
+                with open(demand_file, 'rb') as f:
+                    return json_utils.loads(f.read())
         except Exception as e:
             print(f"Error loading demand {demand_id}: {e}")
         
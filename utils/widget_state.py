@@ -0,0 +1,83 @@
+"""
+Widget State Utilities
+Bind phase form widgets to session_state keys instead of passing value= on every rerun.
+
+Widgets are keyed "<phase>.<field>" and seeded from the phase data dict the
+first time they render. Streamlit drops widget keys when a widget is not
+rendered, so switching tabs re-seeds from the saved phase data.
+"""
+
+from typing import Any, Callable, Iterable, Optional
+
+import streamlit as st
+
+
+PHASES = (
+    "ideation",
+    "requirements",
+    "assessment",
+    "design",
+    "build",
+    "validation",
+    "deployment",
+    "implementation",
+    "closing",
+)
+
+
+def widget_key(phase: str, field: str) -> str:
+    """Return the session_state key for a phase field widget."""
+    return f"{phase}.{field}"
+
+
+def seed_widget(key: str, value: Any) -> str:
+    """
+    Set a widget's initial value unless the widget already holds one.
+
+    Returns:
+        The key, for use as the widget's key= argument
+    """
+    if key not in st.session_state:
+        st.session_state[key] = value
+    return key
+
+
+def bind_widget(phase: str, field: str, default: Any = "", cast: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Key a widget to a phase field, seeding it from the phase data dict.
+
+    Args:
+        phase: Phase name (session_state attribute holding the phase dict)
+        field: Field name within the phase dict
+        default: Value used when the field is not set yet
+        cast: Optional type conversion for the stored value (e.g. float)
+
+    Returns:
+        The widget key
+    """
+    key = widget_key(phase, field)
+    if key not in st.session_state:
+        value = st.session_state[phase].get(field, default)
+        st.session_state[key] = cast(value) if cast else value
+    return key
+
+
+def reset_widget_state(phase: Optional[str] = None, fields: Optional[Iterable[str]] = None):
+    """
+    Forget bound widget values so they are re-seeded from the phase data.
+
+    Call after phase data changes outside its form (loading a demand,
+    AI quick actions). Must run before the affected widgets are rendered.
+
+    Args:
+        phase: Phase to reset (default: all phases)
+        fields: Fields to reset within the phase (default: all fields)
+    """
+    if fields is not None:
+        for field in fields:
+            st.session_state.pop(widget_key(phase, field), None)
+        return
+
+    prefixes = tuple(f"{p}." for p in ((phase,) if phase else PHASES))
+    for key in [k for k in st.session_state if isinstance(k, str) and k.startswith(prefixes)]:
+        del st.session_state[key]